@@ -5,7 +5,9 @@ import discord
 from discord.ext import commands
 from src.database import Database
 from src import taskService
+from src import discoveryService
 from src.services import service_manager  # Add this import
+from src.command_pipeline import cancel_pending
 import asyncio
 from pathlib import Path
 from typing import Optional
@@ -87,6 +89,7 @@ class BGABot:
                 logging.info(f"✅ Logged in as {self.bot.user}")
                 await self._load_extensions()
                 taskService.processGames.start(self.bot)
+                discoveryService.discoverTables.start(self.bot)
                 
                 counting_game = self.bot.get_cog('CountingGame')
                 if counting_game:
@@ -100,6 +103,7 @@ class BGABot:
         except Exception as e:
             logging.error(f"❌ Failed to start bot: {e}")
         finally:
+            cancel_pending()
             await service_manager.cleanup()
 
     def run(self) -> None:
@@ -1,13 +1,23 @@
+import asyncio
 import logging
+import re
 import sqlite3
 from discord.ext import commands
 from discord import app_commands
 import discord
 from . import webscraper
 from src.database import Database
+from src.database.bga_db import Game
 from . import utils
+from .command_pipeline import command_metrics, run_deferred
 from src.config import Config
 
+# Limits for /bga_track_many
+BULK_TRACK_MAX_TABLES = 25
+BULK_FETCH_CONCURRENCY = 4
+# Discord rejects messages longer than this
+MESSAGE_LIMIT = 2000
+
 
 class BGACommands(commands.Cog):
     """Commands for managing Board Game Arena integration."""
@@ -41,32 +51,127 @@ class BGACommands(commands.Cog):
     @app_commands.command(name="bga_track", description="Start tracking a BGA game")
     @app_commands.describe(url="The URL of the Board Game Arena table")
     async def bga_track(self, interaction: discord.Interaction, url: str):
-        try:
-            game_id = utils.extractGameId(url)
-            game_name, active_player_id = await webscraper.getGameInfo(url)
-
-            self.database.insert_game_data(game_id, url, game_name, active_player_id)
-
+        canonical_url = utils.canonicalizeTableUrl(url)
+        if canonical_url is None:
             await interaction.response.send_message(
-                f"Now tracking BGA game: {game_name} (ID: {game_id})"
-            )
-            await notify_turn(
-                self.bot, active_player_id, game_id,
-                self.database, self.notify_channel_id,
+                f"That doesn't look like a BGA table URL: {url}"
             )
+            return
 
-        except (TypeError, sqlite3.Error, RuntimeError) as e:
-            # TypeError: getGameInfo returned None and was unpacked into a tuple.
-            # RuntimeError: webscraper could not reach BGA.
-            logging.error(f"Error when tracking BGA game {url}: {e}")
-            await interaction.response.send_message(
-                f"Failed to track BGA game. Please verify the URL is correct: {url}"
-            )
-        except Exception:
-            logging.exception(f"Unexpected error tracking BGA game {url}")
+        game_id = int(utils.extractGameId(canonical_url))
+        failure_message = f"Failed to track BGA game. Please verify the URL is correct: {url}"
+        tracked = {}
+
+        async def track():
+            try:
+                existing = self.database.get_game_by_id(game_id)
+                if existing:
+                    return f"Already tracking BGA game: {existing.name} (ID: {game_id})"
+
+                game_name, active_player_id = await webscraper.getGameInfo(
+                    canonical_url, self.config.bga_base_url
+                )
+                self.database.insert_game_data(game_id, canonical_url, game_name, active_player_id)
+                tracked["active_player_id"] = active_player_id
+                return f"Now tracking BGA game: {game_name} (ID: {game_id})"
+            except (TypeError, sqlite3.Error, RuntimeError) as e:
+                # TypeError: getGameInfo returned None and was unpacked into a tuple.
+                # RuntimeError: webscraper could not reach BGA.
+                logging.error(f"Error when tracking BGA game {url}: {e}")
+                return failure_message
+
+        async def notify_new_game():
+            if "active_player_id" in tracked:
+                await notify_turn(
+                    self.bot, tracked["active_player_id"], game_id,
+                    self.database, self.notify_channel_id,
+                )
+
+        await run_deferred(
+            interaction, "bga_track", track,
+            error_message=failure_message, after=notify_new_game,
+        )
+
+    @app_commands.command(name="bga_track_many", description="Start tracking several BGA games at once")
+    @app_commands.describe(tables="Table URLs or IDs, separated by spaces, commas or new lines")
+    async def bga_track_many(self, interaction: discord.Interaction, tables: str):
+        refs = [ref for ref in re.split(r"[\s,]+", tables) if ref]
+        if not refs:
+            await interaction.response.send_message("Please provide at least one table URL or ID.")
+            return
+        if len(refs) > BULK_TRACK_MAX_TABLES:
             await interaction.response.send_message(
-                f"Failed to track BGA game. Please verify the URL is correct: {url}"
+                f"Please provide at most {BULK_TRACK_MAX_TABLES} tables at a time."
             )
+            return
+
+        new_games = []
+
+        async def track_many():
+            failures = []
+            wanted = {}
+            for ref in refs:
+                canonical_url = utils.canonicalizeTableReference(ref)
+                if canonical_url is None:
+                    failures.append(f"`{ref}`: not a BGA table URL or ID")
+                else:
+                    wanted.setdefault(int(utils.extractGameId(canonical_url)), canonical_url)
+
+            tracked_ids = {game.id for game in self.database.get_all_games()}
+            already = [game_id for game_id in wanted if game_id in tracked_ids]
+            to_fetch = {game_id: url for game_id, url in wanted.items() if game_id not in tracked_ids}
+
+            semaphore = asyncio.Semaphore(BULK_FETCH_CONCURRENCY)
+
+            async def fetch(game_id, canonical_url):
+                async with semaphore:
+                    info = await webscraper.getGameInfo(canonical_url, self.config.bga_base_url)
+                    return game_id, canonical_url, info
+
+            rows = []
+            for game_id, canonical_url, info in await asyncio.gather(
+                *(fetch(game_id, url) for game_id, url in to_fetch.items())
+            ):
+                if info is None:
+                    failures.append(f"`{game_id}`: could not read table from BGA")
+                    continue
+                game_name, active_player_id = info
+                rows.append((game_id, canonical_url, game_name, active_player_id))
+
+            inserted = set(self.database.insert_games(rows))
+            # Rows not inserted were tracked by someone else while we fetched them
+            already.extend(row[0] for row in rows if row[0] not in inserted)
+            new_games.extend(Game(*row) for row in rows if row[0] in inserted)
+
+            embed = discord.Embed(title="🎲 Bulk Tracking Results", color=discord.Color.blue())
+            if new_games:
+                embed.add_field(
+                    name=f"Now tracking ({len(new_games)})",
+                    value="\n".join(f"{game.name} (ID: {game.id})" for game in new_games)[:1024],
+                    inline=False
+                )
+            if already:
+                embed.add_field(
+                    name=f"Already tracked ({len(already)})",
+                    value=", ".join(str(game_id) for game_id in already)[:1024],
+                    inline=False
+                )
+            if failures:
+                embed.add_field(
+                    name=f"Failed ({len(failures)})",
+                    value="\n".join(failures)[:1024],
+                    inline=False
+                )
+            return embed
+
+        async def notify_new_games():
+            await notify_turns(self.bot, new_games, self.database, self.notify_channel_id)
+
+        await run_deferred(
+            interaction, "bga_track_many", track_many,
+            error_message="Failed to track BGA games. Please try again.",
+            after=notify_new_games,
+        )
 
     @app_commands.command(name="bga_link", description="Link your Discord account to your BGA ID")
     @app_commands.describe(bga_id="Your Board Game Arena username")
@@ -97,6 +202,26 @@ class BGACommands(commands.Cog):
             await interaction.response.send_message("An unexpected error occurred.")
             logging.exception("Unexpected error in bga_users")
 
+    @app_commands.command(name="bga_latency", description="Show slow command latency metrics (debug)")
+    async def bga_latency(self, interaction: discord.Interaction):
+        summary = command_metrics.summary()
+        if not summary:
+            await interaction.response.send_message("No deferred commands have run yet.", ephemeral=True)
+            return
+
+        embed = discord.Embed(title="⏱️ Command Latency", color=discord.Color.blue())
+        for name, stats in sorted(summary.items()):
+            embed.add_field(
+                name=f"/{name}",
+                value=(
+                    f"Calls: {stats['calls']} (timeouts: {stats['timeouts']}, errors: {stats['errors']})\n"
+                    f"Ack p50/p99: {stats['ack_p50'] * 1000:.0f}/{stats['ack_p99'] * 1000:.0f} ms\n"
+                    f"Total p50/p99: {stats['total_p50']:.2f}/{stats['total_p99']:.2f} s"
+                ),
+                inline=False
+            )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
     @app_commands.command(name="bga_games", description="Show all tracked BGA games")
     async def bga_games(self, interaction: discord.Interaction):
         """Shows all games currently being tracked"""
@@ -273,6 +398,59 @@ async def notify_turn(bot, bga_id, game_id, database: Database, notify_channel_i
             except Exception:
                 logging.exception(f"Unexpected error sending DM to {discord_id}")
 
+async def notify_turns(bot, games, database: Database, notify_channel_id: int):
+    """Notify players about several games at once.
+
+    Sends one channel message (split only if it exceeds Discord's length limit)
+    and one DM per player, instead of one of each per game.
+    """
+    games_by_user = {}
+    for game in games:
+        discord_id = database.get_discord_id_by_bga_id(game.activePlayerId)
+        if discord_id:
+            games_by_user.setdefault(int(discord_id), []).append(game)
+
+    channel_lines = []
+    for discord_id, user_games in games_by_user.items():
+        prefs = database.get_notification_preferences(discord_id)
+        if not prefs:
+            logging.error(f"No notification preferences found for user {discord_id}")
+            continue
+
+        links = ", ".join(f"[{game.name}]({game.url})" for game in user_games)
+        if prefs['channel_enabled']:
+            channel_lines.append(f"🎲 It's your turn <@{discord_id}> in {links}!")
+
+        if prefs['dm_enabled']:
+            try:
+                user = await bot.fetch_user(discord_id)
+                dm_channel = await user.create_dm()
+                await dm_channel.send(f"🎲 It's your turn in {links}!")
+            except discord.Forbidden:
+                logging.error(f"Could not send DM - user {discord_id} has DMs disabled")
+            except discord.HTTPException as e:
+                logging.error(f"Failed to send DM notification: {e}")
+
+    if not channel_lines:
+        return
+    channel = bot.get_channel(notify_channel_id)
+    if channel is None:
+        logging.error(f"Channel {notify_channel_id} not found or bot lacks access")
+        return
+
+    chunks = [channel_lines[0]]
+    for line in channel_lines[1:]:
+        if len(chunks[-1]) + len(line) + 1 > MESSAGE_LIMIT:
+            chunks.append(line)
+        else:
+            chunks[-1] += f"\n{line}"
+    try:
+        for chunk in chunks:
+            await channel.send(chunk)
+        logging.info(f"Batched turn notification sent for {len(games)} games")
+    except discord.HTTPException as e:
+        logging.error(f"Failed to send channel notification: {e}")
+
 async def setup(bot):
     cfg = Config.load()
     if not cfg.notify_channel_id:
@@ -0,0 +1,256 @@
+"""Local stand-in for Board Game Arena, and checks of the BGA scraping against it.
+
+Serves the few BGA pages the bot reads, from tables held in memory:
+
+* ``/table?table=<id>`` - the table overview canonical table URLs point at,
+  which has no game state
+* ``/1/<game code>?table=<id>`` - the game page, with the game name and the
+  active player (or the results, once the game has ended)
+* ``/table/table/tableinfos.html?id=<id>`` - one table's info, with its game code
+* ``/tablemanager/tablemanager/tableinfos.html?playerfilter=<id>&status=play``
+  - a player's in-progress tables
+
+Point the bot at it with BGA_BASE_URL, or run the checks::
+
+    python -m src.bga_standin
+    python -m src.bga_standin --serve --port 8080
+
+The checks track tables by bare ID and by URL and fail if the scraper reads
+the overview instead of the game page, looks a game code up more than once,
+or if insert_games reports tables it skipped as inserted. They then run
+table discovery for two linked players several times and fail unless
+exactly the new tables are tracked and announced, a table whose page
+failed is picked up on the next run, a table untracked by hand stays
+untracked, and a run with nothing new costs one list request per player.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import tempfile
+from collections import Counter
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Optional
+from unittest import mock
+
+from aiohttp import web
+
+from . import bga_commands, utils, webscraper
+from .config import Config
+from .database import Database
+from .services import service_manager
+
+
+@dataclass
+class StandInTable:
+    id: int
+    game_code: str
+    game_name: str
+    # None once the game has ended
+    active_player: Optional[str]
+    # BGA IDs of the players at the table
+    players: tuple[str, ...] = ()
+    # Serve the game page without any game state, as BGA does while it's in maintenance
+    broken: bool = False
+
+
+SAMPLE_TABLES = [
+    StandInTable(1001, "azul", "Azul", "111", ("111", "222")),
+    StandInTable(1002, "carcassonne", "Carcassonne", "222", ("222",)),
+]
+
+# Tables of the discovery check, played by the linked players 111 and 222
+DISCOVERY_TABLES = [
+    StandInTable(2001, "azul", "Azul", "111", ("111",)),
+    StandInTable(2002, "carcassonne", "Carcassonne", "222", ("111", "222")),
+    StandInTable(2003, "hanabi", "Hanabi", "222", ("222",), broken=True),
+    # Tracked by hand before discovery first runs
+    StandInTable(2004, "azul", "Azul", "222", ("222",)),
+]
+
+
+class StandInBGA:
+    """An aiohttp app answering BGA requests from ``tables``; ``requests`` counts them by kind."""
+
+    def __init__(self, tables: list[StandInTable]):
+        self.tables: dict[int, StandInTable] = {table.id: table for table in tables}
+        self.requests = Counter()
+        self.app = web.Application()
+        self.app.router.add_get("/table", self.overview)
+        self.app.router.add_get("/table/table/tableinfos.html", self.table_info)
+        self.app.router.add_get("/1/{game_code}", self.game_page)
+        self.app.router.add_get("/tablemanager/tablemanager/tableinfos.html", self.player_tables)
+        self._runner: Optional[web.AppRunner] = None
+
+    def _table(self, request, param="table") -> StandInTable:
+        table = self.tables.get(int(request.query.get(param, 0)))
+        if table is None:
+            raise web.HTTPNotFound()
+        return table
+
+    async def overview(self, request):
+        self.requests["overview"] += 1
+        table = self._table(request)
+        return web.Response(text=f"<h1>{table.game_name}</h1><p>Table #{table.id}</p>",
+                            content_type="text/html")
+
+    async def table_info(self, request):
+        self.requests["info"] += 1
+        table = self._table(request, "id")
+        return web.json_response({"status": 1, "data": {"id": str(table.id), "game_name": table.game_code}})
+
+    async def game_page(self, request):
+        self.requests["game"] += 1
+        table = self._table(request)
+        if request.match_info["game_code"] != table.game_code:
+            raise web.HTTPNotFound()
+        if table.broken:
+            state = "<p>Board Game Arena is in maintenance</p>"
+        elif table.active_player is None:
+            state = '<div class="score">1° Winner</div>'
+        else:
+            state = f'<script>var gamedatas = {json.dumps({"active_player": table.active_player}, separators=(",", ":"))};</script>'
+        setup = f'<script>gameui.completesetup("{table.game_code}", "{table.game_name}", {table.id});</script>'
+        return web.Response(text=setup + state, content_type="text/html")
+
+    async def player_tables(self, request):
+        self.requests["list"] += 1
+        player = request.query.get("playerfilter")
+        tables = {
+            str(table.id): {"id": str(table.id), "game_name": table.game_code, "status": "play"}
+            for table in self.tables.values()
+            if player in table.players and table.active_player is not None
+        }
+        return web.json_response({"status": 1, "data": {"tables": tables}})
+
+    async def start(self) -> str:
+        """Serve on a free local port; returns the base URL."""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        return f"http://{host}:{port}"
+
+    async def close(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+async def _check_tracking(bga: StandInBGA, base_url: str, data_dir: str) -> list[str]:
+    problems = []
+    azul = bga.tables[1001]
+
+    # A bare ID, as /bga_track_many accepts, and another URL of the same table
+    for ref in ("1001", "https://en.boardgamearena.com/7/azul?table=1001&refresh=1"):
+        info = await webscraper.getGameInfo(utils.canonicalizeTableReference(ref), base_url)
+        if info != (f'"{azul.game_name}"', azul.active_player):
+            problems.append(f"{ref} read as {info}")
+    if bga.requests["overview"]:
+        problems.append("the table overview was fetched instead of the game page")
+    if bga.requests["info"] != 1:
+        problems.append(f"the game code was looked up {bga.requests['info']} times, expected once")
+
+    canonical_url = utils.canonicalizeTableReference("1001")
+    azul.active_player = None
+    if await webscraper.fetchTableStatus(canonical_url, base_url) != (None, True):
+        problems.append("the ended game was not recognised")
+
+    database = Database(Path(data_dir) / "database.db")
+    database.create_bga_tables()
+    rows = [(table.id, utils.canonicalizeTableReference(str(table.id)), table.game_name, table.active_player)
+            for table in bga.tables.values()]
+    if database.insert_games(rows[:1]) != [1001]:
+        problems.append("insert_games did not report the table it inserted")
+    inserted = database.insert_games(rows)
+    if inserted != [1002]:
+        problems.append(f"insert_games reported {inserted} as inserted, expected [1002]")
+    return problems
+
+
+async def _check_discovery(bga: StandInBGA, base_url: str, data_dir: str) -> list[str]:
+    problems = []
+    config = Config(
+        discord_token="standin", discord_app_id=None, notify_channel_id=0,
+        hosting_rotation_channel_id=0, counting_channel_id=0,
+        data_dir=Path(data_dir), database_path=Path(data_dir) / "discovery.db",
+        target_max=100, bga_base_url=base_url, counting_win_style="single",
+    )
+    with mock.patch.object(Config, "load", return_value=config):
+        from .discoveryService import TableDiscoveryService
+        service = TableDiscoveryService()
+    database = service.database
+    database.create_bga_tables()
+    database.insert_user_data(1, "111")
+    database.insert_user_data(2, "222")
+    database.insert_games([(2004, utils.canonicalizeTableReference("2004"), "Azul", "222")])
+
+    announced = []
+
+    async def record_notifications(bot, games, database, notify_channel_id):
+        announced.extend(game.id for game in games)
+
+    async def discover(step, tracked, requests):
+        announced.clear()
+        before = Counter(bga.requests)
+        with mock.patch.object(bga_commands, "notify_turns", record_notifications):
+            await service.discover_tables(None)
+        made = Counter(bga.requests)
+        made.subtract(before)
+        made = {kind: count for kind, count in made.items() if count}
+        now_tracked = sorted(game.id for game in database.get_all_games())
+        print(f"Discovery {step:<10}  tracked {now_tracked}, announced {sorted(announced)}, requests {made}")
+        if now_tracked != tracked:
+            problems.append(f"{step}: tracking {now_tracked}, expected {tracked}")
+        if sorted(announced) != sorted(set(tracked) - set(previous)):
+            problems.append(f"{step}: announced {sorted(announced)}")
+        if made != requests:
+            problems.append(f"{step}: made requests {made}, expected {requests}")
+        previous[:] = now_tracked
+
+    previous = [2004]
+    # Game codes come from the lists, so no table info is needed; 2003's page fails
+    await discover("first run", [2001, 2002, 2004], {"list": 2, "game": 3})
+    bga.tables[2003].broken = False
+    await discover("retry", [2001, 2002, 2003, 2004], {"list": 2, "game": 1})
+    await discover("steady", [2001, 2002, 2003, 2004], {"list": 2})
+    database.delete_game_data(2001)
+    previous.remove(2001)
+    await discover("untracked", [2002, 2003, 2004], {"list": 2})
+    return problems
+
+
+async def run(args) -> bool:
+    logging.getLogger().setLevel(logging.CRITICAL)
+    bga = StandInBGA([replace(table) for table in SAMPLE_TABLES])
+    base_url = await bga.start()
+    await service_manager.init()
+    try:
+        with tempfile.TemporaryDirectory() as data_dir:
+            problems = await _check_tracking(bga, base_url, data_dir)
+            bga.tables = {table.id: replace(table) for table in DISCOVERY_TABLES}
+            problems += await _check_discovery(bga, base_url, data_dir)
+    finally:
+        await service_manager.cleanup()
+        await bga.close()
+
+    print(f"Requests served:     {dict(sorted(bga.requests.items()))}")
+    print(f"Result:              {'OK' if not problems else 'FAILED: ' + '; '.join(problems)}")
+    return not problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--serve", action="store_true", help="serve the sample tables instead of checking")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+    if args.serve:
+        web.run_app(StandInBGA(SAMPLE_TABLES).app, host="127.0.0.1", port=args.port)
+        return
+    raise SystemExit(0 if asyncio.run(run(args)) else 1)
+
+
+if __name__ == "__main__":
+    main()
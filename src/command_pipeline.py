@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Callable, Dict, Optional, Union
+
+import discord
+
+# Upper bound for the slow part of a deferred command. Interaction tokens stay
+# valid for 15 minutes, so this only guards against hung upstream sites.
+COMMAND_TIMEOUT = 60  # seconds
+LATENCY_SAMPLES = 200
+
+Reply = Union[str, discord.Embed, Dict, None]
+
+
+class CommandLatency:
+    """Latency samples for one command: time to acknowledge and time to complete."""
+
+    def __init__(self):
+        self.calls = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.ack = deque(maxlen=LATENCY_SAMPLES)
+        self.total = deque(maxlen=LATENCY_SAMPLES)
+
+    @staticmethod
+    def _percentile(samples, pct):
+        if not samples:
+            return 0.0
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+    def summary(self):
+        return {
+            "calls": self.calls,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "ack_p50": self._percentile(self.ack, 0.5),
+            "ack_p99": self._percentile(self.ack, 0.99),
+            "total_p50": self._percentile(self.total, 0.5),
+            "total_p99": self._percentile(self.total, 0.99),
+        }
+
+
+class CommandMetrics:
+    """Per-command latency metrics for deferred commands."""
+
+    def __init__(self):
+        self.commands: Dict[str, CommandLatency] = {}
+
+    def get(self, name) -> CommandLatency:
+        return self.commands.setdefault(name, CommandLatency())
+
+    def summary(self):
+        return {name: latency.summary() for name, latency in self.commands.items()}
+
+
+command_metrics = CommandMetrics()
+_pending_tasks = set()
+
+
+def _followup_kwargs(reply: Reply):
+    if isinstance(reply, discord.Embed):
+        return {"embed": reply}
+    if isinstance(reply, dict):
+        return reply
+    return {"content": reply or "Done."}
+
+
+async def _complete(interaction, name, work, timeout, started, error_message, after):
+    latency = command_metrics.get(name)
+    try:
+        reply = await asyncio.wait_for(work(), timeout=timeout)
+    except asyncio.TimeoutError:
+        latency.timeouts += 1
+        logging.error(f"/{name} timed out after {timeout}s")
+        reply = "⏱️ This is taking too long, please try again later."
+        after = None
+    except Exception:
+        latency.errors += 1
+        logging.exception(f"Unexpected error in /{name}")
+        reply = error_message
+        after = None
+
+    try:
+        await interaction.followup.send(**_followup_kwargs(reply))
+    except discord.HTTPException as e:
+        logging.error(f"Failed to send followup for /{name}: {e}")
+
+    elapsed = time.monotonic() - started
+    latency.total.append(elapsed)
+    logging.info(f"/{name} completed in {elapsed:.2f}s")
+
+    if after is not None:
+        await after()
+
+
+async def run_deferred(
+    interaction: discord.Interaction,
+    name: str,
+    work: Callable[[], Awaitable[Reply]],
+    *,
+    timeout: float = COMMAND_TIMEOUT,
+    ephemeral: bool = False,
+    error_message: str = "❌ An unexpected error occurred while processing this command.",
+    after: Optional[Callable[[], Awaitable[None]]] = None,
+) -> asyncio.Task:
+    """Acknowledge an interaction immediately and finish it in the background.
+
+    ``work`` does the slow part and returns the reply: a string, an embed or a
+    dict of ``followup.send`` keyword arguments. ``after`` runs once the reply
+    has been sent, for side effects that should follow it (e.g. notifications).
+    """
+    started = time.monotonic()
+    latency = command_metrics.get(name)
+    latency.calls += 1
+    if not interaction.response.is_done():
+        await interaction.response.defer(thinking=True, ephemeral=ephemeral)
+    latency.ack.append(time.monotonic() - started)
+
+    task = asyncio.create_task(
+        _complete(interaction, name, work, timeout, started, error_message, after)
+    )
+    _pending_tasks.add(task)
+    task.add_done_callback(_pending_tasks.discard)
+    return task
+
+
+def cancel_pending():
+    """Cancel deferred commands that are still running (e.g. on shutdown)."""
+    for task in list(_pending_tasks):
+        task.cancel()
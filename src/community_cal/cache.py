@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from . import events, renderer
+from .config import CalendarConfig
+from .renderer import render_month
+
+logger = logging.getLogger(__name__)
+
+# Rendered months kept in memory (~60 KB each)
+MEMORY_ENTRIES = 24
+# Rendered months kept on disk, if a spill directory is given
+DISK_ENTRIES = 256
+
+CacheKey = Tuple[int, int, Optional[date], str]
+
+
+@lru_cache(maxsize=1)
+def _code_digest() -> bytes:
+    """Hash of the code that draws a month, so a deploy that changes it drops old renders."""
+    h = hashlib.sha256()
+    for module in (renderer, events):
+        h.update(Path(module.__file__).read_bytes())
+    return h.digest()
+
+
+@lru_cache(maxsize=8)
+def config_digest(cfg: CalendarConfig) -> str:
+    """Hash of everything in ``cfg`` that shows up in a rendered month, and of the renderer.
+
+    Stable across restarts (unlike ``hash``), so it can name files on disk.
+    """
+    h = hashlib.sha256(_code_digest())
+    h.update(str(cfg.tz).encode())
+    for e in cfg.events:
+        fields = (e.name, e.venue, e.short_label, e.rrule, e.start_time, e.end_time, e.color)
+        h.update("\0".join(fields).encode() + b"\n")
+    return h.hexdigest()[:16]
+
+
+class RenderCache:
+    """PNG bytes of rendered months, kept in an in-memory LRU.
+
+    Entries are keyed by (year, month, today-if-in-that-month, config
+    digest): the only day that changes a month's picture is today, and only
+    when it falls in that month. With ``spill_dir`` set, renders are also
+    written there and read back on a memory miss, so they survive restarts.
+    ``stats`` reports the hit rate and render times.
+    """
+
+    def __init__(
+        self,
+        render: Callable[..., bytes] = render_month,
+        memory_entries: int = MEMORY_ENTRIES,
+        spill_dir: Optional[Path] = None,
+        disk_entries: int = DISK_ENTRIES,
+    ):
+        self.render = render
+        self.memory_entries = memory_entries
+        self.spill_dir = spill_dir
+        self.disk_entries = disk_entries
+        self._memory: "OrderedDict[CacheKey, bytes]" = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.render_seconds = 0.0
+        self.slowest_render = 0.0
+        if spill_dir is not None:
+            spill_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(cfg: CalendarConfig, year: int, month: int, today: Optional[date]) -> CacheKey:
+        in_month = today is not None and (today.year, today.month) == (year, month)
+        return (year, month, today if in_month else None, config_digest(cfg))
+
+    def _path(self, key: CacheKey) -> Path:
+        year, month, today, digest = key
+        return self.spill_dir / f"{year}-{month:02d}-{today or 'any'}-{digest}.png"
+
+    def get(self, cfg: CalendarConfig, year: int, month: int, today: Optional[date] = None) -> bytes:
+        """The rendered month, from memory, disk or a fresh render."""
+        key = self.key(cfg, year, month, today)
+        png = self._memory.get(key)
+        if png is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return png
+
+        png = self._read(key)
+        if png is not None:
+            self.disk_hits += 1
+        else:
+            self.misses += 1
+            started = time.perf_counter()
+            png = self.render(cfg, year, month, today=key[2])
+            elapsed = time.perf_counter() - started
+            self.render_seconds += elapsed
+            self.slowest_render = max(self.slowest_render, elapsed)
+            logger.info(f"Rendered calendar {year}-{month:02d} in {elapsed * 1000:.0f} ms")
+            self._write(key, png)
+
+        self._memory[key] = png
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+        return png
+
+    def _read(self, key: CacheKey) -> Optional[bytes]:
+        if self.spill_dir is None:
+            return None
+        path = self._path(key)
+        try:
+            png = path.read_bytes()
+        except OSError:
+            return None
+        os.utime(path)  # keep recently used files when pruning
+        return png
+
+    def _write(self, key: CacheKey, png: bytes):
+        if self.spill_dir is None:
+            return
+        path = self._path(key)
+        tmp = path.with_suffix(".tmp")
+        try:
+            tmp.write_bytes(png)
+            os.replace(tmp, path)
+            files = sorted(self.spill_dir.glob("*.png"), key=lambda p: p.stat().st_mtime)
+            for old in files[:max(0, len(files) - self.disk_entries)]:
+                old.unlink(missing_ok=True)
+        except OSError as e:
+            # The disk copy is only an optimisation
+            logger.warning(f"Could not spill calendar render to {path}: {e}")
+
+    def stats(self) -> Dict[str, float]:
+        requests = self.hits + self.disk_hits + self.misses
+        return {
+            "requests": requests,
+            "hit_rate": (self.hits + self.disk_hits) / requests if requests else 0.0,
+            "memory_hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "renders": self.misses,
+            "avg_render_ms": self.render_seconds / self.misses * 1000 if self.misses else 0.0,
+            "max_render_ms": self.slowest_render * 1000,
+        }
@@ -9,8 +9,10 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from src.config import Config
+
+from .cache import RenderCache
 from .config import DEFAULT_CONFIG_PATH, CalendarConfig, load_config
-from .renderer import render_month
 
 logger = logging.getLogger(__name__)
 
@@ -18,9 +20,12 @@ logger = logging.getLogger(__name__)
 class CommunityCalendar(commands.Cog):
     """Slash commands for rendering the local community event calendar."""
 
-    def __init__(self, bot: commands.Bot, cfg: CalendarConfig):
+    def __init__(
+        self, bot: commands.Bot, cfg: CalendarConfig, renders: Optional[RenderCache] = None
+    ):
         self.bot = bot
         self.cfg = cfg
+        self.renders = renders or RenderCache()
 
     @app_commands.command(
         name="calendar",
@@ -54,7 +59,7 @@ class CommunityCalendar(commands.Cog):
             return
 
         try:
-            png = render_month(self.cfg, y, m, today=now.date())
+            png = self.renders.get(self.cfg, y, m, today=now.date())
         except Exception:
             logger.exception("Failed to render community calendar")
             await interaction.followup.send(
@@ -64,9 +69,17 @@ class CommunityCalendar(commands.Cog):
 
         file = discord.File(io.BytesIO(png), filename=f"calendar-{y}-{m:02d}.png")
         await interaction.followup.send(file=file)
+        stats = self.renders.stats()
+        logger.info(
+            f"Calendar cache: {stats['hit_rate']:.0%} hit rate over {stats['requests']} requests, "
+            f"{stats['renders']} renders averaging {stats['avg_render_ms']:.0f} ms "
+            f"(slowest {stats['max_render_ms']:.0f} ms)"
+        )
 
 
 async def setup(bot: commands.Bot):
     cfg = load_config(DEFAULT_CONFIG_PATH)
-    await bot.add_cog(CommunityCalendar(bot, cfg))
+    # Renders also go to the data volume, so a restart doesn't start cold
+    renders = RenderCache(spill_dir=Config.load().data_dir / "calendar_cache")
+    await bot.add_cog(CommunityCalendar(bot, cfg, renders))
     logger.info("✅ Community calendar cog loaded")
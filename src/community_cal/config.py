@@ -1,11 +1,41 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 import yaml
+from dateutil.rrule import rrulestr
+
+# Every rule is anchored here, so an event's occurrences don't depend on
+# which month is asked for (matters for rules like INTERVAL=2). Nothing
+# before it can be queried; /calendar doesn't go back further.
+RULE_ANCHOR = date(1970, 1, 1)
+
+
+class CompiledRule:
+    """An event's rrule, expanded from RULE_ANCHOR only as far as needed.
+
+    Expanded start times are kept in order, so any range is a bisection
+    away once it has been reached.
+    """
+
+    def __init__(self, rule_text: str, dtstart: datetime):
+        self._pending = iter(rrulestr(rule_text, dtstart=dtstart))
+        self._starts: List[datetime] = []
+
+    def between(self, start: datetime, end: datetime) -> List[datetime]:
+        """Start times within [start, end]."""
+        while self._pending is not None and (not self._starts or self._starts[-1] <= end):
+            nxt = next(self._pending, None)
+            if nxt is None:
+                self._pending = None
+            else:
+                self._starts.append(nxt)
+        return self._starts[bisect_left(self._starts, start):bisect_right(self._starts, end)]
 
 
 @dataclass(frozen=True)
@@ -17,12 +47,41 @@ class EventDef:
     start_time: str
     end_time: str
     color: str
+    # Hosting rotations (by name) whose hosts take turns hosting this event
+    rotations: Tuple[str, ...] = ()
+    # Compiled by load_config; not part of the event's identity
+    rule: Optional[CompiledRule] = field(default=None, compare=False, repr=False)
+    start_t: Optional[time] = field(default=None, compare=False, repr=False)
+    end_t: Optional[time] = field(default=None, compare=False, repr=False)
 
 
 @dataclass(frozen=True)
 class CalendarConfig:
     tz: ZoneInfo
-    events: List[EventDef]
+    events: Tuple[EventDef, ...]
+
+
+def _parse_hhmm(s: str) -> time:
+    h, m = s.split(":")
+    return time(int(h), int(m))
+
+
+def _compile_event(e: dict, tz: ZoneInfo) -> EventDef:
+    start_t = _parse_hhmm(e["start_time"])
+    rule = CompiledRule(e["rrule"], datetime.combine(RULE_ANCHOR, start_t, tzinfo=tz))
+    return EventDef(
+        name=e["name"],
+        venue=e["venue"],
+        short_label=e["short_label"],
+        rrule=e["rrule"],
+        start_time=e["start_time"],
+        end_time=e["end_time"],
+        color=e["color"],
+        rotations=tuple(e.get("rotations", ())),
+        rule=rule,
+        start_t=start_t,
+        end_t=_parse_hhmm(e["end_time"]),
+    )
 
 
 def load_config(path: Path) -> CalendarConfig:
@@ -30,18 +89,7 @@ def load_config(path: Path) -> CalendarConfig:
         raw = yaml.safe_load(f)
 
     tz = ZoneInfo(raw["timezone"])
-    events = [
-        EventDef(
-            name=e["name"],
-            venue=e["venue"],
-            short_label=e["short_label"],
-            rrule=e["rrule"],
-            start_time=e["start_time"],
-            end_time=e["end_time"],
-            color=e["color"],
-        )
-        for e in raw["events"]
-    ]
+    events = tuple(_compile_event(e, tz) for e in raw["events"])
     return CalendarConfig(tz=tz, events=events)
 
 
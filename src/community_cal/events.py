@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import calendar as _calendar
 from dataclasses import dataclass
-from datetime import datetime, time, timedelta
-from typing import List
-
-from dateutil.rrule import rrulestr
+from datetime import datetime
+from functools import lru_cache
+from typing import List, Tuple
 
 from .config import CalendarConfig, EventDef
 
+# Months of occurrences kept, across all loaded configs
+MONTH_CACHE_SIZE = 128
+
 
 @dataclass(frozen=True)
 class EventOccurrence:
@@ -17,32 +19,44 @@ class EventOccurrence:
     end: datetime
 
 
-def _parse_hhmm(s: str) -> time:
-    h, m = s.split(":")
-    return time(int(h), int(m))
-
-
-def occurrences_for_month(
+@lru_cache(maxsize=MONTH_CACHE_SIZE)
+def _month_index(
     cfg: CalendarConfig, year: int, month: int
-) -> List[EventOccurrence]:
-    """Return all event occurrences whose start falls within [year-month]."""
+) -> Tuple[EventOccurrence, ...]:
     _, last_day = _calendar.monthrange(year, month)
     month_start = datetime(year, month, 1, tzinfo=cfg.tz)
     month_end = datetime(year, month, last_day, 23, 59, 59, tzinfo=cfg.tz)
-    # rrule needs a DTSTART to anchor. Use one year before the month so
-    # monthly rrules (e.g. 3rd Friday) land correctly in the target month.
-    anchor = month_start - timedelta(days=400)
 
     results: List[EventOccurrence] = []
     for evt in cfg.events:
-        start_t = _parse_hhmm(evt.start_time)
-        end_t = _parse_hhmm(evt.end_time)
-        dtstart = datetime.combine(anchor.date(), start_t, tzinfo=cfg.tz)
-        rule = rrulestr(evt.rrule, dtstart=dtstart)
-        for occ in rule.between(month_start, month_end, inc=True):
-            start = occ
-            end = datetime.combine(occ.date(), end_t, tzinfo=cfg.tz)
-            results.append(EventOccurrence(event=evt, start=start, end=end))
+        for occ in evt.rule.between(month_start, month_end):
+            end = datetime.combine(occ.date(), evt.end_t, tzinfo=cfg.tz)
+            results.append(EventOccurrence(event=evt, start=occ, end=end))
 
     results.sort(key=lambda o: o.start)
+    return tuple(results)
+
+
+def occurrences_for_month(
+    cfg: CalendarConfig, year: int, month: int
+) -> List[EventOccurrence]:
+    """Return all event occurrences whose start falls within [year-month].
+
+    Months are expanded once per config and then served from an LRU cache.
+    """
+    return list(_month_index(cfg, year, month))
+
+
+def occurrences_between(
+    cfg: CalendarConfig, start: datetime, end: datetime
+) -> List[EventOccurrence]:
+    """Return all event occurrences whose start falls within [start, end]."""
+    first, last = start.astimezone(cfg.tz), end.astimezone(cfg.tz)
+    year, month = first.year, first.month
+    results: List[EventOccurrence] = []
+    while (year, month) <= (last.year, last.month):
+        results.extend(
+            o for o in _month_index(cfg, year, month) if start <= o.start <= end
+        )
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
     return results
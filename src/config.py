@@ -17,6 +17,12 @@ class Config:
     data_dir: Path
     database_path: Path
     target_max: int
+    bga_base_url: str
+    counting_win_style: str
+    # Rotations hosting a calendar event advance this long after it ends
+    hosting_advance_grace_minutes: int = 60
+    # Hosts are reminded this long before the event (0 turns reminders off)
+    hosting_reminder_hours: int = 24
 
     @classmethod
     def load(cls) -> 'Config':
@@ -46,5 +52,9 @@ class Config:
             counting_channel_id=int(os.getenv("COUNTING_CHANNEL_ID", "0")),
             data_dir=data_dir,
             database_path=database_path,
-            target_max=int(os.getenv('COUNTING_TARGET_MAX', '100'))
+            target_max=int(os.getenv('COUNTING_TARGET_MAX', '100')),
+            bga_base_url=os.getenv("BGA_BASE_URL", "https://boardgamearena.com").rstrip("/"),
+            counting_win_style=os.getenv("COUNTING_WIN_STYLE", "single"),
+            hosting_advance_grace_minutes=int(os.getenv("HOSTING_ADVANCE_GRACE_MINUTES", "60")),
+            hosting_reminder_hours=int(os.getenv("HOSTING_REMINDER_HOURS", "24")),
         )
@@ -0,0 +1,68 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional
+
+logger = logging.getLogger('counting_game')
+
+Effect = Callable[[], Awaitable]
+
+
+class ChannelActor:
+    """Processes one counting channel's messages strictly in arrival order.
+
+    ``handler`` is a synchronous function that validates a message, applies the
+    state transition and returns the Discord side effects (reactions, replies)
+    as zero-argument coroutine functions. Because the handler never awaits, no
+    other message can observe a half-applied transition. Side effects are run
+    in order by a separate task, so slow or rate-limited API calls never hold
+    up validation of the next message.
+    """
+
+    def __init__(self, handler: Callable[[object], List[Effect]], name: str = "counting"):
+        self.handler = handler
+        self.name = name
+        self.inbox: asyncio.Queue = asyncio.Queue()
+        self.outbox: asyncio.Queue = asyncio.Queue()
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self):
+        """Start the consumer and dispatcher. Must be called from the running event loop."""
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._consume(), name=f"{self.name}-consumer"),
+                asyncio.create_task(self._dispatch(), name=f"{self.name}-dispatcher"),
+            ]
+
+    def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+
+    def submit(self, message):
+        self.inbox.put_nowait(message)
+
+    async def drain(self):
+        """Wait until every submitted message and its side effects have been processed."""
+        await self.inbox.join()
+        await self.outbox.join()
+
+    async def _consume(self):
+        while True:
+            message = await self.inbox.get()
+            try:
+                for effect in self.handler(message):
+                    self.outbox.put_nowait(effect)
+            except Exception:
+                logger.exception(f"Failed to process counting message in {self.name}")
+            finally:
+                self.inbox.task_done()
+
+    async def _dispatch(self):
+        while True:
+            effect: Optional[Effect] = await self.outbox.get()
+            try:
+                await effect()
+            except Exception:
+                logger.exception(f"Counting side effect failed in {self.name}")
+            finally:
+                self.outbox.task_done()
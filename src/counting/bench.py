@@ -0,0 +1,290 @@
+"""Synthetic load harness for the counting game.
+
+Drives ``CountingGame.on_message`` with fake Discord objects against a
+throwaway SQLite database and reports throughput, handler latency and
+database writes per message::
+
+    python -m src.counting.bench --scenario mixed --messages 5000
+
+Scenarios:
+
+* ``valid``      - an uninterrupted run of correct counts
+* ``collisions`` - several players racing to post the same number
+* ``spam``       - one player flooding the channel with wrong numbers
+* ``wins``       - short rounds, so wins (and their announcements) are frequent
+* ``mixed``      - all of the above
+
+The stream is generated against a model of the game, so the harness also
+checks that the cog accepted exactly the counts and wins the model expects;
+a mismatch means messages were processed out of order or lost.
+"""
+import argparse
+import asyncio
+import logging
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Tuple
+from unittest import mock
+
+from src.config import Config
+
+from .counting_game import CountingGame
+
+CHANNEL_ID = 1000
+GUILD_ID = 1
+SPAMMER_ID = 666
+# Targets far beyond the stream length, for scenarios that should never win
+NO_WIN_TARGET = 10 ** 9
+
+SCENARIOS = {
+    # step kind -> weight
+    "valid": {"valid": 1},
+    "collisions": {"valid": 1, "collision": 1},
+    "spam": {"valid": 1, "spam": 3},
+    "wins": {"valid": 1},
+    "mixed": {"valid": 4, "collision": 1, "spam": 1},
+}
+
+
+@dataclass
+class FakeUser:
+    id: int
+    bot: bool = False
+
+    @property
+    def name(self):
+        return f"user{self.id}"
+
+    @property
+    def display_name(self):
+        return self.name
+
+    @property
+    def mention(self):
+        return f"<@{self.id}>"
+
+
+@dataclass
+class FakeGuild:
+    id: int
+
+
+@dataclass
+class RecordingChannel:
+    """Channel that records everything sent to it, optionally with simulated API latency."""
+    id: int
+    guild: FakeGuild
+    api_delay: float = 0.0
+    sent: List[tuple] = field(default_factory=list)
+
+    async def send(self, content=None, **kwargs):
+        if self.api_delay:
+            await asyncio.sleep(self.api_delay)
+        self.sent.append(("send", content, kwargs))
+
+
+@dataclass
+class FakeMessage:
+    content: str
+    author: FakeUser
+    channel: RecordingChannel
+    submitted_at: float = 0.0
+
+    @property
+    def guild(self):
+        return self.channel.guild
+
+    async def add_reaction(self, emoji):
+        if self.channel.api_delay:
+            await asyncio.sleep(self.channel.api_delay)
+        self.channel.sent.append(("react", emoji, self.author.id))
+
+
+class FakeBot:
+    def __init__(self, channel: RecordingChannel):
+        self.channel = channel
+
+    def get_channel(self, channel_id):
+        return self.channel if channel_id == self.channel.id else None
+
+    def get_user(self, user_id):
+        return FakeUser(user_id)
+
+    async def fetch_user(self, user_id):
+        return FakeUser(user_id)
+
+
+@dataclass
+class Expected:
+    counts: int = 0
+    wins: int = 0
+
+
+def build_stream(scenario: str, messages: int, players: int, target: int,
+                 seed: int) -> Tuple[List[Tuple[int, str]], Expected]:
+    """Generate ``(author_id, content)`` pairs and the counts/wins they should produce."""
+    rng = random.Random(seed)
+    kinds, weights = zip(*SCENARIOS[scenario].items())
+    stream: List[Tuple[int, str]] = []
+    expected = Expected()
+    count, last = -1, None
+
+    def accept(user_id):
+        nonlocal count, last
+        number = count + 1
+        stream.append((user_id, str(number)))
+        expected.counts += 1
+        last = user_id
+        if number == target:
+            expected.wins += 1
+            count = -1
+        else:
+            count = number
+
+    def other_players(k):
+        return rng.sample([p for p in range(1, players + 1) if p != last], k)
+
+    while len(stream) < messages:
+        kind = rng.choices(kinds, weights=weights)[0]
+        if kind == "valid":
+            accept(other_players(1)[0])
+        elif kind == "collision":
+            racers = other_players(min(3, players - 1))
+            accept(racers[0])
+            stream.extend((racer, str(count if count != -1 else target)) for racer in racers[1:])
+        else:
+            stream.append((SPAMMER_ID, str(count + 2 + rng.randrange(100))))
+    return stream[:messages], expected
+
+
+class WriteCounter:
+    """Counts SQL write statements and commits issued through the database's connections."""
+
+    def __init__(self, database):
+        self.writes = 0
+        self.commits = 0
+        connect = database.connect
+
+        def counting_connect():
+            fresh = database.conn is None
+            connect()
+            if fresh:
+                database.conn.set_trace_callback(self._trace)
+
+        database.connect = counting_connect
+
+    def _trace(self, sql):
+        statement = sql.lstrip().split(None, 1)[0].upper() if sql.strip() else ""
+        if statement in ("INSERT", "UPDATE", "DELETE", "REPLACE"):
+            self.writes += 1
+        elif statement == "COMMIT":
+            self.commits += 1
+
+
+def _percentile(samples, pct):
+    if len(samples) < 2:
+        return samples[0] if samples else 0.0
+    return statistics.quantiles(samples, n=100, method="inclusive")[pct - 1]
+
+
+async def run(args) -> bool:
+    logging.getLogger('counting_game').setLevel(logging.WARNING)
+    logging.getLogger().setLevel(logging.WARNING)
+
+    target = args.round_length - 1 if args.scenario == "wins" else NO_WIN_TARGET
+    stream, expected = build_stream(args.scenario, args.messages, args.players, target, args.seed)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        config = Config(
+            discord_token="bench", discord_app_id=None, notify_channel_id=0,
+            hosting_rotation_channel_id=0, counting_channel_id=0,
+            data_dir=Path(data_dir), database_path=Path(data_dir) / "database.db",
+            target_max=target, bga_base_url="https://boardgamearena.com",
+            counting_win_style=args.win_style,
+        )
+        channel = RecordingChannel(CHANNEL_ID, FakeGuild(GUILD_ID), api_delay=args.api_delay / 1000)
+        with mock.patch.object(Config, "load", return_value=config):
+            cog = CountingGame(FakeBot(channel))
+        cog._generate_target = lambda: target
+        game = cog._enable_channel(CHANNEL_ID, GUILD_ID)
+        await cog.cog_load()
+
+        handler_times: List[float] = []
+        end_to_end: List[float] = []
+        handler = game.actor.handler
+
+        def timed_handler(message):
+            started = time.perf_counter()
+            try:
+                return handler(message)
+            finally:
+                finished = time.perf_counter()
+                handler_times.append(finished - started)
+                end_to_end.append(finished - message.submitted_at)
+
+        game.actor.handler = timed_handler
+        writes = WriteCounter(cog.database)
+        users = {user_id: FakeUser(user_id) for user_id, _ in stream}
+
+        started = time.perf_counter()
+        for i, (user_id, content) in enumerate(stream, 1):
+            message = FakeMessage(content, users[user_id], channel, time.perf_counter())
+            await cog.on_message(message)
+            if i % args.burst == 0:
+                await asyncio.sleep(0)
+        await game.actor.inbox.join()
+        processed = time.perf_counter() - started
+        await game.actor.drain()
+        drained = time.perf_counter() - started
+        cog.cog_unload()
+
+        with sqlite3.connect(config.database_path) as conn:
+            counts, rounds = conn.execute(
+                "SELECT counts, rounds FROM counting_guild_stats WHERE guild_id = ?", (GUILD_ID,)
+            ).fetchone() or (0, 0)
+
+    sends = sum(1 for kind, *_ in channel.sent if kind == "send")
+    reactions = len(channel.sent) - sends
+    ms = 1000
+    print(f"Scenario:            {args.scenario} ({len(stream)} messages, {args.players} players)")
+    print(f"Throughput:          {len(stream) / processed:,.0f} msg/s validated, "
+          f"{len(stream) / drained:,.0f} msg/s including side effects")
+    print(f"Handler latency:     p50 {_percentile(handler_times, 50) * ms:.3f} ms, "
+          f"p99 {_percentile(handler_times, 99) * ms:.3f} ms")
+    print(f"Queue + handler:     p50 {_percentile(end_to_end, 50) * ms:.3f} ms, "
+          f"p99 {_percentile(end_to_end, 99) * ms:.3f} ms")
+    print(f"DB writes:           {writes.writes} statements, {writes.commits} commits "
+          f"({writes.writes / len(stream):.3f} / {writes.commits / len(stream):.3f} per message)")
+    print(f"Discord calls:       {sends} sends, {reactions} reactions")
+    print(f"Shed:                {dict(cog.shed_counters())}")
+
+    ok = (counts, rounds) == (expected.counts, expected.wins)
+    print(f"Ordering check:      {'OK' if ok else 'MISMATCH'} "
+          f"(accepted {counts}/{expected.counts} counts, {rounds}/{expected.wins} wins)")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", choices=SCENARIOS, default="mixed")
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--players", type=int, default=20)
+    parser.add_argument("--round-length", type=int, default=25,
+                        help="numbers per round in the 'wins' scenario")
+    parser.add_argument("--burst", type=int, default=50,
+                        help="messages delivered before yielding to the event loop")
+    parser.add_argument("--api-delay", type=float, default=0.0,
+                        help="simulated Discord API latency per call, in ms")
+    parser.add_argument("--win-style", choices=("single", "multi"), default="single")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    raise SystemExit(0 if asyncio.run(run(args)) else 1)
+
+
+if __name__ == "__main__":
+    main()
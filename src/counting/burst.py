@@ -0,0 +1,130 @@
+"""Burst check for the per-channel counting actor.
+
+Feeds several ChannelActors bursts of simultaneous posts, with side effects
+that take a random while (like rate-limited Discord calls), and checks each
+channel was processed in order::
+
+    python -m src.counting.burst --channels 8 --players 10 --numbers 200
+
+In every burst all of a channel's players post the next number at once. The
+run fails unless each channel's handler saw its messages in submission
+order, exactly one post per number was accepted, no message was lost, and
+each channel's side effects ran in the order its messages were handled.
+"""
+import argparse
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+
+from .actor import ChannelActor
+
+
+@dataclass
+class Post:
+    seq: int
+    user_id: int
+    number: int
+
+
+@dataclass
+class Channel:
+    """A channel's counting state, its handler and what happened to its posts."""
+    rng: random.Random
+    max_effect_delay: float
+    count: int = 0
+    last_user: int = 0
+    submitted: list[int] = field(default_factory=list)
+    handled: list[int] = field(default_factory=list)
+    accepted: list[tuple[int, int]] = field(default_factory=list)  # (number, user_id)
+    effects: list[int] = field(default_factory=list)
+
+    def handle(self, post: Post):
+        # Check and transition with no await in between, as CountingGame does
+        self.handled.append(post.seq)
+        if post.number == self.count + 1 and post.user_id != self.last_user:
+            self.count, self.last_user = post.number, post.user_id
+            self.accepted.append((post.number, post.user_id))
+        delay = self.rng.random() * self.max_effect_delay
+
+        async def react():
+            await asyncio.sleep(delay)
+            self.effects.append(post.seq)
+        return [react]
+
+
+async def _post_burst(actor: ChannelActor, channel: Channel, posts: list[Post]):
+    # Every player's post arrives "at once": separate tasks, released together
+    release = asyncio.Event()
+
+    async def post(p):
+        await release.wait()
+        channel.submitted.append(p.seq)
+        actor.submit(p)
+
+    tasks = [asyncio.create_task(post(p)) for p in posts]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks)
+
+
+async def run(args) -> bool:
+    logging.getLogger('counting_game').setLevel(logging.WARNING)
+    rng = random.Random(args.seed)
+    channels = [Channel(random.Random(args.seed + i), args.effect_delay / 1000) for i in range(args.channels)]
+    actors = [ChannelActor(channel.handle, name=f"burst-{i}") for i, channel in enumerate(channels)]
+    for actor in actors:
+        actor.start()
+
+    seq = 0
+    started = time.perf_counter()
+    for number in range(1, args.numbers + 1):
+        bursts = []
+        for actor, channel in zip(actors, channels):
+            players = list(range(1, args.players + 1))
+            rng.shuffle(players)
+            posts = []
+            for user_id in players:
+                seq += 1
+                posts.append(Post(seq, user_id, number))
+            bursts.append(_post_burst(actor, channel, posts))
+        await asyncio.gather(*bursts)
+    for actor in actors:
+        await actor.inbox.join()
+    validated = time.perf_counter() - started
+    for actor in actors:
+        await actor.drain()
+        actor.stop()
+
+    problems = []
+    for i, channel in enumerate(channels):
+        numbers = [number for number, _ in channel.accepted]
+        if numbers != list(range(1, args.numbers + 1)):
+            problems.append(f"channel {i} accepted {len(numbers)} posts for {args.numbers} numbers")
+        if len(channel.handled) != args.numbers * args.players:
+            problems.append(f"channel {i} handled {len(channel.handled)} of {args.numbers * args.players} posts")
+        if channel.handled != channel.submitted:
+            problems.append(f"channel {i} handled posts out of order")
+        if channel.effects != channel.handled:
+            problems.append(f"channel {i} ran side effects out of order")
+
+    print(f"Channels × players:  {args.channels} × {args.players}, {args.numbers} numbers ({seq} posts)")
+    print(f"Validated:           {seq / validated:,.0f} posts/s")
+    print(f"Result:              {'OK' if not problems else 'FAILED: ' + '; '.join(problems)}")
+    return not problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--channels", type=int, default=8)
+    parser.add_argument("--players", type=int, default=10, help="players posting each number at once")
+    parser.add_argument("--numbers", type=int, default=200)
+    parser.add_argument("--effect-delay", type=float, default=2.0, help="longest side effect, in ms")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    raise SystemExit(0 if asyncio.run(run(args)) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,42 @@
+import asyncio
 import logging
 import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Dict, List, Optional
 import discord
 from discord.ext import commands
 from discord import app_commands
 from src.database import Database
+from src.database.counting_db import LEGACY_ID
 from src.config import Config
-from pathlib import Path
+from .actor import ChannelActor
+from .gif_pools import GifRegistry
+from .history import CountingHistory
+from .leaderboard import LeaderboardCache, NameCache
+from .state_store import CountingStateStore
+from .throttle import REPLY_WINDOW, RejectionThrottle
 
 logger = logging.getLogger('counting_game')
 
+@dataclass
+class ChannelGame:
+    """In-memory state of the counting game in one channel."""
+    channel_id: int
+    guild_id: int
+    current_count: int
+    target_number: int
+    last_counter: Optional[int]
+    # Rounds end only with a win, so this is the channel's finished rounds + 1
+    round_no: int = 1
+    round_started_at: Optional[float] = None
+    actor: Optional[ChannelActor] = None
+    throttle: RejectionThrottle = field(default_factory=RejectionThrottle)
+    pending_replies: List[str] = field(default_factory=list)
+    reply_task: Optional[asyncio.Task] = None
+
 class CountingGame(commands.Cog):
     """Commands and logic for the counting game."""
     
@@ -25,27 +53,39 @@ class CountingGame(commands.Cog):
         with self.database.transaction():
             self.database.create_tables()
         
-        self.current_count = 0
-        self.target_number = None
-        self.last_counter = None
-        self.counting_channel = None
+        self.games: Dict[int, ChannelGame] = {}
         self.ready = False
-        self._load_game_state()
-        logger.info(f"CountingGame initialized with channel ID: {self.config.counting_channel_id}")
+        self.gifs = GifRegistry()
+        self.state_store = CountingStateStore(
+            self.database, self.config.data_dir / "counting_journal.jsonl"
+        )
+        self.history = CountingHistory(self.database)
+        self.name_cache = NameCache(bot)
+        self.leaderboards: Dict[int, LeaderboardCache] = {}
+        self._load_games()
+        logger.info(f"CountingGame initialized with channels: {list(self.games)}")
+
+    async def cog_load(self):
+        self.state_store.start()
+        self.history.start()
+        for game in self.games.values():
+            game.actor.start()
+
+    def cog_unload(self):
+        for game in self.games.values():
+            game.actor.stop()
+            if game.reply_task is not None:
+                game.reply_task.cancel()
+        self.state_store.close()
+        self.history.close()
 
     def _get_random_spawn_gif(self) -> str:
-        """Get a random GIF URL from the spawn-gifs.txt file."""
-        gif_file = Path(__file__).parent.parent / "gifs" / "spawn-gifs.txt"
-        with open(gif_file, 'r') as f:
-            gifs = [line.strip() for line in f if line.strip()]
-        return random.choice(gifs)
+        """Get a random GIF URL from the spawn GIF pool."""
+        return self.gifs.choose("spawn")
 
     def _get_random_goose_gif(self) -> str:
-        """Get a random GIF URL from the goose-gifs.txt file."""
-        gif_file = Path(__file__).parent.parent / "gifs" / "goose-gifs.txt"
-        with open(gif_file, 'r') as f:
-            gifs = [line.strip() for line in f if line.strip()]
-        return random.choice(gifs)
+        """Get a random GIF URL from the goose GIF pool."""
+        return self.gifs.choose("goose")
 
     def _get_random_negative_emoji(self) -> str:
         """Get a random negative emoji."""
@@ -58,24 +98,26 @@ class CountingGame(commands.Cog):
         return random.choice(negative_emojis)
 
     async def announce_game_status(self):
-        """Announce game status in counting channel."""
-        if not self.counting_channel:
-            self.counting_channel = self.bot.get_channel(self.config.counting_channel_id)
-            if not self.counting_channel:
-                logger.error("❌ Could not find counting channel")
-                return False
-                
-        try:
-            await self.counting_channel.send(self._get_random_spawn_gif())
-            # Show "start at 0" message when current_count is -1
-            message = ("🎲 New game starting! Begin counting at 0!" if self.current_count == -1 
-                      else f"Last number counted: `{self.current_count}`")
-            await self.counting_channel.send(message)
-            logger.info("✅ Game status announced successfully")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to announce game status: {e}")
-            return False
+        """Announce game status in every counting channel."""
+        announced = True
+        for game in self.games.values():
+            channel = self.bot.get_channel(game.channel_id)
+            if not channel:
+                logger.error(f"❌ Could not find counting channel {game.channel_id}")
+                announced = False
+                continue
+
+            try:
+                await channel.send(self._get_random_spawn_gif())
+                # Show "start at 0" message when current_count is -1
+                message = ("🎲 New game starting! Begin counting at 0!" if game.current_count == -1 
+                          else f"Last number counted: `{game.current_count}`")
+                await channel.send(message)
+                logger.info(f"✅ Game status announced in channel {game.channel_id}")
+            except Exception as e:
+                logger.error(f"Failed to announce game status in channel {game.channel_id}: {e}")
+                announced = False
+        return announced
 
     @commands.Cog.listener()
     async def on_ready(self):
@@ -85,26 +127,22 @@ class CountingGame(commands.Cog):
             
         try:
             logger.info("🔄 Starting counting game initialization...")
-            
-            logger.info("Finding counting channel...")
-            self.counting_channel = self.bot.get_channel(self.config.counting_channel_id)
-            if not self.counting_channel:
-                logger.error(f"❌ Could not find counting channel with ID: {self.config.counting_channel_id}")
-                return
-
-            logger.info("Loading game state...")
-            self._load_game_state()
             self.ready = True
             
-            logger.info("Sending startup message...")
-            try:
-                message = ("🎲 **Counting Game is Ready!**\n"
-                          "New game starting! Begin counting at 0!\n")
-                await self.counting_channel.send(message)
-                await self.counting_channel.send(self._get_random_spawn_gif())
-                logger.info("✅ Counting game startup complete!")
-            except Exception as e:
-                logger.error(f"Failed to send startup message: {e}")
+            logger.info("Sending startup messages...")
+            for game in self.games.values():
+                channel = self.bot.get_channel(game.channel_id)
+                if not channel:
+                    logger.error(f"❌ Could not find counting channel with ID: {game.channel_id}")
+                    continue
+                try:
+                    message = ("🎲 **Counting Game is Ready!**\n"
+                              "New game starting! Begin counting at 0!\n")
+                    await channel.send(message)
+                    await channel.send(self._get_random_spawn_gif())
+                except Exception as e:
+                    logger.error(f"Failed to send startup message: {e}")
+            logger.info("✅ Counting game startup complete!")
             
         except Exception as e:
             logger.error(f"❌ Failed to initialize counting game: {e}", exc_info=True)
@@ -114,32 +152,67 @@ class CountingGame(commands.Cog):
         """Generate a new target number using the configured range."""
         return random.randint(*self.target_range)
 
-    def _load_game_state(self):
-        """Load game state from database."""
-        state = self.database.get_game_state()
-        if state:
-            self.current_count, self.target_number, self.last_counter = state
-        else:
-            # Initialize game state
-            self.current_count = -1  # Start as a new game
-            self.target_number = self._generate_target()
-            self.last_counter = None
-            self._save_game_state()
-
-    def _save_game_state(self):
-        """Save current game state to database."""
-        self.database.save_game_state(
-            self.current_count, 
-            self.target_number, 
-            self.last_counter
+    def _load_games(self):
+        """Load every enabled channel's game (and any journal left by a crash)."""
+        legacy_channel_id = self.config.counting_channel_id
+        legacy_guild_id = None
+        if legacy_channel_id:
+            # COUNTING_CHANNEL_ID is the channel of the original single-channel game
+            guild = getattr(self.bot.get_channel(legacy_channel_id), "guild", None)
+            legacy_guild_id = guild.id if guild else None
+            self.database.claim_legacy_counting(legacy_channel_id, legacy_guild_id)
+        states = self.state_store.load(legacy_channel_id=legacy_channel_id or LEGACY_ID)
+
+        for channel_id, guild_id, *_ in self.database.get_counting_channels():
+            current_count, target_number, last_counter = states[channel_id]
+            self._add_game(channel_id, guild_id, current_count, target_number, last_counter)
+
+        if legacy_channel_id and legacy_channel_id not in self.games:
+            self._enable_channel(legacy_channel_id, legacy_guild_id or LEGACY_ID)
+
+    def _add_game(self, channel_id, guild_id, current_count, target_number, last_counter):
+        game = ChannelGame(
+            channel_id, guild_id, current_count, target_number, last_counter,
+            round_no=self.database.get_next_round_no(channel_id)
+        )
+        game.actor = ChannelActor(partial(self._handle_count, game), name=f"counting-{channel_id}")
+        self.games[channel_id] = game
+        return game
+
+    def _enable_channel(self, channel_id, guild_id):
+        """Enable counting in a channel, resuming its previous game if it had one."""
+        current_count, target_number, last_counter = self.database.enable_counting_channel(
+            channel_id, guild_id, self._generate_target()
+        )
+        self.state_store.states[channel_id] = (current_count, target_number, last_counter)
+        return self._add_game(channel_id, guild_id, current_count, target_number, last_counter)
+
+    def _claim_legacy_guild(self, game, guild_id):
+        """Attach scores from the single-channel era to the guild they were played in."""
+        self.database.claim_legacy_counting(game.channel_id, guild_id)
+        game.guild_id = guild_id
+        self.leaderboards.pop(LEGACY_ID, None)
+        self._leaderboard_cache(guild_id).invalidate()
+
+    def _save_game_state(self, game, flush=False):
+        """Record a channel's game state; it is written to the database in the background.
+
+        Pass ``flush=True`` to write it immediately (wins, admin resets).
+        """
+        self.state_store.update(
+            game.channel_id,
+            game.current_count,
+            game.target_number,
+            game.last_counter
         )
+        if flush:
+            self.state_store.flush()
 
-    def _record_win(self, user_id):
-        """Record a win for the user and update their streak."""
-        # Reset all other players' streaks
-        self.database.reset_other_streaks(user_id)
-        # Increment this player's streak and wins
-        self.database.record_win_and_increment_streak(user_id)
+    def _record_win(self, game, user_id):
+        """Record a win for the user and return their current streak."""
+        streak = self.database.record_win_and_increment_streak(game.guild_id, user_id)
+        self._leaderboard_cache(game.guild_id).invalidate()
+        return streak
 
     def _get_rank_info(self, wins):
         """Get title, color, and progress info based on win count."""
@@ -191,9 +264,20 @@ class CountingGame(commands.Cog):
             return f"🔥 {username}'s winning streak: {streak} in a row!"
         return ""
 
-    async def _show_leaderboard(self, channel):
+    def _leaderboard_cache(self, guild_id):
+        cache = self.leaderboards.get(guild_id)
+        if cache is None:
+            cache = LeaderboardCache(partial(self._render_leaderboard, guild_id))
+            self.leaderboards[guild_id] = cache
+        return cache
+
+    async def _show_leaderboard(self, guild_id):
+        """Return the guild's leaderboard embed, re-rendering it only after scores change."""
+        return await self._leaderboard_cache(guild_id).get()
+
+    async def _render_leaderboard(self, guild_id):
         """Create and return the leaderboard embed."""
-        leaders = self.database.get_leaderboard_with_streaks()
+        leaders = self.database.get_leaderboard_with_streaks(guild_id)
 
         if not leaders:
             return "No winners yet!"
@@ -210,12 +294,9 @@ class CountingGame(commands.Cog):
         # Medal emojis for top 3
         medals = ["🥇", "🥈", "🥉"]
 
+        names = await self.name_cache.resolve_many(user_id for user_id, _, _ in leaders)
         for i, (user_id, wins, streak) in enumerate(leaders, 1):
-            try:
-                user = await self.bot.fetch_user(user_id)
-                name = user.name if user else f"Unknown User ({user_id})"
-            except discord.NotFound:
-                name = f"Unknown User ({user_id})"
+            name = names[user_id]
 
             title, _, progress, next_threshold = self._get_rank_info(wins)
             progress_bar = self._create_progress_bar(wins, progress)
@@ -244,101 +325,270 @@ class CountingGame(commands.Cog):
 
     @commands.Cog.listener()
     async def on_message(self, message):
-        """Monitor counting channel for numbers."""
-        if (message.channel.id != self.config.counting_channel_id or 
-            message.author.bot):
+        """Monitor counting channels for numbers and queue them for processing."""
+        game = self.games.get(message.channel.id)
+        if game is None or message.author.bot:
             return
 
         if not message.content.strip().isdigit():
             return
 
+        game.actor.submit(message)
+
+    def _reject(self, game, message, reply):
+        """Side effects for a rejected number, shedding load from spammers.
+
+        Replies are queued for the channel's reply coalescer rather than sent
+        one by one; users over their allowance are ignored entirely.
+        """
+        decision = game.throttle.check(message.author.id)
+        if decision == "drop":
+            return []
+        if decision == "reply":
+            game.pending_replies.append(reply)
+            if game.reply_task is None or game.reply_task.done():
+                game.reply_task = asyncio.create_task(self._send_pending_replies(game, message.channel))
+        return [partial(message.add_reaction, self._get_random_negative_emoji())]
+
+    async def _send_pending_replies(self, game, channel):
+        """Send queued error replies: the first at once, later ones once per REPLY_WINDOW."""
+        while game.pending_replies:
+            counts = Counter(game.pending_replies)
+            game.pending_replies.clear()
+            if sum(counts.values()) > 1:
+                game.throttle.counters["coalesced"] += sum(counts.values()) - 1
+            lines = [reply if n == 1 else f"{reply} (×{n})" for reply, n in counts.items()]
+            try:
+                await channel.send("\n".join(lines))
+            except discord.HTTPException as e:
+                logger.error(f"Failed to send counting reply in channel {game.channel_id}: {e}")
+            await asyncio.sleep(REPLY_WINDOW)
+
+    def shed_counters(self):
+        """Totals of shed and coalesced invalid messages across all channels."""
+        totals = Counter()
+        for game in self.games.values():
+            totals.update(game.throttle.counters)
+        return totals
+
+    def _handle_count(self, game, message):
+        """Validate a number and apply the resulting state transition.
+
+        Runs on the channel actor and never awaits, so the check and the state
+        change are atomic with respect to other messages. Returns the Discord
+        side effects to send, in order.
+        """
+        if game.guild_id == LEGACY_ID and message.guild:
+            self._claim_legacy_guild(game, message.guild.id)
+
         number = int(message.content)
-        expected_number = self.current_count + 1
+        expected_number = game.current_count + 1
 
         # Special handling for new game start
-        if self.current_count == -1:
+        if game.current_count == -1:
             if number != 0:
-                await message.add_reaction(self._get_random_negative_emoji())
-                await message.channel.send("❌ New round! Please start counting from 0.")
-                return
+                return self._reject(game, message, "❌ New round! Please start counting from 0.")
             # Prevent last winner from starting new round using last_counter
-            if message.author.id == self.last_counter:
-                await message.add_reaction(self._get_random_negative_emoji())
-                await message.channel.send("❌ Winners can't start the next round! Give someone else a chance!")
-                return
+            if message.author.id == game.last_counter:
+                return self._reject(game, message, "❌ Winners can't start the next round! Give someone else a chance!")
             
         if number != expected_number:
-            await message.add_reaction(self._get_random_negative_emoji())
-            if self.current_count == -1:
-                await message.channel.send("❌ New round! Please start counting from 0.")
-            else:
-                await message.channel.send(f"❌ Wrong number! The last number counted was {self.current_count}.")
-            return
+            if game.current_count == -1:
+                return self._reject(game, message, "❌ New round! Please start counting from 0.")
+            return self._reject(game, message, f"❌ Wrong number! The last number counted was {game.current_count}.")
             
-        if message.author.id == self.last_counter:
-            await message.add_reaction(self._get_random_negative_emoji())
-            await message.channel.send("❌ Wait your turn!")
+        if message.author.id == game.last_counter:
+            return self._reject(game, message, "❌ Wait your turn!")
+
+        game.last_counter = message.author.id
+        game.current_count = number
+        if number == 0:
+            game.round_started_at = time.monotonic()
+        self.history.record_count(game, message.author.id, number)
+        
+        if number != game.target_number:
+            self._save_game_state(game)
+            return [partial(message.add_reaction, "🦆")]
+
+        streak = self._record_win(game, message.author.id)
+        duration = time.monotonic() - game.round_started_at if game.round_started_at else None
+        self.history.record_round(game, message.author.id, number + 1, duration)
+        game.round_no += 1
+        game.round_started_at = None
+
+        game.current_count = -1
+        game.target_number = self._generate_target()
+        # Keep last_counter to prevent winner from starting next round
+        self._save_game_state(game, flush=True)
+        return [partial(self._announce_win, game, message, streak)]
+
+    def _compose_win_announcement(self, message, streak, leaderboard):
+        """Build the whole win announcement as keyword arguments for a single send."""
+        lines = [
+            self._get_random_goose_gif(),
+            "🦢 HONK HONK! We have a winner!",
+            f"Congratulations {message.author.mention}, you are now the holder of the Silly Goose! 🎉",
+        ]
+        streak_msg = self._get_streak_message(streak, message.author.name)
+        if streak_msg:
+            lines.append(streak_msg)
+        if not isinstance(leaderboard, discord.Embed):
+            lines.append(leaderboard)
+        lines.append("New round starting! I'm a computer, so start at 0!")
+        return {
+            "content": "\n".join(lines),
+            "embed": leaderboard if isinstance(leaderboard, discord.Embed) else None,
+        }
+
+    async def _announce_win(self, game, message, streak):
+        """Send the win announcement for a round that has already been recorded.
+
+        By default this is one message; set COUNTING_WIN_STYLE=multi for the
+        original sequence of separate messages.
+        """
+        leaderboard = await self._show_leaderboard(game.guild_id)
+        if self.config.counting_win_style != "multi":
+            await message.channel.send(**self._compose_win_announcement(message, streak, leaderboard))
             return
 
-        self.last_counter = message.author.id
-        self.current_count = number
-        
-        if number == self.target_number:
-            self._record_win(message.author.id)
-            await message.channel.send(self._get_random_goose_gif())
-            await message.channel.send("🦢 HONK HONK! We have a winner!")
-            await message.channel.send(f"Congratulations {message.author.mention}, you are now the holder of the Silly Goose! 🎉")
-            
-            # Get current streak and show streak message BEFORE leaderboard
-            results = self.database.get_leaderboard_with_streaks(1)
-            if results and len(results) > 0:
-                _, _, streak = results[0]
-                streak_msg = self._get_streak_message(streak, message.author.name)
-                if streak_msg:
-                    await message.channel.send(streak_msg)
-            
-            leaderboard = await self._show_leaderboard(message.channel)
-            await message.channel.send(
-                content="" if isinstance(leaderboard, discord.Embed) else leaderboard,
-                embed=leaderboard if isinstance(leaderboard, discord.Embed) else None
-            )
-            
-            self.current_count = -1
-            self.target_number = self._generate_target()
-            # Keep last_counter to prevent winner from starting next round
-            await message.channel.send("New round starting! I'm a computer, so start at 0!")
-        else:
-            await message.add_reaction("🦆")
+        await message.channel.send(self._get_random_goose_gif())
+        await message.channel.send("🦢 HONK HONK! We have a winner!")
+        await message.channel.send(f"Congratulations {message.author.mention}, you are now the holder of the Silly Goose! 🎉")
+
+        streak_msg = self._get_streak_message(streak, message.author.name)
+        if streak_msg:
+            await message.channel.send(streak_msg)
         
-        self._save_game_state()
+        await message.channel.send(
+            content="" if isinstance(leaderboard, discord.Embed) else leaderboard,
+            embed=leaderboard if isinstance(leaderboard, discord.Embed) else None
+        )
+        await message.channel.send("New round starting! I'm a computer, so start at 0!")
 
     @app_commands.command(name="counting_new", description="Start a new counting game")        
     @app_commands.default_permissions(administrator=True)
     async def counting_new(self, interaction: discord.Interaction):
         """Start a new counting game."""
-        self.current_count = 0
-        self.target_number = self._generate_target()
-        self.last_counter = None
-        self._save_game_state()
+        game = self.games.get(interaction.channel_id)
+        if game is None:
+            await interaction.response.send_message(
+                "❌ Counting isn't enabled in this channel. Use `/counting_enable` first.",
+                ephemeral=True
+            )
+            return
+
+        game.current_count = 0
+        game.target_number = self._generate_target()
+        game.last_counter = None
+        self._save_game_state(game, flush=True)
         await interaction.response.send_message(
             "🎲 New counting game started! Begin at 0!"
         )
 
+    @app_commands.command(name="counting_enable", description="Enable the counting game in this channel")
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.guild_only()
+    async def counting_enable(self, interaction: discord.Interaction):
+        """Enable the counting game in the current channel."""
+        if interaction.channel_id in self.games:
+            await interaction.response.send_message("Counting is already enabled in this channel.", ephemeral=True)
+            return
+
+        game = self._enable_channel(interaction.channel_id, interaction.guild_id)
+        game.actor.start()
+        logger.info(f"Counting enabled in channel {interaction.channel_id} (guild {interaction.guild_id})")
+        message = ("🎲 Counting enabled! Begin counting at 0!" if game.current_count == -1
+                   else f"🎲 Counting re-enabled! Last number counted: `{game.current_count}`")
+        await interaction.response.send_message(message)
+
+    @app_commands.command(name="counting_disable", description="Disable the counting game in this channel")
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.guild_only()
+    async def counting_disable(self, interaction: discord.Interaction):
+        """Disable the counting game in the current channel, keeping its state and scores."""
+        game = self.games.pop(interaction.channel_id, None)
+        if game is None:
+            await interaction.response.send_message("Counting isn't enabled in this channel.", ephemeral=True)
+            return
+
+        game.actor.stop()
+        self.state_store.flush()
+        # Re-enabling numbers the next round from counting_rounds, so its
+        # finished rounds have to be there by then
+        self.history.flush()
+        self.database.disable_counting_channel(game.channel_id)
+        logger.info(f"Counting disabled in channel {game.channel_id}")
+        await interaction.response.send_message("🛑 Counting disabled in this channel. Scores are kept.")
+
     @app_commands.command(name="counting_leaderboard", description="Show the counting game leaderboard")
+    @app_commands.guild_only()
     async def counting_leaderboard(self, interaction: discord.Interaction):
-        """Display the leaderboard."""
+        """Display the server's leaderboard."""
         await interaction.response.defer()
-        leaderboard = await self._show_leaderboard(interaction.channel)
+        leaderboard = await self._show_leaderboard(interaction.guild_id)
         await interaction.followup.send(
             content="" if isinstance(leaderboard, discord.Embed) else leaderboard,
             embed=leaderboard if isinstance(leaderboard, discord.Embed) else None
         )
 
-async def setup(bot):
-    cfg = Config.load()
-    if not cfg.counting_channel_id:
-        raise RuntimeError(
-            "COUNTING_CHANNEL_ID is not set; counting game cannot identify its channel."
+    @app_commands.command(name="counting_stats", description="Show your counting game stats")
+    @app_commands.describe(member="Whose stats to show (defaults to you)")
+    @app_commands.guild_only()
+    async def counting_stats(self, interaction: discord.Interaction, member: Optional[discord.Member] = None):
+        """Display a player's counting stats in this server."""
+        member = member or interaction.user
+        self.history.flush()
+        counts, rounds_won, wins, best_streak = self.database.get_user_counting_stats(
+            interaction.guild_id, member.id
         )
+        server_counts = self.database.get_guild_counting_stats(interaction.guild_id)[0]
+        share = counts / server_counts * 100 if server_counts else 0
+
+        title, color, _, _ = self._get_rank_info(wins)
+        embed = discord.Embed(title=f"🦢 {member.display_name}'s Counting Stats", description=f"**{title}**", color=color)
+        embed.add_field(name="Numbers counted", value=f"{counts} ({share:.1f}% of the server)")
+        embed.add_field(name="Wins", value=str(wins))
+        embed.add_field(name="Best streak", value=str(best_streak))
+        await interaction.response.send_message(embed=embed)
+
+    @app_commands.command(name="counting_server_stats", description="Show this server's counting game stats")
+    @app_commands.guild_only()
+    async def counting_server_stats(self, interaction: discord.Interaction):
+        """Display the server's counting stats."""
+        await interaction.response.defer()
+        self.history.flush()
+        counts, rounds, total_length, timed_rounds, total_seconds = (
+            self.database.get_guild_counting_stats(interaction.guild_id)
+        )
+        top = self.database.get_top_counters(interaction.guild_id)
+
+        embed = discord.Embed(title="🦢 Server Counting Stats", color=discord.Color.blue())
+        embed.add_field(name="Numbers counted", value=str(counts))
+        embed.add_field(name="Rounds won", value=str(rounds))
+        if rounds:
+            embed.add_field(name="Average round", value=f"{total_length / rounds:.1f} numbers")
+        if timed_rounds:
+            embed.add_field(name="Average round time", value=f"{total_seconds / timed_rounds / 60:.1f} min")
+
+        if top:
+            names = await self.name_cache.resolve_many(user_id for user_id, _ in top)
+            embed.add_field(
+                name="Top counters",
+                value="\n".join(f"#{i} {names[user_id]}: {n}" for i, (user_id, n) in enumerate(top, 1)),
+                inline=False
+            )
+
+        shed = Counter()
+        for game in self.games.values():
+            if game.guild_id == interaction.guild_id:
+                shed.update(game.throttle.counters)
+        if shed:
+            embed.set_footer(
+                text=f"Since restart: {shed['dropped']} spam messages ignored, "
+                     f"{shed['react_only']} reacted to only, {shed['coalesced']} replies merged"
+            )
+        await interaction.followup.send(embed=embed)
+
+async def setup(bot):
     await bot.add_cog(CountingGame(bot))
     logger.info("✅ Counting game cog loaded")
@@ -0,0 +1,118 @@
+import logging
+import math
+import random
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+logger = logging.getLogger('counting_game')
+
+GIF_DIR = Path(__file__).parent.parent / "gifs"
+# GIFs listed here are never picked from any pool.
+DENY_LIST = "rejected"
+# How often pool files are checked for changes, and how many recent picks are avoided.
+RELOAD_CHECK_INTERVAL = 30  # seconds
+NO_REPEAT_WINDOW = 3
+
+
+class GifPool:
+    """One ``<name>-gifs.txt`` list held in memory.
+
+    Each line is a URL optionally followed by a weight (``<url> 3``); the
+    default weight is 1, which is also used (with a warning) when the weight
+    isn't a positive number. Picks avoid the last few GIFs chosen from the pool
+    when the pool is large enough to allow it.
+    """
+
+    def __init__(self, path: Path, no_repeat_window: int = NO_REPEAT_WINDOW):
+        self.path = path
+        self.mtime: Optional[float] = None
+        self.gifs: List[str] = []
+        self.weights: List[float] = []
+        self.recent = deque(maxlen=no_repeat_window)
+
+    def load_if_changed(self, deny: Set[str] = frozenset()) -> bool:
+        """Re-read the file if its mtime changed. Returns True if it was reloaded."""
+        try:
+            mtime = self.path.stat().st_mtime
+        except FileNotFoundError:
+            logger.error(f"GIF list {self.path} is missing")
+            return False
+        if mtime == self.mtime:
+            return False
+
+        gifs, weights = [], []
+        with open(self.path) as f:
+            for line_no, line in enumerate(f, 1):
+                parts = line.split()
+                if not parts or parts[0] in deny:
+                    continue
+                gifs.append(parts[0])
+                weights.append(self._weight(parts, line_no))
+        self.gifs, self.weights, self.mtime = gifs, weights, mtime
+        self.recent.clear()
+        logger.info(f"Loaded {len(gifs)} GIFs from {self.path.name}")
+        return True
+
+    def _weight(self, parts: List[str], line_no: int) -> float:
+        if len(parts) < 2:
+            return 1.0
+        try:
+            weight = float(parts[1])
+        except ValueError:
+            weight = None
+        if weight is None or not math.isfinite(weight) or weight <= 0:
+            logger.warning(f"{self.path.name}:{line_no}: bad weight {parts[1]!r}, using 1")
+            return 1.0
+        return weight
+
+    def choose(self) -> str:
+        if not self.gifs:
+            raise ValueError(f"GIF list {self.path.name} is empty")
+        candidates = [
+            (gif, weight) for gif, weight in zip(self.gifs, self.weights)
+            if gif not in self.recent
+        ] or list(zip(self.gifs, self.weights))
+        gifs, weights = zip(*candidates)
+        gif = random.choices(gifs, weights=weights)[0]
+        self.recent.append(gif)
+        return gif
+
+
+class GifRegistry:
+    """All GIF pools, loaded at startup and hot-reloaded when their files change.
+
+    File changes are noticed at most every RELOAD_CHECK_INTERVAL seconds, so
+    picking a GIF normally does no file I/O at all.
+    """
+
+    def __init__(self, directory: Path = GIF_DIR, check_interval: float = RELOAD_CHECK_INTERVAL):
+        self.directory = directory
+        self.check_interval = check_interval
+        self.deny_pool = GifPool(directory / f"{DENY_LIST}-gifs.txt")
+        self.pools: Dict[str, GifPool] = {
+            path.name[:-len("-gifs.txt")]: GifPool(path)
+            for path in sorted(directory.glob("*-gifs.txt"))
+            if path != self.deny_pool.path
+        }
+        self._next_check = 0.0
+        self._maybe_reload()
+
+    def _maybe_reload(self):
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        self._next_check = now + self.check_interval
+
+        deny_changed = self.deny_pool.load_if_changed()
+        deny = set(self.deny_pool.gifs)
+        for pool in self.pools.values():
+            if deny_changed:
+                pool.mtime = None  # re-filter against the new deny-list
+            pool.load_if_changed(deny)
+
+    def choose(self, name: str) -> str:
+        """Pick a GIF from the ``<name>-gifs.txt`` pool."""
+        self._maybe_reload()
+        return self.pools[name].choose()
@@ -0,0 +1,37 @@
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+
+from src.database.buffered import FLUSH_INTERVAL, BufferedAppender
+
+
+def _now():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+class CountingHistory(BufferedAppender):
+    """Buffers accepted counts and finished rounds for the counting history.
+
+    Each flush appends them together with the incremental stats rollups, so
+    nothing here is on the message path beyond a list append. History is
+    best effort; the game state itself is persisted by CountingStateStore.
+    """
+
+    description = "counting history"
+    logger = logging.getLogger('counting_game')
+
+    def __init__(self, database, flush_interval: float = FLUSH_INTERVAL):
+        super().__init__(buffers=2, flush_interval=flush_interval)
+        self.database = database
+        self.counts, self.rounds = self.buffers
+
+    def record_count(self, game, user_id: int, number: int):
+        self.counts.append((game.guild_id, game.channel_id, game.round_no, user_id, number, _now()))
+
+    def record_round(self, game, winner_id: int, length: int, duration: Optional[float]):
+        self.rounds.append(
+            (game.guild_id, game.channel_id, game.round_no, winner_id, length, duration, _now())
+        )
+
+    def _append(self, counts, rounds):
+        self.database.append_counting_history(counts, rounds)
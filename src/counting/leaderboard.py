@@ -0,0 +1,99 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Iterable, Optional
+
+import discord
+
+logger = logging.getLogger('counting_game')
+
+# How long resolved display names and rendered leaderboards are trusted.
+NAME_TTL = 3600  # seconds
+
+
+class NameCache:
+    """Resolves Discord user IDs to names with as few REST calls as possible.
+
+    Lookups go to the TTL cache first, then to the gateway user cache
+    (``bot.get_user``, no API call), and only the remaining misses are fetched,
+    concurrently.
+    """
+
+    def __init__(self, bot, ttl: float = NAME_TTL):
+        self.bot = bot
+        self.ttl = ttl
+        self.fetches = 0
+        self._names: Dict[int, tuple] = {}  # user_id -> (name, expires_at)
+
+    def _remember(self, user_id: int, name: str):
+        self._names[user_id] = (name, time.monotonic() + self.ttl)
+
+    async def _fetch(self, user_id: int) -> str:
+        self.fetches += 1
+        try:
+            user = await self.bot.fetch_user(user_id)
+            return user.name if user else f"Unknown User ({user_id})"
+        except discord.NotFound:
+            return f"Unknown User ({user_id})"
+
+    async def resolve_many(self, user_ids: Iterable[int]) -> Dict[int, str]:
+        now = time.monotonic()
+        names: Dict[int, str] = {}
+        misses = []
+        for user_id in user_ids:
+            cached = self._names.get(user_id)
+            if cached and cached[1] > now:
+                names[user_id] = cached[0]
+                continue
+            user = self.bot.get_user(user_id)
+            if user:
+                names[user_id] = user.name
+                self._remember(user_id, user.name)
+            else:
+                misses.append(user_id)
+
+        if misses:
+            fetched = await asyncio.gather(
+                *(self._fetch(user_id) for user_id in misses), return_exceptions=True
+            )
+            for user_id, name in zip(misses, fetched):
+                if isinstance(name, BaseException):
+                    logger.warning(f"Could not resolve user {user_id}: {name}")
+                    name = f"Unknown User ({user_id})"
+                else:
+                    self._remember(user_id, name)
+                names[user_id] = name
+        return names
+
+
+class LeaderboardCache:
+    """Holds the last rendered leaderboard until the scores change or it expires."""
+
+    def __init__(self, render: Callable[[], Awaitable], ttl: float = NAME_TTL):
+        self.render = render
+        self.ttl = ttl
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._cached = None
+        self._cached_version: Optional[int] = None
+        self._expires_at = 0.0
+
+    def invalidate(self):
+        """Call whenever counting_game_scores changes."""
+        self.version += 1
+
+    async def get(self):
+        if self._cached_version == self.version and time.monotonic() < self._expires_at:
+            self.hits += 1
+            return self._cached
+
+        self.misses += 1
+        version = self.version
+        rendered = await self.render()
+        # Only keep it if no score changed while we were rendering
+        if version == self.version:
+            self._cached = rendered
+            self._cached_version = version
+            self._expires_at = time.monotonic() + self.ttl
+        return rendered
@@ -0,0 +1,116 @@
+import asyncio
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+from src.database.counting_db import LEGACY_ID
+
+logger = logging.getLogger('counting_game')
+
+# How often coalesced state changes are written to SQLite.
+FLUSH_INTERVAL = 2.0  # seconds
+
+GameState = Tuple[int, int, Optional[int]]  # (current_count, target_number, last_counter)
+
+
+class CountingStateStore:
+    """Keeps every counting channel's state in memory and persists it behind the message path.
+
+    Every change is appended to a small JSON-lines journal (a plain write, no
+    fsync) so that a crash between flushes loses nothing. A background task
+    writes the latest state to SQLite every FLUSH_INTERVAL seconds and then
+    truncates the journal; callers can force a flush for important changes.
+    All channels changed since the last flush are written in one transaction.
+    Journal entries are full state snapshots, so replaying them is idempotent.
+    """
+
+    def __init__(self, database, journal_path: Path, flush_interval: float = FLUSH_INTERVAL):
+        self.database = database
+        self.journal_path = journal_path
+        self.flush_interval = flush_interval
+        self.states: Dict[int, GameState] = {}
+        self.flush_count = 0
+        self._dirty: Set[int] = set()
+        self._journal = None
+        self._task: Optional[asyncio.Task] = None
+
+    def load(self, legacy_channel_id: int = LEGACY_ID) -> Dict[int, GameState]:
+        """Load state from the database and replay any journal left by a crash.
+
+        Journal entries written before counting was per channel are applied to
+        ``legacy_channel_id``.
+        """
+        self.states = {
+            channel_id: (count, target, last)
+            for channel_id, count, target, last in self.database.get_game_states()
+        }
+        replayed = 0
+        if self.journal_path.exists():
+            with open(self.journal_path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn final line from a crash mid-write; everything before it is valid
+                        break
+                    channel_id = entry.get("channel_id", legacy_channel_id)
+                    self.states[channel_id] = (
+                        entry["current_count"], entry["target_number"], entry["last_counter"]
+                    )
+                    self._dirty.add(channel_id)
+                    replayed += 1
+        if replayed:
+            logger.info(f"Replayed {replayed} counting journal entries")
+            self.flush()
+        return self.states
+
+    def update(self, channel_id: int, current_count: int, target_number: int, last_counter: Optional[int]):
+        """Record a channel's new state in memory and in the journal."""
+        self.states[channel_id] = (current_count, target_number, last_counter)
+        if self._journal is None:
+            self._journal = open(self.journal_path, "a", buffering=1)
+        self._journal.write(json.dumps({
+            "channel_id": channel_id,
+            "current_count": current_count,
+            "target_number": target_number,
+            "last_counter": last_counter,
+        }) + "\n")
+        self._dirty.add(channel_id)
+
+    def flush(self):
+        """Write the latest state of changed channels to the database and clear the journal."""
+        if not self._dirty:
+            return
+        self.database.save_game_states(
+            [(channel_id, *self.states[channel_id]) for channel_id in self._dirty]
+        )
+        self._dirty.clear()
+        self.flush_count += 1
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        self.journal_path.unlink(missing_ok=True)
+
+    async def _flush_periodically(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to flush counting game state")
+
+    def start(self):
+        """Start the background flusher. Must be called from the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_periodically())
+
+    def close(self):
+        """Stop the flusher and persist any pending state."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self.flush()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
@@ -0,0 +1,72 @@
+import time
+from collections import Counter
+from typing import Dict
+
+# Invalid messages a single user may have answered before being ignored,
+# and how quickly that allowance refills.
+USER_BURST = 3
+USER_REFILL_PER_SECOND = 1 / 10
+# Invalid messages per channel that get a reply before they only get a reaction.
+CHANNEL_BURST = 10
+CHANNEL_REFILL_PER_SECOND = 1 / 2
+# Error replies produced within this window are sent as one message.
+REPLY_WINDOW = 3.0  # seconds
+# Forget idle users once this many are being tracked in a channel
+MAX_TRACKED_USERS = 1000
+
+
+class TokenBucket:
+    """Classic token bucket: ``capacity`` tokens, refilled at ``rate`` tokens per second."""
+
+    def __init__(self, capacity: float, rate: float):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def take(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class RejectionThrottle:
+    """Decides how much Discord traffic an invalid counting message may cost.
+
+    Valid counts never pass through here. For invalid ones ``check`` returns:
+
+    * ``"reply"``    - react and send the error reply (coalesced per window)
+    * ``"react"``    - the channel is noisy: react only, no reply
+    * ``"drop"``     - this user is spamming: ignore the message entirely
+    """
+
+    def __init__(self):
+        self.channel_bucket = TokenBucket(CHANNEL_BURST, CHANNEL_REFILL_PER_SECOND)
+        self.user_buckets: Dict[int, TokenBucket] = {}
+        self.counters = Counter()
+
+    def check(self, user_id: int) -> str:
+        if len(self.user_buckets) > MAX_TRACKED_USERS:
+            self.prune()
+        bucket = self.user_buckets.get(user_id)
+        if bucket is None:
+            bucket = self.user_buckets[user_id] = TokenBucket(USER_BURST, USER_REFILL_PER_SECOND)
+        if not bucket.take():
+            self.counters["dropped"] += 1
+            return "drop"
+        if not self.channel_bucket.take():
+            self.counters["react_only"] += 1
+            return "react"
+        return "reply"
+
+    def prune(self):
+        """Forget users whose bucket has fully refilled."""
+        now = time.monotonic()
+        self.user_buckets = {
+            user_id: bucket for user_id, bucket in self.user_buckets.items()
+            if bucket.tokens + (now - bucket.updated) * bucket.rate < bucket.capacity
+        }
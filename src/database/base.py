@@ -71,6 +71,10 @@ class BaseDatabase:
         # Let subclasses create their tables
         raise NotImplementedError("Subclasses must implement create_tables()")
 
+    def _columns(self, table):
+        """Column names of a table, or an empty list if it doesn't exist."""
+        return [row[1] for row in self._execute(f"PRAGMA table_info({table})")]
+
     def _execute(self, sql, params=None):
         """Execute SQL and return results."""
         with self.transaction() as cursor:
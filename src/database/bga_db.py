@@ -2,6 +2,7 @@ import logging
 import sqlite3
 from collections import namedtuple
 from .base import BaseDatabase
+from .. import utils
 
 Game = namedtuple("Game", ["id", "url", "name", "activePlayerId"])
 
@@ -43,6 +44,12 @@ class BGADatabase(BaseDatabase):
         
         # Handle migration from old dm_enabled to new notification system
         self._migrate_dm_preferences()
+
+        # Collapse URL variants of the same table before enforcing uniqueness
+        self._dedupe_game_urls()
+        self._execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_game_data_url ON game_data(url)"
+        )
         
         logging.info("[DATABASE] BGA tables checked/created successfully.")
 
@@ -68,6 +75,50 @@ class BGADatabase(BaseDatabase):
         except Exception as e:
             logging.error(f"[DATABASE] Error migrating DM preferences: {e}")
 
+    def _dedupe_game_urls(self):
+        """Rewrite game URLs to canonical form and merge rows for the same table.
+
+        Rows whose URL has no table ID are only de-duplicated by exact URL. For each
+        table the row already keyed by the table ID wins; otherwise the oldest row
+        is re-keyed.
+        """
+        rows = self._execute("SELECT id, url, game_name FROM game_data ORDER BY id")
+        all_ids = {row[0] for row in rows}
+        by_table = {}
+        unparsed = {}
+        for row_id, url, game_name in rows:
+            canonical = utils.canonicalizeTableUrl(url) if url else None
+            if canonical is None:
+                if url:
+                    unparsed.setdefault(url, []).append(row_id)
+                continue
+            table_id = int(utils.extractGameId(canonical))
+            by_table.setdefault(table_id, []).append((row_id, url, game_name, canonical))
+
+        merged = 0
+        with self.transaction() as cursor:
+            for row_ids in unparsed.values():
+                for row_id in row_ids[1:]:
+                    cursor.execute("DELETE FROM game_data WHERE id = ?", (row_id,))
+                    merged += 1
+            for table_id, variants in by_table.items():
+                keeper = next((v for v in variants if v[0] == table_id), variants[0])
+                for row_id, *_ in variants:
+                    if row_id != keeper[0]:
+                        cursor.execute("DELETE FROM game_data WHERE id = ?", (row_id,))
+                        merged += 1
+                row_id, url, game_name, canonical = keeper
+                if row_id != table_id and table_id in all_ids and not any(v[0] == table_id for v in variants):
+                    table_id = row_id  # ID taken by an unrelated row; only fix the URL
+                if row_id != table_id or url != canonical:
+                    game_name = game_name or next((v[2] for v in variants if v[2]), None)
+                    cursor.execute(
+                        "UPDATE game_data SET id = ?, url = ?, game_name = ? WHERE id = ?",
+                        (table_id, canonical, game_name, row_id)
+                    )
+        if merged:
+            logging.info(f"[DATABASE] Merged {merged} duplicate game rows")
+
     def set_notification_preferences(self, discord_id: int, channel: bool, dm: bool):
         """Set notification preferences for a user."""
         if not self.get_user_settings(discord_id):
@@ -150,6 +201,27 @@ class BGADatabase(BaseDatabase):
         except sqlite3.Error as e:
             logging.error(f"[DATABASE ERROR] {e}")
 
+    def insert_games(self, games):
+        """Adds several game entries in one transaction, skipping ones already tracked.
+
+        ``games`` is a list of ``(id, url, game_name, active_player_id)`` tuples.
+        Returns the IDs of the games actually inserted: a game someone else
+        started tracking in the meantime is skipped and left out.
+        """
+        inserted = []
+        if not games:
+            return inserted
+        with self.transaction() as cursor:
+            for game in games:
+                cursor.execute(
+                    "INSERT OR IGNORE INTO game_data (id, url, game_name, active_player_id) VALUES (?, ?, ?, ?)",
+                    game
+                )
+                if cursor.rowcount:
+                    inserted.append(game[0])
+        logging.info(f"[DATABASE] {len(inserted)} of {len(games)} games added.")
+        return inserted
+
     def delete_game_data(self, id):
         """Removes a game entry."""
         self._execute("DELETE FROM game_data WHERE id = ?", (id,))
@@ -163,6 +235,29 @@ class BGADatabase(BaseDatabase):
         )
         logging.info(f"[DATABASE] Game {id} updated: Active Player → {active_player_id}.")
 
+    def apply_poll_results(self, active_players, finished_ids):
+        """Applies a poll cycle's active player changes and removals in one transaction.
+
+        ``active_players`` is a list of ``(game_id, active_player_id)`` pairs and
+        ``finished_ids`` a list of game IDs to stop tracking.
+        """
+        if not active_players and not finished_ids:
+            return
+        with self.transaction() as cursor:
+            if active_players:
+                cursor.executemany(
+                    "UPDATE game_data SET active_player_id = ? WHERE id = ?",
+                    [(player_id, game_id) for game_id, player_id in active_players]
+                )
+            if finished_ids:
+                cursor.executemany(
+                    "DELETE FROM game_data WHERE id = ?",
+                    [(game_id,) for game_id in finished_ids]
+                )
+        logging.info(
+            f"[DATABASE] Flushed poll results: {len(active_players)} updated, {len(finished_ids)} removed."
+        )
+
     def get_active_player(self, id):
         """Retrieves the active player ID for a game."""
         results = self._execute("SELECT active_player_id FROM game_data WHERE id = ?", (id,))
@@ -0,0 +1,69 @@
+import asyncio
+import logging
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# How often buffered rows are appended to SQLite.
+FLUSH_INTERVAL = 5.0  # seconds
+
+
+class BufferedAppender:
+    """Buffers rows in memory and appends them to the database in batches.
+
+    Recording a row is only a list append; a background task hands
+    everything buffered since the last flush to ``_append``, which should
+    write it in one transaction. A batch that fails is put back and retried
+    by the next flush. This is for best-effort records such as history and
+    audit rows: whatever is buffered when the bot crashes is lost.
+
+    Subclasses choose how many separate buffers they keep (one per kind of
+    row) and implement ``_append(*batches)``, one batch per buffer.
+    """
+
+    # What the rows are, and where failed flushes are logged
+    description = "buffered rows"
+    logger = logger
+
+    def __init__(self, buffers: int = 1, flush_interval: float = FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        # Cleared in place, so subclasses can keep their own names for them
+        self.buffers: List[List[tuple]] = [[] for _ in range(buffers)]
+        self._task: Optional[asyncio.Task] = None
+
+    def _append(self, *batches: List[tuple]):
+        raise NotImplementedError
+
+    def flush(self):
+        """Append everything buffered so far."""
+        if not any(self.buffers):
+            return
+        batches = [list(buffer) for buffer in self.buffers]
+        for buffer in self.buffers:
+            buffer.clear()
+        try:
+            self._append(*batches)
+        except Exception:
+            for buffer, batch in zip(self.buffers, batches):
+                buffer[:0] = batch
+            raise
+
+    async def _flush_periodically(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception:
+                self.logger.exception(f"Failed to append {self.description}")
+
+    def start(self):
+        """Start the background flusher. Must be called from the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_periodically())
+
+    def close(self):
+        """Stop the flusher and append anything still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self.flush()
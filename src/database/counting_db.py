@@ -1,95 +1,386 @@
+import logging
+from collections import Counter
+
 from .base import BaseDatabase
 
+# channel_id / guild_id given to data migrated from the single-channel schema
+# until the configured counting channel (and its guild) claims it.
+LEGACY_ID = 0
+
 class CountingDatabase(BaseDatabase):
     """Database operations for the counting game."""
-    
+
     def create_tables(self):
         """Creates counting game tables and handles schema migrations."""
-        # Create base tables
-        self._execute('''
-            CREATE TABLE IF NOT EXISTS counting_game_state (
-                id INTEGER PRIMARY KEY,
-                current_count INTEGER NOT NULL,
-                target_number INTEGER NOT NULL,
-                last_counter INTEGER
-            )
-        ''')
-        
-        self._execute('''
-            CREATE TABLE IF NOT EXISTS counting_game_scores (
-                user_id INTEGER PRIMARY KEY,
-                wins INTEGER NOT NULL DEFAULT 0
-            )
-        ''')
-        
-        # Check if win_streak column exists
-        results = self._execute("PRAGMA table_info(counting_game_scores)")
-        columns = [row[1] for row in results]
-        
-        # Add win_streak column if it doesn't exist
-        if 'win_streak' not in columns:
+        with self.transaction():
             self._execute('''
-                ALTER TABLE counting_game_scores 
-                ADD COLUMN win_streak INTEGER NOT NULL DEFAULT 0
+                CREATE TABLE IF NOT EXISTS counting_channels (
+                    channel_id INTEGER PRIMARY KEY,
+                    guild_id INTEGER NOT NULL,
+                    enabled INTEGER NOT NULL DEFAULT 1,
+                    current_count INTEGER NOT NULL DEFAULT -1,
+                    target_number INTEGER NOT NULL,
+                    last_counter INTEGER
+                )
             ''')
 
-    def get_game_state(self):
-        """Get current game state."""
-        results = self._execute(
-            "SELECT current_count, target_number, last_counter FROM counting_game_state WHERE id = 1"
-        )
-        return results[0] if results else None
+            # Single-row state from before counting was per channel
+            if self._columns('counting_game_state'):
+                self._execute('''
+                    INSERT OR IGNORE INTO counting_channels
+                        (channel_id, guild_id, enabled, current_count, target_number, last_counter)
+                    SELECT ?, ?, 1, current_count, target_number, last_counter
+                    FROM counting_game_state WHERE id = 1
+                ''', (LEGACY_ID, LEGACY_ID))
+                self._execute('DROP TABLE counting_game_state')
 
-    def save_game_state(self, current_count, target_number, last_counter):
-        """Save current game state."""
-        self._execute(
-            """INSERT OR REPLACE INTO counting_game_state (id, current_count, target_number, last_counter)
-            VALUES (1, ?, ?, ?)""",
-            (current_count, target_number, last_counter)
+            score_columns = self._columns('counting_game_scores')
+            streak_columns = self._columns('counting_streak')
+
+            # The current streak is a holder + length record per guild, so a win
+            # never has to touch other players' rows.
+            if 'guild_id' not in streak_columns:
+                self._execute('''
+                    CREATE TABLE counting_streak_new (
+                        guild_id INTEGER PRIMARY KEY,
+                        holder_id INTEGER,
+                        length INTEGER NOT NULL DEFAULT 0
+                    )
+                ''')
+                if streak_columns:
+                    self._execute('''
+                        INSERT INTO counting_streak_new (guild_id, holder_id, length)
+                        SELECT ?, holder_id, length FROM counting_streak
+                    ''', (LEGACY_ID,))
+                    self._execute('DROP TABLE counting_streak')
+                elif 'win_streak' in score_columns:
+                    self._execute('''
+                        INSERT INTO counting_streak_new (guild_id, holder_id, length)
+                        SELECT ?, user_id, win_streak FROM counting_game_scores
+                        WHERE win_streak > 0 ORDER BY win_streak DESC LIMIT 1
+                    ''', (LEGACY_ID,))
+                self._execute('ALTER TABLE counting_streak_new RENAME TO counting_streak')
+
+            if 'guild_id' not in score_columns:
+                self._execute('''
+                    CREATE TABLE counting_game_scores_new (
+                        guild_id INTEGER NOT NULL,
+                        user_id INTEGER NOT NULL,
+                        wins INTEGER NOT NULL DEFAULT 0,
+                        best_streak INTEGER NOT NULL DEFAULT 0,
+                        PRIMARY KEY (guild_id, user_id)
+                    )
+                ''')
+                if score_columns:
+                    best_streak = next(
+                        (col for col in ('best_streak', 'win_streak') if col in score_columns), '0'
+                    )
+                    self._execute(f'''
+                        INSERT INTO counting_game_scores_new (guild_id, user_id, wins, best_streak)
+                        SELECT ?, user_id, wins, {best_streak} FROM counting_game_scores
+                    ''', (LEGACY_ID,))
+                    self._execute('DROP TABLE counting_game_scores')
+                self._execute('ALTER TABLE counting_game_scores_new RENAME TO counting_game_scores')
+
+            self._execute('''
+                CREATE INDEX IF NOT EXISTS idx_counting_scores_guild_wins
+                ON counting_game_scores(guild_id, wins DESC)
+            ''')
+
+            # Append-only history of accepted counts and finished rounds
+            self._execute('''
+                CREATE TABLE IF NOT EXISTS counting_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    guild_id INTEGER NOT NULL,
+                    channel_id INTEGER NOT NULL,
+                    round_no INTEGER NOT NULL,
+                    user_id INTEGER NOT NULL,
+                    number INTEGER NOT NULL,
+                    counted_at TIMESTAMP NOT NULL
+                )
+            ''')
+            self._execute('''
+                CREATE INDEX IF NOT EXISTS idx_counting_history_user
+                ON counting_history(guild_id, user_id)
+            ''')
+            self._execute('''
+                CREATE INDEX IF NOT EXISTS idx_counting_history_round
+                ON counting_history(channel_id, round_no)
+            ''')
+            self._execute('''
+                CREATE TABLE IF NOT EXISTS counting_rounds (
+                    channel_id INTEGER NOT NULL,
+                    round_no INTEGER NOT NULL,
+                    guild_id INTEGER NOT NULL,
+                    winner_id INTEGER NOT NULL,
+                    length INTEGER NOT NULL,
+                    duration_seconds REAL,
+                    ended_at TIMESTAMP NOT NULL,
+                    PRIMARY KEY (channel_id, round_no)
+                )
+            ''')
+
+            # Rollups kept up to date as history is appended, so stats never scan it
+            self._execute('''
+                CREATE TABLE IF NOT EXISTS counting_user_stats (
+                    guild_id INTEGER NOT NULL,
+                    user_id INTEGER NOT NULL,
+                    counts INTEGER NOT NULL DEFAULT 0,
+                    rounds_won INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (guild_id, user_id)
+                )
+            ''')
+            self._execute('''
+                CREATE INDEX IF NOT EXISTS idx_counting_user_stats_counts
+                ON counting_user_stats(guild_id, counts DESC)
+            ''')
+            self._execute('''
+                CREATE TABLE IF NOT EXISTS counting_guild_stats (
+                    guild_id INTEGER PRIMARY KEY,
+                    counts INTEGER NOT NULL DEFAULT 0,
+                    rounds INTEGER NOT NULL DEFAULT 0,
+                    total_round_length INTEGER NOT NULL DEFAULT 0,
+                    timed_rounds INTEGER NOT NULL DEFAULT 0,
+                    total_round_seconds REAL NOT NULL DEFAULT 0
+                )
+            ''')
+
+    # Channels
+    def get_counting_channels(self):
+        """Get (channel_id, guild_id, current_count, target_number, last_counter) for enabled channels."""
+        return self._execute(
+            """SELECT channel_id, guild_id, current_count, target_number, last_counter
+            FROM counting_channels WHERE enabled = 1"""
         )
 
-    def reset_other_streaks(self, winner_id):
-        """Reset win streaks for all players except the winner."""
+    def enable_counting_channel(self, channel_id, guild_id, target_number):
+        """Enable counting in a channel, keeping its state if it was enabled before."""
         self._execute(
-            """UPDATE counting_game_scores 
-            SET win_streak = 0 
-            WHERE user_id != ?""",
-            (winner_id,)
+            """INSERT INTO counting_channels (channel_id, guild_id, enabled, current_count, target_number)
+            VALUES (?, ?, 1, -1, ?)
+            ON CONFLICT(channel_id) DO UPDATE SET enabled = 1, guild_id = excluded.guild_id""",
+            (channel_id, guild_id, target_number)
+        )
+        results = self._execute(
+            """SELECT current_count, target_number, last_counter
+            FROM counting_channels WHERE channel_id = ?""",
+            (channel_id,)
         )
+        return results[0]
 
-    def record_win_and_increment_streak(self, user_id):
-        """Record a win and increment streak for the user."""
-        self._execute(
-            """INSERT INTO counting_game_scores (user_id, wins, win_streak)
-            VALUES (?, 1, 1)
-            ON CONFLICT(user_id) DO UPDATE 
-            SET wins = wins + 1,
-                win_streak = win_streak + 1""",
-            (user_id,)
+    def disable_counting_channel(self, channel_id):
+        """Disable counting in a channel. Its state and the guild's scores are kept."""
+        self._execute("UPDATE counting_channels SET enabled = 0 WHERE channel_id = ?", (channel_id,))
+
+    def claim_legacy_counting(self, channel_id, guild_id=None):
+        """Attach data migrated from the single-channel schema to its channel and guild.
+
+        The channel can be claimed at startup from configuration; the guild is
+        claimed once it is known (``guild_id``), merging any legacy scores into it.
+        """
+        with self.transaction() as cursor:
+            cursor.execute(
+                """UPDATE OR IGNORE counting_channels SET channel_id = ?
+                WHERE channel_id = ?""",
+                (channel_id, LEGACY_ID)
+            )
+            cursor.execute("DELETE FROM counting_channels WHERE channel_id = ?", (LEGACY_ID,))
+            if guild_id is None:
+                return
+            cursor.execute(
+                "UPDATE counting_channels SET guild_id = ? WHERE channel_id = ? AND guild_id = ?",
+                (guild_id, channel_id, LEGACY_ID)
+            )
+            cursor.execute(
+                """INSERT INTO counting_game_scores (guild_id, user_id, wins, best_streak)
+                SELECT ?, user_id, wins, best_streak FROM counting_game_scores WHERE guild_id = ?
+                ON CONFLICT(guild_id, user_id) DO UPDATE
+                SET wins = wins + excluded.wins,
+                    best_streak = MAX(best_streak, excluded.best_streak)""",
+                (guild_id, LEGACY_ID)
+            )
+            cursor.execute("DELETE FROM counting_game_scores WHERE guild_id = ?", (LEGACY_ID,))
+            cursor.execute(
+                "UPDATE OR IGNORE counting_streak SET guild_id = ? WHERE guild_id = ?",
+                (guild_id, LEGACY_ID)
+            )
+            cursor.execute("DELETE FROM counting_streak WHERE guild_id = ?", (LEGACY_ID,))
+
+    # Game state
+    def get_game_states(self):
+        """Get (channel_id, current_count, target_number, last_counter) for enabled channels."""
+        return self._execute(
+            """SELECT channel_id, current_count, target_number, last_counter
+            FROM counting_channels WHERE enabled = 1"""
         )
 
-    def record_win(self, user_id):
+    def save_game_states(self, states):
+        """Save game state for several channels in one transaction.
+
+        ``states`` is a list of ``(channel_id, current_count, target_number, last_counter)``.
+        """
+        with self.transaction() as cursor:
+            cursor.executemany(
+                """UPDATE counting_channels
+                SET current_count = ?, target_number = ?, last_counter = ?
+                WHERE channel_id = ?""",
+                [(count, target, last, channel_id) for channel_id, count, target, last in states]
+            )
+
+    # Scores
+    def record_win_and_increment_streak(self, guild_id, user_id):
+        """Record a win, extend or take over the guild's current streak, and return its length."""
+        with self.transaction() as cursor:
+            cursor.execute(
+                """INSERT INTO counting_streak (guild_id, holder_id, length)
+                VALUES (?, ?, 1)
+                ON CONFLICT(guild_id) DO UPDATE
+                SET length = CASE WHEN holder_id = excluded.holder_id THEN length + 1 ELSE 1 END,
+                    holder_id = excluded.holder_id""",
+                (guild_id, user_id)
+            )
+            cursor.execute("SELECT length FROM counting_streak WHERE guild_id = ?", (guild_id,))
+            streak = cursor.fetchone()[0]
+            cursor.execute(
+                """INSERT INTO counting_game_scores (guild_id, user_id, wins, best_streak)
+                VALUES (?, ?, 1, ?)
+                ON CONFLICT(guild_id, user_id) DO UPDATE
+                SET wins = wins + 1,
+                    best_streak = MAX(best_streak, excluded.best_streak)""",
+                (guild_id, user_id, streak)
+            )
+        return streak
+
+    def record_win(self, guild_id, user_id):
         """Record a win for the user."""
         self._execute(
-            """INSERT INTO counting_game_scores (user_id, wins)
-            VALUES (?, 1)
-            ON CONFLICT(user_id) DO UPDATE SET wins = wins + 1""",
-            (user_id,)
+            """INSERT INTO counting_game_scores (guild_id, user_id, wins)
+            VALUES (?, ?, 1)
+            ON CONFLICT(guild_id, user_id) DO UPDATE SET wins = wins + 1""",
+            (guild_id, user_id)
         )
 
-    def get_leaderboard(self, limit=10):
+    def get_leaderboard(self, guild_id, limit=10):
         """Get top winners."""
         return self._execute(
-            """SELECT user_id, wins FROM counting_game_scores 
-            ORDER BY wins DESC LIMIT ?""",
-            (limit,)
+            """SELECT user_id, wins FROM counting_game_scores
+            WHERE guild_id = ? ORDER BY wins DESC LIMIT ?""",
+            (guild_id, limit)
+        )
+
+    def get_leaderboard_with_streaks(self, guild_id, limit=10):
+        """Get top winners with their current streak (0 unless they hold it)."""
+        return self._execute(
+            """SELECT s.user_id, s.wins,
+                   CASE WHEN s.user_id = k.holder_id THEN k.length ELSE 0 END
+            FROM counting_game_scores s
+            LEFT JOIN counting_streak k ON k.guild_id = s.guild_id
+            WHERE s.guild_id = ?
+            ORDER BY s.wins DESC LIMIT ?""",
+            (guild_id, limit)
+        )
+
+    # History and stats
+    def get_next_round_no(self, channel_id):
+        """Round number for the round currently being played in a channel."""
+        results = self._execute(
+            "SELECT MAX(round_no) FROM counting_rounds WHERE channel_id = ?",
+            (channel_id,)
+        )
+        return (results[0][0] or 0) + 1
+
+    def append_counting_history(self, counts, rounds):
+        """Append counts and finished rounds and update the rollups, in one transaction.
+
+        ``counts`` holds ``(guild_id, channel_id, round_no, user_id, number, counted_at)``
+        and ``rounds`` holds ``(guild_id, channel_id, round_no, winner_id, length,
+        duration_seconds, ended_at)`` tuples. A round whose (channel_id, round_no)
+        is already stored is dropped and left out of the rollups, so they keep
+        matching counting_rounds.
+        """
+        if not counts and not rounds:
+            return
+
+        user_counts = Counter((count[0], count[3]) for count in counts)
+        guild_totals = {}
+        for guild_id, *_ in counts:
+            guild_totals.setdefault(guild_id, [0, 0, 0, 0, 0.0])[0] += 1
+
+        with self.transaction() as cursor:
+            cursor.executemany(
+                """INSERT INTO counting_history
+                (guild_id, channel_id, round_no, user_id, number, counted_at)
+                VALUES (?, ?, ?, ?, ?, ?)""",
+                counts
+            )
+            user_wins = Counter()
+            for rnd in rounds:
+                cursor.execute(
+                    """INSERT OR IGNORE INTO counting_rounds
+                    (guild_id, channel_id, round_no, winner_id, length, duration_seconds, ended_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                    rnd
+                )
+                guild_id, channel_id, round_no, winner_id, length, duration, _ = rnd
+                if cursor.rowcount == 0:
+                    logging.warning(f"Round {round_no} of channel {channel_id} is already recorded; dropping it")
+                    continue
+                user_wins[(guild_id, winner_id)] += 1
+                totals = guild_totals.setdefault(guild_id, [0, 0, 0, 0, 0.0])
+                totals[1] += 1
+                totals[2] += length
+                if duration is not None:
+                    totals[3] += 1
+                    totals[4] += duration
+            cursor.executemany(
+                """INSERT INTO counting_user_stats (guild_id, user_id, counts, rounds_won)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(guild_id, user_id) DO UPDATE
+                SET counts = counts + excluded.counts,
+                    rounds_won = rounds_won + excluded.rounds_won""",
+                [
+                    (guild_id, user_id, user_counts[(guild_id, user_id)], user_wins[(guild_id, user_id)])
+                    for guild_id, user_id in user_counts.keys() | user_wins.keys()
+                ]
+            )
+            cursor.executemany(
+                """INSERT INTO counting_guild_stats
+                (guild_id, counts, rounds, total_round_length, timed_rounds, total_round_seconds)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(guild_id) DO UPDATE
+                SET counts = counts + excluded.counts,
+                    rounds = rounds + excluded.rounds,
+                    total_round_length = total_round_length + excluded.total_round_length,
+                    timed_rounds = timed_rounds + excluded.timed_rounds,
+                    total_round_seconds = total_round_seconds + excluded.total_round_seconds""",
+                [(guild_id, *totals) for guild_id, totals in guild_totals.items()]
+            )
+
+    def get_user_counting_stats(self, guild_id, user_id):
+        """Get (counts, rounds_won, wins, best_streak) for a user in a guild."""
+        results = self._execute(
+            """SELECT COALESCE(u.counts, 0), COALESCE(u.rounds_won, 0),
+                   COALESCE(s.wins, 0), COALESCE(s.best_streak, 0)
+            FROM (SELECT ? AS guild_id, ? AS user_id) k
+            LEFT JOIN counting_user_stats u ON u.guild_id = k.guild_id AND u.user_id = k.user_id
+            LEFT JOIN counting_game_scores s ON s.guild_id = k.guild_id AND s.user_id = k.user_id""",
+            (guild_id, user_id)
+        )
+        return results[0]
+
+    def get_guild_counting_stats(self, guild_id):
+        """Get (counts, rounds, total_round_length, timed_rounds, total_round_seconds) for a guild."""
+        results = self._execute(
+            """SELECT counts, rounds, total_round_length, timed_rounds, total_round_seconds
+            FROM counting_guild_stats WHERE guild_id = ?""",
+            (guild_id,)
         )
+        return results[0] if results else (0, 0, 0, 0, 0.0)
 
-    def get_leaderboard_with_streaks(self, limit=10):
-        """Get top winners with their streak information."""
+    def get_top_counters(self, guild_id, limit=5):
+        """Get (user_id, counts) of the guild's most active counters."""
         return self._execute(
-            """SELECT user_id, wins, win_streak 
-            FROM counting_game_scores 
-            ORDER BY wins DESC LIMIT ?""",
-            (limit,)
+            """SELECT user_id, counts FROM counting_user_stats
+            WHERE guild_id = ? ORDER BY counts DESC LIMIT ?""",
+            (guild_id, limit)
         )
@@ -1,5 +1,6 @@
 import logging
 import sqlite3
+from datetime import datetime, timezone
 
 from .base import BaseDatabase
 
@@ -10,438 +11,769 @@ file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelnam
 host_logger.addHandler(file_handler)
 host_logger.setLevel(logging.INFO)
 
+# Rotation order is stored as sparse sort keys, so reordering rewrites only the
+# moved host. New keys are placed SORT_KEY_STEP apart; moving a host between
+# two others takes the midpoint, and the keys are spread out again only once
+# such a gap gets narrower than MIN_SORT_KEY_GAP.
+SORT_KEY_STEP = 1024.0
+MIN_SORT_KEY_GAP = 1e-6
+
+# Every guild has these rotations; /host_* commands use the first, /host2_* the second.
+VENUE_ROTATION = "venue"
+GAME_ROTATION = "game"
+DEFAULT_ROTATIONS = (VENUE_ROTATION, GAME_ROTATION)
+
+# guild_id given to rotations migrated from the single-table schema until the
+# first guild to use them claims them.
+LEGACY_GUILD_ID = 0
+
+# SQL fragments used inside rotation_member statements
+LAST_KEY_SQL = "COALESCE(MAX(sort_key), 0)"
+
+# How audit and schedule times are stored (always UTC)
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+def utc_timestamp(moment=None):
+    """``moment`` (default: now) as stored in rotation_audit and rotation_schedule."""
+    return (moment or datetime.now(timezone.utc)).astimezone(timezone.utc).strftime(TIMESTAMP_FORMAT)
+
+# Rows per multi-row INSERT, well under SQLite's bound-parameter limit
+BULK_CHUNK_SIZE = 200
+
+def _chunks(items, size):
+    for offset in range(0, len(items), size):
+        yield items[offset:offset + size]
+
+# Columns behind the host dicts returned for a rotation's active members
+HOST_COLUMNS_SQL = (
+    "m.discord_id, h.username, ROW_NUMBER() OVER (ORDER BY m.sort_key ASC), m.last_hosted"
+)
+
+def _host_dict(row):
+    discord_id, username, position, last_hosted = row
+    return {
+        "discord_id": discord_id,
+        "username": username,
+        "position": position,
+        "last_hosted": last_hosted,
+    }
+
+class RotationConflict(Exception):
+    """The rotation changed since the version the caller based its change on."""
+
+    def __init__(self, rotation_id, expected_version):
+        super().__init__(f"Rotation {rotation_id} is no longer at version {expected_version}")
+        self.rotation_id = rotation_id
+        self.expected_version = expected_version
+
+class _Unchanged(Exception):
+    """Raised inside a rotation change to roll it back and return ``result`` instead."""
+
+    def __init__(self, result):
+        super().__init__(result)
+        self.result = result
+
 class HostingDatabase(BaseDatabase):
-    """Hosting-specific database operations."""
+    """Hosting-specific database operations.
+
+    A guild can have any number of named rotations. Members of a rotation are
+    ordered by ``sort_key``; snoozed members stay in the rotation with
+    ``active = 0`` and are skipped.
+    """
+
+    def __init__(self, db_file):
+        super().__init__(db_file)
+        # Called with a rotation_id after every committed change to that rotation
+        self.rotation_listeners = []
+        # Called with the audit rows of every committed audited change, see _mutate
+        self.audit_listeners = []
+
+    def _rotation_changed(self, rotation_id):
+        for listener in self.rotation_listeners:
+            listener(rotation_id)
 
     def create_tables(self):
         """Creates or updates hosting rotation tables."""
-        # Check if hosting_rotation table exists and get its columns
-        results = self._execute("PRAGMA table_info(hosting_rotation)")
-        existing_columns = [row[1] for row in results] if results else []
-        
-        if not existing_columns:
-            # Create new table if it doesn't exist
+        with self.transaction():
+            self._execute('''
+                CREATE TABLE IF NOT EXISTS hosts (
+                    discord_id TEXT PRIMARY KEY,
+                    username TEXT NOT NULL
+                )
+            ''')
             self._execute('''
-                CREATE TABLE hosting_rotation (
+                CREATE TABLE IF NOT EXISTS rotation (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    guild_id INTEGER NOT NULL,
+                    name TEXT NOT NULL,
+                    version INTEGER NOT NULL DEFAULT 0,
+                    UNIQUE (guild_id, name)
+                )
+            ''')
+            self._execute('''
+                CREATE TABLE IF NOT EXISTS rotation_member (
+                    rotation_id INTEGER NOT NULL,
                     discord_id TEXT NOT NULL,
-                    username TEXT NOT NULL,
-                    venue_position INTEGER,
-                    game_position INTEGER,
-                    last_venue_hosted DATE,
-                    last_game_hosted DATE,
-                    venue_active INTEGER DEFAULT 0,
-                    game_active INTEGER DEFAULT 0
+                    sort_key REAL NOT NULL,
+                    active INTEGER NOT NULL DEFAULT 1,
+                    last_hosted DATE,
+                    PRIMARY KEY (rotation_id, discord_id)
                 )
             ''')
-            host_logger.info("Created new hosting_rotation table")
-        else:
-            if 'order_position' in existing_columns:
-                # Create temporary table with new schema
-                self._execute('''
-                    CREATE TABLE hosting_rotation_new (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        discord_id TEXT NOT NULL,
-                        username TEXT NOT NULL,
-                        venue_position INTEGER,
-                        game_position INTEGER,
-                        last_venue_hosted DATE,
-                        last_game_hosted DATE,
-                        venue_active INTEGER DEFAULT 0,
-                        game_active INTEGER DEFAULT 0
-                    )
-                ''')
-                
-                # Copy data from old table to new table
-                self._execute('''
-                    INSERT INTO hosting_rotation_new (
-                        discord_id, username, venue_position, venue_active
-                    )
-                    SELECT 
-                        discord_id, username, order_position, active
-                    FROM hosting_rotation
-                ''')
-                
-                # Drop old table and rename new one
-                self._execute('DROP TABLE hosting_rotation')
-                self._execute('ALTER TABLE hosting_rotation_new RENAME TO hosting_rotation')
-                
-                host_logger.info("Successfully migrated to new schema")
-            else:
-                # Add any missing columns
-                needed_columns = {
-                    'venue_position': 'INTEGER',
-                    'game_position': 'INTEGER',
-                    'last_venue_hosted': 'DATE',
-                    'last_game_hosted': 'DATE',
-                    'venue_active': 'INTEGER DEFAULT 0',
-                    'game_active': 'INTEGER DEFAULT 0'
-                }
-                
-                for col_name, col_type in needed_columns.items():
-                    if col_name not in existing_columns:
-                        self._execute(f'ALTER TABLE hosting_rotation ADD COLUMN {col_name} {col_type}')
-                        host_logger.info(f"Added column {col_name} to hosting_rotation table")
-        
+            # Covers "active members of one rotation in order", which every command needs
+            self._execute('''
+                CREATE INDEX IF NOT EXISTS idx_rotation_member_order
+                ON rotation_member(rotation_id, active, sort_key)
+            ''')
+            self._execute('''
+                CREATE TABLE IF NOT EXISTS rotation_audit (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    rotation_id INTEGER NOT NULL,
+                    actor_id TEXT,
+                    action TEXT NOT NULL,
+                    discord_id TEXT NOT NULL,
+                    before_position INTEGER,
+                    after_position INTEGER,
+                    created_at TEXT NOT NULL
+                )
+            ''')
+            # /host_history pages through one rotation's entries, newest first
+            self._execute('''
+                CREATE INDEX IF NOT EXISTS idx_rotation_audit_rotation_time
+                ON rotation_audit(rotation_id, created_at)
+            ''')
+            # Last calendar occurrence (by start time) each guild's rotations
+            # were advanced and reminded for, per event
+            self._execute('''
+                CREATE TABLE IF NOT EXISTS rotation_schedule (
+                    guild_id INTEGER NOT NULL,
+                    event_name TEXT NOT NULL,
+                    last_advanced TEXT,
+                    last_reminded TEXT,
+                    PRIMARY KEY (guild_id, event_name)
+                )
+            ''')
+
+            legacy_columns = self._columns('hosting_rotation')
+            if legacy_columns:
+                self._migrate_hosting_rotation(legacy_columns)
+
         host_logger.info("Hosting rotation tables checked/updated successfully")
 
-    def add_host(self, discord_id, username, host_type_id=1):
-        """Adds a user to the specified hosting rotation."""
-        try:
-            # First check if user exists
-            results = self._execute(
-                "SELECT id FROM hosting_rotation WHERE discord_id=?",
-                (discord_id,)
+    def _migrate_hosting_rotation(self, columns):
+        """Move the old two-rotations-in-one-table schema into rotation/rotation_member."""
+        if 'venue_position' in columns:
+            specs = [
+                (VENUE_ROTATION, 'venue_position', 'venue_active',
+                 'last_venue_hosted' if 'last_venue_hosted' in columns else 'NULL'),
+            ]
+            if 'game_position' in columns:
+                specs.append(
+                    (GAME_ROTATION, 'game_position', 'game_active',
+                     'last_game_hosted' if 'last_game_hosted' in columns else 'NULL')
+                )
+        else:
+            # The original single rotation
+            specs = [(VENUE_ROTATION, 'order_position', 'active', 'NULL')]
+
+        with self.transaction() as cursor:
+            cursor.execute(
+                "INSERT OR IGNORE INTO hosts (discord_id, username) SELECT discord_id, username FROM hosting_rotation"
             )
-            
-            if not results:
-                # New user - insert them
-                self._execute(
-                    """INSERT INTO hosting_rotation 
-                       (discord_id, username, venue_position, game_position, 
-                        venue_active, game_active) 
-                       VALUES (?, ?, NULL, NULL, 0, 0)""",
-                    (discord_id, username)
+            for name, position_field, active_field, last_hosted_field in specs:
+                cursor.execute(
+                    "INSERT OR IGNORE INTO rotation (guild_id, name) VALUES (?, ?)",
+                    (LEGACY_GUILD_ID, name)
                 )
-            
-            # Get max position for the appropriate rotation
-            position_field = "venue_position" if host_type_id == 1 else "game_position"
-            active_field = "venue_active" if host_type_id == 1 else "game_active"
-            
-            results = self._execute(
-                f"SELECT MAX({position_field}) FROM hosting_rotation WHERE {active_field}=1"
+                cursor.execute(
+                    "SELECT id FROM rotation WHERE guild_id = ? AND name = ?", (LEGACY_GUILD_ID, name)
+                )
+                rotation_id = cursor.fetchone()[0]
+                cursor.execute(
+                    f"""INSERT OR IGNORE INTO rotation_member
+                        (rotation_id, discord_id, sort_key, active, last_hosted)
+                        SELECT ?, discord_id, COALESCE({position_field}, id * ?),
+                               COALESCE({active_field}, 0), {last_hosted_field}
+                        FROM hosting_rotation
+                        WHERE {position_field} IS NOT NULL OR {active_field} = 1""",
+                    (rotation_id, SORT_KEY_STEP)
+                )
+                host_logger.info(f"Migrated {cursor.rowcount} hosts into the {name} rotation")
+            cursor.execute("DROP TABLE hosting_rotation")
+
+        host_logger.info("Successfully migrated to the rotation/rotation_member schema")
+
+    # Rotations
+    def get_rotation_id(self, guild_id, name, create=False):
+        """Id of a guild's rotation, or None if it doesn't exist.
+
+        With ``create=True`` the rotation is created if needed, claiming the
+        rotation of the same name migrated from the old schema if there is one.
+        """
+        with self.transaction() as cursor:
+            if create:
+                cursor.execute(
+                    "UPDATE OR IGNORE rotation SET guild_id = ? WHERE guild_id = ? AND name = ?",
+                    (guild_id, LEGACY_GUILD_ID, name)
+                )
+                cursor.execute(
+                    "INSERT OR IGNORE INTO rotation (guild_id, name) VALUES (?, ?)", (guild_id, name)
+                )
+            cursor.execute("SELECT id FROM rotation WHERE guild_id = ? AND name = ?", (guild_id, name))
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    def get_rotations(self, guild_id):
+        """(id, name, active member count) of every rotation in a guild."""
+        return self._execute(
+            """SELECT r.id, r.name, COUNT(m.discord_id)
+            FROM rotation r
+            LEFT JOIN rotation_member m ON m.rotation_id = r.id AND m.active = 1
+            WHERE r.guild_id = ?
+            GROUP BY r.id ORDER BY r.id""",
+            (guild_id,)
+        )
+
+    def delete_rotation(self, rotation_id):
+        """Delete a rotation and its members."""
+        with self.transaction() as cursor:
+            cursor.execute("DELETE FROM rotation_member WHERE rotation_id = ?", (rotation_id,))
+            cursor.execute("DELETE FROM rotation WHERE id = ?", (rotation_id,))
+        self._rotation_changed(rotation_id)
+        host_logger.info(f"Deleted rotation {rotation_id}")
+
+    # Members
+    #
+    # Every change to a rotation is one transaction that starts by bumping the
+    # rotation's version (which also takes SQLite's write lock, so the rest of
+    # the transaction can't interleave with another command) and then applies
+    # the change with a single UPDATE/INSERT/DELETE. Callers that act on a
+    # version they read earlier pass it as ``expected_version`` and get
+    # RotationConflict if anything changed in between. A change that turns out
+    # to be a no-op (unknown host, ...) is rolled back, version included.
+    #
+    # Changes made on someone's behalf also produce audit rows: the positions
+    # of the affected hosts are read in the same transaction before and after
+    # the change, and the rows are handed to audit_listeners once it commits
+    # (see src.hosting.audit, which buffers them into rotation_audit).
+
+    def get_rotation_version(self, rotation_id):
+        """Current version of a rotation; it increases with every change."""
+        results = self._execute("SELECT version FROM rotation WHERE id = ?", (rotation_id,))
+        return results[0][0] if results else None
+
+    def _mutate(self, rotation_id, change, expected_version=None, audit=None):
+        """Run ``change(cursor)`` as one versioned transaction and return its result.
+
+        ``change`` raises _Unchanged(result) to roll everything back instead.
+        ``audit`` is ``(actor_id, action, subjects)``, where ``subjects`` are
+        the discord_ids the change affects. Changes that only find out inside
+        the transaction pass a list and fill it in.
+        """
+        entries = []
+        try:
+            with self.transaction() as cursor:
+                if expected_version is None:
+                    cursor.execute("UPDATE rotation SET version = version + 1 WHERE id = ?", (rotation_id,))
+                else:
+                    cursor.execute(
+                        "UPDATE rotation SET version = version + 1 WHERE id = ? AND version = ?",
+                        (rotation_id, expected_version)
+                    )
+                if cursor.rowcount == 0:
+                    raise RotationConflict(rotation_id, expected_version)
+                audited = audit is not None and self.audit_listeners
+                before = self._positions(cursor, rotation_id) if audited else None
+                result = change(cursor)
+                if audited:
+                    actor_id, action, subjects = audit
+                    after = self._positions(cursor, rotation_id)
+                    created_at = utc_timestamp()
+                    entries = [
+                        (rotation_id, actor_id, action, discord_id,
+                         before.get(discord_id), after.get(discord_id), created_at)
+                        for discord_id in subjects
+                    ]
+        except _Unchanged as e:
+            return e.result
+        self._rotation_changed(rotation_id)
+        if entries:
+            for listener in self.audit_listeners:
+                listener(entries)
+        return result
+
+    @staticmethod
+    def _positions(cursor, rotation_id):
+        """{discord_id: position} of a rotation's active members."""
+        cursor.execute(
+            """SELECT discord_id, ROW_NUMBER() OVER (ORDER BY sort_key ASC)
+                FROM rotation_member WHERE rotation_id = ? AND active = 1""",
+            (rotation_id,)
+        )
+        return dict(cursor.fetchall())
+
+    @staticmethod
+    def _member(cursor, rotation_id, discord_id, active):
+        """(username, sort_key) of a member with the given active flag, or None."""
+        cursor.execute(
+            """SELECT h.username, m.sort_key
+                FROM rotation_member m JOIN hosts h ON h.discord_id = m.discord_id
+                WHERE m.rotation_id = ? AND m.discord_id = ? AND m.active = ?""",
+            (rotation_id, discord_id, active)
+        )
+        return cursor.fetchone()
+
+    def add_host(self, rotation_id, discord_id, username, expected_version=None, actor_id=None):
+        """Adds a user to the end of a rotation (re-activating them if they were snoozed)."""
+        def change(cursor):
+            cursor.execute(
+                """INSERT INTO hosts (discord_id, username) VALUES (?, ?)
+                ON CONFLICT(discord_id) DO UPDATE SET username = excluded.username""",
+                (discord_id, username)
             )
-            max_pos = results[0][0] if results and results[0][0] is not None else 0
-            next_position = max_pos + 1
-            
-            # Update the user's position and active status for the specified rotation
-            self._execute(
-                f"""UPDATE hosting_rotation 
-                    SET {position_field}=?, {active_field}=1 
-                    WHERE discord_id=?""",
-                (next_position, discord_id)
+            cursor.execute(
+                f"""INSERT INTO rotation_member (rotation_id, discord_id, sort_key, active)
+                SELECT ?, ?, {LAST_KEY_SQL} + ?, 1
+                FROM rotation_member WHERE rotation_id = ? AND active = 1
+                ON CONFLICT(rotation_id, discord_id) DO UPDATE
+                SET sort_key = excluded.sort_key, active = 1""",
+                (rotation_id, discord_id, SORT_KEY_STEP, rotation_id)
             )
-            
-            host_logger.info(f"Host added to {'venue' if host_type_id == 1 else 'game'} rotation")
             return True
-            
+
+        try:
+            result = self._mutate(rotation_id, change, expected_version, (actor_id, "add", (discord_id,)))
+            host_logger.info(f"Host added to rotation {rotation_id}")
+            return result
+
         except sqlite3.Error as e:
             host_logger.error(f"Database error adding host {discord_id}: {e}")
             raise
-        except Exception:
-            host_logger.exception(f"Unexpected error adding host {discord_id}")
+
+    def add_hosts(self, rotation_id, members, expected_version=None, actor_id=None):
+        """Append several users to a rotation, in order, skipping current members.
+
+        ``members`` is a sequence of (discord_id, username). Returns the
+        discord_ids that were added and those skipped because they were
+        already in the rotation (snoozed or not).
+        """
+        members = list(dict(members).items())  # drop repeats, keep order
+        new_ids = []
+
+        def change(cursor):
+            existing = set()
+            for chunk in _chunks([discord_id for discord_id, _ in members], BULK_CHUNK_SIZE):
+                cursor.execute(
+                    f"""SELECT discord_id FROM rotation_member
+                        WHERE rotation_id = ? AND discord_id IN ({', '.join('?' * len(chunk))})""",
+                    (rotation_id, *chunk)
+                )
+                existing.update(row[0] for row in cursor.fetchall())
+            new = [(discord_id, username) for discord_id, username in members if discord_id not in existing]
+            skipped = [discord_id for discord_id, _ in members if discord_id in existing]
+            if not new:
+                raise _Unchanged(([], skipped))
+
+            cursor.execute(
+                f"SELECT {LAST_KEY_SQL} FROM rotation_member WHERE rotation_id = ? AND active = 1",
+                (rotation_id,)
+            )
+            last_key = cursor.fetchone()[0]
+            for offset in range(0, len(new), BULK_CHUNK_SIZE):
+                chunk = new[offset:offset + BULK_CHUNK_SIZE]
+                cursor.execute(
+                    f"""INSERT INTO hosts (discord_id, username) VALUES {', '.join(['(?, ?)'] * len(chunk))}
+                    ON CONFLICT(discord_id) DO UPDATE SET username = excluded.username""",
+                    [value for member in chunk for value in member]
+                )
+                cursor.execute(
+                    f"""INSERT INTO rotation_member (rotation_id, discord_id, sort_key, active)
+                    VALUES {', '.join(['(?, ?, ?, 1)'] * len(chunk))}""",
+                    [
+                        value
+                        for idx, (discord_id, _) in enumerate(chunk, offset + 1)
+                        for value in (rotation_id, discord_id, last_key + idx * SORT_KEY_STEP)
+                    ]
+                )
+            new_ids.extend(discord_id for discord_id, _ in new)
+            return new_ids, skipped
+
+        try:
+            added, skipped = self._mutate(rotation_id, change, expected_version, (actor_id, "import", new_ids))
+            host_logger.info(f"Added {len(added)} hosts to rotation {rotation_id}, skipped {len(skipped)}")
+            return added, skipped
+        except sqlite3.Error as e:
+            host_logger.error(f"Database error adding {len(members)} hosts: {e}")
             raise
 
-    def get_next_host(self, host_type_id=1):
-        """Fetches the next user in the specified hosting rotation."""
-        position_field = "venue_position" if host_type_id == 1 else "game_position"
-        active_field = "venue_active" if host_type_id == 1 else "game_active"
-        
+    def remove_host(self, rotation_id, discord_id, expected_version=None, actor_id=None):
+        """Removes a user from a rotation. Returns False if they weren't in it."""
+        def change(cursor):
+            cursor.execute(
+                "DELETE FROM rotation_member WHERE rotation_id = ? AND discord_id = ?",
+                (rotation_id, discord_id)
+            )
+            if cursor.rowcount == 0:
+                raise _Unchanged(False)
+            return True
+
+        try:
+            removed = self._mutate(rotation_id, change, expected_version, (actor_id, "remove", (discord_id,)))
+            host_logger.info(f"Host {discord_id} {'removed from' if removed else 'not in'} rotation {rotation_id}")
+            return removed
+        except sqlite3.Error as e:
+            host_logger.error(f"Database error removing host {discord_id}: {e}")
+            raise
+
+    def get_next_host(self, rotation_id):
+        """Fetches the next user in a rotation."""
         try:
             results = self._execute(
-                f"""SELECT discord_id, username 
-                    FROM hosting_rotation 
-                    WHERE {active_field}=1 
-                    ORDER BY {position_field} ASC LIMIT 1"""
+                """SELECT m.discord_id, h.username
+                    FROM rotation_member m JOIN hosts h ON h.discord_id = m.discord_id
+                    WHERE m.rotation_id = ? AND m.active = 1
+                    ORDER BY m.sort_key ASC LIMIT 1""",
+                (rotation_id,)
             )
-            
+
             if results:
                 return {"discord_id": results[0][0], "username": results[0][1]}
             return None
-            
+
         except sqlite3.Error as e:
             host_logger.error(f"Database error getting next host: {e}")
             raise
-        except Exception:
-            host_logger.exception("Unexpected error getting next host")
-            raise
 
-    def rotate_hosts(self, host_type_id=1):
+    def rotate_hosts(self, rotation_id, expected_version=None, actor_id=None):
         """Moves the current host to the back of the queue."""
-        position_field = "venue_position" if host_type_id == 1 else "game_position"
-        active_field = "venue_active" if host_type_id == 1 else "game_active"
-        last_hosted_field = "last_venue_hosted" if host_type_id == 1 else "last_game_hosted"
-        
-        host_logger.info("Rotating hosts")
-        try:
-            results = self._execute(
-                f"SELECT discord_id, username, {position_field} FROM hosting_rotation WHERE {active_field}=1 ORDER BY {position_field} ASC LIMIT 1"
+        rotated = []
+
+        def change(cursor):
+            cursor.execute(
+                """SELECT m.discord_id, h.username
+                    FROM rotation_member m JOIN hosts h ON h.discord_id = m.discord_id
+                    WHERE m.rotation_id = ? AND m.active = 1 ORDER BY m.sort_key ASC LIMIT 1""",
+                (rotation_id,)
             )
-            
-            if not results or len(results) == 0:
+            host = cursor.fetchone()
+            if not host:
                 host_logger.warning("No active hosts found for rotation")
-                return "No active hosts found."
-                
-            host_id, host_name, host_position = results[0]
-            host_logger.info(f"Current host: {host_name} (position {host_position})")
-            
-            # Update last hosted date
-            self._execute(
-                f"UPDATE hosting_rotation SET {last_hosted_field} = DATE('now') WHERE discord_id = ?",
-                (host_id,)
-            )
-            
-            # Get max position
-            results = self._execute(f"SELECT MAX({position_field}) FROM hosting_rotation WHERE {active_field}=1")
-            max_pos = results[0][0] if results and results[0][0] is not None else 0
-            
-            # Move current host to end
-            self._execute(
-                f"UPDATE hosting_rotation SET {position_field} = ? WHERE discord_id = ?",
-                (max_pos + 1, host_id)
-            )
-            
-            # Move everyone else up
-            self._execute(
-                f"UPDATE hosting_rotation SET {position_field} = {position_field} - 1 WHERE discord_id != ? AND {active_field}=1",
-                (host_id,)
+                raise _Unchanged("No active hosts found.")
+            host_id, username = host
+            rotated.append(host_id)
+
+            # Record the hosting date and move the current host to the end
+            cursor.execute(
+                f"""UPDATE rotation_member
+                    SET last_hosted = DATE('now'), sort_key = (
+                        SELECT {LAST_KEY_SQL} FROM rotation_member WHERE rotation_id = ? AND active = 1
+                    ) + ?
+                    WHERE rotation_id = ? AND discord_id = ?""",
+                (rotation_id, SORT_KEY_STEP, rotation_id, host_id)
             )
-            
-            # Resequence to ensure no gaps
-            self._resequence_positions(host_type_id)
-            
-            host_logger.info(f"Host {host_name} rotated to the end of the queue")
-            return f"Rotated: {host_name} moved to the end of the queue"
-            
+            host_logger.info(f"Host {username} rotated to the end of the queue")
+            return f"Rotated: {username} moved to the end of the queue"
+
+        host_logger.info(f"Rotating hosts in rotation {rotation_id}")
+        try:
+            return self._mutate(rotation_id, change, expected_version, (actor_id, "rotate", rotated))
         except sqlite3.Error as e:
             host_logger.error(f"Database error rotating hosts: {e}")
             raise
-        except Exception:
-            host_logger.exception("Unexpected error rotating hosts")
-            raise
 
-    def defer_host(self, discord_id, host_type_id=1):
+    def defer_host(self, rotation_id, discord_id, expected_version=None, actor_id=None):
         """Defers a host (keeps them at their current position)."""
-        position_field = "venue_position" if host_type_id == 1 else "game_position"
-        last_hosted_field = "last_venue_hosted" if host_type_id == 1 else "last_game_hosted"
-        active_field = "venue_active" if host_type_id == 1 else "game_active"
-        
-        host_logger.info(f"Deferring host with discord_id={discord_id}")
-        try:
-            cursor = self._execute(
-                f"SELECT username, {position_field} FROM hosting_rotation WHERE discord_id=? AND {active_field}=1", 
-                (discord_id,)
-            )
-            host = cursor.fetchone()
+        def change(cursor):
+            host = self._member(cursor, rotation_id, discord_id, active=1)
             if not host:
                 host_logger.warning(f"Host with discord_id={discord_id} not found or not active")
-                return "Host not found or not active"
-                
-            username, position = host
-            
-            self._execute(
-                f"UPDATE hosting_rotation SET {last_hosted_field} = DATE('now', '-7 days') WHERE discord_id = ?",
-                (discord_id,)
+                raise _Unchanged("Host not found or not active")
+
+            cursor.execute(
+                """UPDATE rotation_member SET last_hosted = DATE('now', '-7 days')
+                    WHERE rotation_id = ? AND discord_id = ?""",
+                (rotation_id, discord_id)
             )
-            
-            host_logger.info(f"Host {username} deferred successfully (keeping position {position})")
-            return f"Deferred: {username} has deferred their turn"
+            host_logger.info(f"Host {host[0]} deferred successfully (keeping sort key {host[1]})")
+            return f"Deferred: {host[0]} has deferred their turn"
+
+        host_logger.info(f"Deferring host with discord_id={discord_id}")
+        try:
+            return self._mutate(rotation_id, change, expected_version, (actor_id, "defer", (discord_id,)))
         except sqlite3.Error as e:
             host_logger.error(f"Database error deferring host {discord_id}: {e}")
             raise
-        except Exception:
-            host_logger.exception(f"Unexpected error deferring host {discord_id}")
-            raise
 
-    def snooze_host(self, discord_id, host_type_id=1):
+    def snooze_host(self, rotation_id, discord_id, expected_version=None, actor_id=None):
         """Temporarily removes a user from the hosting rotation."""
-        position_field = "venue_position" if host_type_id == 1 else "game_position"
-        active_field = "venue_active" if host_type_id == 1 else "game_active"
-        
-        host_logger.info(f"Snoozing host with discord_id={discord_id}")
-        try:
-            cursor = self._execute(
-                f"SELECT username, {position_field} FROM hosting_rotation WHERE discord_id=? AND {active_field}=1",
-                (discord_id,)
-            )
-            host = cursor.fetchone()
+        def change(cursor):
+            host = self._member(cursor, rotation_id, discord_id, active=1)
             if not host:
                 host_logger.warning(f"Host with discord_id={discord_id} not found or already inactive")
-                return "Host not found or already inactive"
-                
-            username, position = host
-            
-            self._execute(
-                f"UPDATE hosting_rotation SET {active_field}=0 WHERE discord_id=?",
-                (discord_id,)
-            )
-            
-            self._execute(
-                f"UPDATE hosting_rotation SET {position_field} = {position_field} - 1 WHERE {position_field} > ?",
-                (position,)
+                raise _Unchanged("Host not found or already inactive")
+
+            # Inactive hosts are skipped when ordering, so nobody else has to move
+            cursor.execute(
+                "UPDATE rotation_member SET active = 0 WHERE rotation_id = ? AND discord_id = ?",
+                (rotation_id, discord_id)
             )
-            
-            host_logger.info(f"Host {username} snoozed successfully")
-            return f"Snoozed: {username} removed from the active rotation"
+            host_logger.info(f"Host {host[0]} snoozed successfully")
+            return f"Snoozed: {host[0]} removed from the active rotation"
+
+        host_logger.info(f"Snoozing host with discord_id={discord_id}")
+        try:
+            return self._mutate(rotation_id, change, expected_version, (actor_id, "snooze", (discord_id,)))
         except sqlite3.Error as e:
             host_logger.error(f"Database error snoozing host {discord_id}: {e}")
             raise
-        except Exception:
-            host_logger.exception(f"Unexpected error snoozing host {discord_id}")
-            raise
 
-    def activate_host(self, discord_id, host_type_id=1):
+    def activate_host(self, rotation_id, discord_id, expected_version=None, actor_id=None):
         """Re-adds a snoozed user to the hosting rotation."""
-        position_field = "venue_position" if host_type_id == 1 else "game_position"
-        active_field = "venue_active" if host_type_id == 1 else "game_active"
-        
-        host_logger.info(f"Activating host with discord_id={discord_id}")
-        try:
-            cursor = self._execute(
-                f"SELECT username FROM hosting_rotation WHERE discord_id=? AND {active_field}=0",
-                (discord_id,)
-            )
-            host = cursor.fetchone()
+        def change(cursor):
+            host = self._member(cursor, rotation_id, discord_id, active=0)
             if not host:
                 host_logger.warning(f"Host with discord_id={discord_id} not found or already active")
-                return "Host not found or already active"
-                
-            cursor = self._execute(f"SELECT MAX({position_field}) FROM hosting_rotation")
-            max_pos = cursor.fetchone()[0] or 0
-            next_position = max_pos + 1
-            
-            self._execute(
-                f"UPDATE hosting_rotation SET {active_field}=1, {position_field}=? WHERE discord_id=?",
-                (next_position, discord_id)
+                raise _Unchanged("Host not found or already active")
+
+            cursor.execute(
+                f"""UPDATE rotation_member SET active = 1, sort_key = (
+                        SELECT {LAST_KEY_SQL} FROM rotation_member WHERE rotation_id = ? AND active = 1
+                    ) + ?
+                    WHERE rotation_id = ? AND discord_id = ?""",
+                (rotation_id, SORT_KEY_STEP, rotation_id, discord_id)
             )
-            
-            host_logger.info(f"Host {host[0]} activated and placed at position {next_position}")
-            return f"Activated: {host[0]} added back to rotation at position {next_position}"
+            cursor.execute(
+                "SELECT COUNT(*) FROM rotation_member WHERE rotation_id = ? AND active = 1",
+                (rotation_id,)
+            )
+            position = cursor.fetchone()[0]
+            host_logger.info(f"Host {host[0]} activated and placed at position {position}")
+            return f"Activated: {host[0]} added back to rotation at position {position}"
+
+        host_logger.info(f"Activating host with discord_id={discord_id}")
+        try:
+            return self._mutate(rotation_id, change, expected_version, (actor_id, "activate", (discord_id,)))
         except sqlite3.Error as e:
             host_logger.error(f"Database error activating host {discord_id}: {e}")
             raise
-        except Exception:
-            host_logger.exception(f"Unexpected error activating host {discord_id}")
-            raise
-    
-    def get_all_hosts(self, host_type_id=1):
+
+    def get_all_hosts(self, rotation_id):
         """Returns all active hosts in their current rotation order."""
-        position_field = "venue_position" if host_type_id == 1 else "game_position"
-        active_field = "venue_active" if host_type_id == 1 else "game_active"
-        
-        host_logger.info("Fetching all hosts in rotation order")
+        host_logger.info(f"Fetching all hosts of rotation {rotation_id} in order")
         try:
-            # Ensure there are no gaps in positions before fetching
-            self._resequence_positions(host_type_id)
-            
+            # Dense 1..N positions are derived from the sort keys; reads never write
             results = self._execute(
-                f"SELECT discord_id, username, {position_field} FROM hosting_rotation WHERE {active_field}=1 ORDER BY {position_field} ASC",
+                f"""SELECT {HOST_COLUMNS_SQL}
+                    FROM rotation_member m JOIN hosts h ON h.discord_id = m.discord_id
+                    WHERE m.rotation_id = ? AND m.active = 1
+                    ORDER BY m.sort_key ASC""",
+                (rotation_id,)
             )
-            
+
             if results:
                 host_logger.info(f"Retrieved {len(results)} hosts in rotation order")
-                return [{"discord_id": host[0], "username": host[1], "position": host[2]} for host in results]
+                return [_host_dict(row) for row in results]
             else:
                 host_logger.warning("No active hosts found in rotation")
                 return []
         except sqlite3.Error as e:
             host_logger.error(f"Database error fetching all hosts: {e}")
             raise
-        except Exception:
-            host_logger.exception("Unexpected error fetching all hosts")
-            raise
 
-    def _resequence_positions(self, host_type_id=1):
-        """Helper method to ensure host positions are sequential (1, 2, 3...) with no gaps."""
-        position_field = "venue_position" if host_type_id == 1 else "game_position"
-        active_field = "venue_active" if host_type_id == 1 else "game_active"
-        
-        try:
-            # Get all active hosts ordered by their current position
-            results = self._execute(
-                f"SELECT discord_id FROM hosting_rotation WHERE {active_field}=1 ORDER BY {position_field} ASC",
-            )
-            
-            # Reassign positions sequentially
-            for idx, host in enumerate(results, 1):
-                self._execute(
-                    f"UPDATE hosting_rotation SET {position_field} = ? WHERE discord_id = ?",
-                    (idx, host[0])
-                )
-            
-            host_logger.info(f"Resequenced positions for {len(results)} active hosts")
-        except sqlite3.Error as e:
-            host_logger.error(f"Database error resequencing positions: {e}")
-            raise
-        except Exception:
-            host_logger.exception("Unexpected error resequencing positions")
-            raise
+    def get_rotation_snapshot(self, rotation_id):
+        """(version, hosts) of a rotation, read with a single statement so they always match."""
+        results = self._execute(
+            f"""SELECT r.version, {HOST_COLUMNS_SQL}
+                FROM rotation r
+                LEFT JOIN rotation_member m ON m.rotation_id = r.id AND m.active = 1
+                LEFT JOIN hosts h ON h.discord_id = m.discord_id
+                WHERE r.id = ?
+                ORDER BY m.sort_key ASC""",
+            (rotation_id,)
+        )
+        if not results:
+            return None, []
+        hosts = [_host_dict(row[1:]) for row in results if row[1] is not None]
+        return results[0][0], hosts
+
+    @staticmethod
+    def _rebalance_sort_keys(cursor, rotation_id):
+        """Spread sort keys SORT_KEY_STEP apart again, keeping the order.
+
+        Only needed once repeated moves into the same gap have exhausted it.
+        """
+        cursor.execute(
+            """SELECT discord_id FROM rotation_member
+                WHERE rotation_id = ? AND active = 1 ORDER BY sort_key ASC""",
+            (rotation_id,)
+        )
+        ids = [row[0] for row in cursor.fetchall()]
+        cursor.executemany(
+            "UPDATE rotation_member SET sort_key = ? WHERE rotation_id = ? AND discord_id = ?",
+            [(idx * SORT_KEY_STEP, rotation_id, discord_id) for idx, discord_id in enumerate(ids, 1)]
+        )
+        host_logger.info(f"Rebalanced sort keys for {len(ids)} active hosts")
+
+    def move_host(self, rotation_id, discord_id, position_type, expected_version=None, actor_id=None):
+        """Move a host to a new position in their rotation.
+
+        Only the moved host's sort key changes.
+        """
+        def change(cursor):
+            host = self._member(cursor, rotation_id, discord_id, active=1)
+            if not host:
+                raise _Unchanged("Host not found or not active")
+            username = host[0]
 
-    def move_host(self, discord_id, position_type, host_type_id=1):
-        """Move a host to a new position in their rotation."""
-        position_field = "venue_position" if host_type_id == 1 else "game_position"
-        active_field = "venue_active" if host_type_id == 1 else "game_active"
-        
-        try:
-            # Get current host info
-            results = self._execute(
-                f"SELECT username, {position_field} FROM hosting_rotation WHERE discord_id=? AND {active_field}=1",
-                (discord_id,)
-            )
-            
-            if not results:
-                return "Host not found or not active"
-            
-            username, current_pos = results[0]
-            
             if position_type == "top":
-                # Move everyone else down one
-                self._execute(
-                    f"UPDATE hosting_rotation SET {position_field} = {position_field} + 1 WHERE {active_field}=1"
-                )
-                # Move target host to top
-                self._execute(
-                    f"UPDATE hosting_rotation SET {position_field} = 1 WHERE discord_id = ?",
-                    (discord_id,)
-                )
+                new_key = f"(SELECT COALESCE(MIN(sort_key), 0) FROM rotation_member WHERE rotation_id = ? AND active = 1) - {SORT_KEY_STEP}"
+                params = (rotation_id,)
                 msg = f"{username} has been moved to the top of the list!"
-                
             elif position_type == "bottom":
-                # Get max position
-                results = self._execute(
-                    f"SELECT MAX({position_field}) FROM hosting_rotation WHERE {active_field}=1"
-                )
-                max_pos = results[0][0] if results and results[0][0] is not None else 0
-                
-                # Move others up
-                self._execute(
-                    f"UPDATE hosting_rotation SET {position_field} = {position_field} - 1 WHERE {position_field} > ? AND {active_field}=1",
-                    (current_pos,)
-                )
-                # Move target host to bottom
-                self._execute(
-                    f"UPDATE hosting_rotation SET {position_field} = ? WHERE discord_id = ?",
-                    (max_pos, discord_id)
-                )
+                new_key = f"(SELECT {LAST_KEY_SQL} FROM rotation_member WHERE rotation_id = ? AND active = 1) + {SORT_KEY_STEP}"
+                params = (rotation_id,)
                 msg = f"{username} has been moved to the bottom of the list!"
-                
             else:  # next
-                # Move to position 2 (right after current host)
-                self._execute(
-                    f"UPDATE hosting_rotation SET {position_field} = {position_field} + 1 WHERE {position_field} > 1 AND {active_field}=1"
-                )
-                self._execute(
-                    f"UPDATE hosting_rotation SET {position_field} = 2 WHERE discord_id = ?",
-                    (discord_id,)
-                )
+                # Right after the current host: between the first two other hosts
+                key = self._key_after_current_host(cursor, rotation_id, discord_id)
+                if key is None:
+                    raise _Unchanged(f"{username} will host next!")
+                new_key, params = "?", (key,)
                 msg = f"{username} will host next!"
-            
-            # Resequence to ensure no gaps
-            self._resequence_positions(host_type_id)
+
+            cursor.execute(
+                f"UPDATE rotation_member SET sort_key = {new_key} WHERE rotation_id = ? AND discord_id = ?",
+                (*params, rotation_id, discord_id)
+            )
             return msg
-            
+
+        try:
+            return self._mutate(
+                rotation_id, change, expected_version, (actor_id, f"move_{position_type}", (discord_id,))
+            )
         except sqlite3.Error as e:
             host_logger.error(f"Database error moving host {discord_id}: {e}")
             raise
-        except Exception:
-            host_logger.exception(f"Unexpected error moving host {discord_id}")
+
+    def _key_after_current_host(self, cursor, rotation_id, discord_id):
+        """Sort key that places a host second, or None if there is nobody to follow."""
+        for _ in range(2):
+            cursor.execute(
+                """SELECT sort_key FROM rotation_member
+                    WHERE rotation_id = ? AND active = 1 AND discord_id != ?
+                    ORDER BY sort_key ASC LIMIT 2""",
+                (rotation_id, discord_id)
+            )
+            results = cursor.fetchall()
+            if not results:
+                return None
+            if len(results) == 1:
+                return results[0][0] + SORT_KEY_STEP
+            first, second = results[0][0], results[1][0]
+            if second - first >= MIN_SORT_KEY_GAP:
+                return (first + second) / 2
+            self._rebalance_sort_keys(cursor, rotation_id)
+        return None
+
+    def swap_hosts(self, rotation_id, first_id, second_id, expected_version=None, actor_id=None):
+        """Swap two active hosts' places. Returns the discord_ids that aren't active members (empty on success)."""
+        def change(cursor):
+            first = self._member(cursor, rotation_id, first_id, active=1)
+            second = self._member(cursor, rotation_id, second_id, active=1)
+            missing = [member_id for member_id, host in ((first_id, first), (second_id, second)) if not host]
+            if missing:
+                raise _Unchanged(missing)
+
+            cursor.execute(
+                """UPDATE rotation_member
+                    SET sort_key = CASE discord_id WHEN ? THEN ? ELSE ? END
+                    WHERE rotation_id = ? AND discord_id IN (?, ?)""",
+                (first_id, second[1], first[1], rotation_id, first_id, second_id)
+            )
+            host_logger.info(f"Swapped {first[0]} and {second[0]} in rotation {rotation_id}")
+            return []
+
+        try:
+            return self._mutate(rotation_id, change, expected_version, (actor_id, "swap", (first_id, second_id)))
+        except sqlite3.Error as e:
+            host_logger.error(f"Database error swapping hosts {first_id} and {second_id}: {e}")
             raise
 
+    # Audit log
+    def append_rotation_audit(self, entries):
+        """Append audit rows as produced by _mutate, in one transaction.
+
+        ``entries`` holds ``(rotation_id, actor_id, action, discord_id,
+        before_position, after_position, created_at)`` tuples.
+        """
+        if not entries:
+            return
+        with self.transaction() as cursor:
+            cursor.executemany(
+                """INSERT INTO rotation_audit
+                (rotation_id, actor_id, action, discord_id, before_position, after_position, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                entries
+            )
+
+    def get_rotation_audit(self, rotation_id, limit, offset=0):
+        """One page of a rotation's audit log, newest first, and the total number of entries.
+
+        Rows are ``(created_at, actor_id, action, discord_id, username,
+        before_position, after_position)``; a position is None where the host
+        wasn't active in the rotation.
+        """
+        rows = self._execute(
+            """SELECT a.created_at, a.actor_id, a.action, a.discord_id, h.username,
+                      a.before_position, a.after_position
+                FROM rotation_audit a LEFT JOIN hosts h ON h.discord_id = a.discord_id
+                WHERE a.rotation_id = ?
+                ORDER BY a.created_at DESC, a.id DESC
+                LIMIT ? OFFSET ?""",
+            (rotation_id, limit, offset)
+        )
+        total = self._execute("SELECT COUNT(*) FROM rotation_audit WHERE rotation_id = ?", (rotation_id,))[0][0]
+        return rows, total
+
+    def rotated_by_hand_between(self, rotation_id, start, end=None):
+        """Whether someone advanced the rotation in [start, end) (datetimes; no end: until now).
+
+        Only rotations with an actor count; automatic ones (see
+        src.hosting.scheduler) are recorded without one.
+        """
+        return bool(self._execute(
+            """SELECT 1 FROM rotation_audit
+                WHERE rotation_id = ? AND created_at >= ? AND created_at < COALESCE(?, '9999')
+                AND action = 'rotate' AND actor_id IS NOT NULL LIMIT 1""",
+            (rotation_id, utc_timestamp(start), end and utc_timestamp(end))
+        ))
+
+    # Automatic advancement
+    def get_rotation_schedule(self, guild_id):
+        """{event_name: (last_advanced, last_reminded)} of a guild, as stored timestamps or None."""
+        rows = self._execute(
+            "SELECT event_name, last_advanced, last_reminded FROM rotation_schedule WHERE guild_id = ?",
+            (guild_id,)
+        )
+        return {event_name: (last_advanced, last_reminded) for event_name, last_advanced, last_reminded in rows}
+
+    def set_rotation_schedule(self, guild_id, event_name, last_advanced=None, last_reminded=None):
+        """Record the occurrence last advanced and/or reminded for; None leaves a field as it was."""
+        self._execute(
+            """INSERT INTO rotation_schedule (guild_id, event_name, last_advanced, last_reminded)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(guild_id, event_name) DO UPDATE SET
+                    last_advanced = COALESCE(excluded.last_advanced, last_advanced),
+                    last_reminded = COALESCE(excluded.last_reminded, last_reminded)""",
+            (guild_id, event_name,
+             last_advanced and utc_timestamp(last_advanced), last_reminded and utc_timestamp(last_reminded))
+        )
+
     def debug_schema(self):
         """Debug method to print current table schema."""
         try:
-            results = self._execute("PRAGMA table_info(hosting_rotation)")
-            columns = [(row[1], row[2]) for row in results]
-            host_logger.info(f"Current hosting_rotation schema: {columns}")
+            for table in ("rotation", "rotation_member", "hosts", "rotation_audit", "rotation_schedule"):
+                columns = [(row[1], row[2]) for row in self._execute(f"PRAGMA table_info({table})")]
+                host_logger.info(f"Current {table} schema: {columns}")
         except Exception:
             host_logger.exception("Error getting schema")
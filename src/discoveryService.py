@@ -0,0 +1,89 @@
+import logging
+
+from discord.ext import tasks
+
+from src.config import Config
+from src.database import Database
+from src.database.bga_db import Game
+
+from . import bga_commands, utils, webscraper
+
+
+class TableDiscoveryService:
+    """Finds linked players' in-progress BGA tables and starts tracking them.
+
+    Each player's table list is diffed against the list seen on the previous
+    run, so in steady state a run costs one list request per player and no
+    writes. A table only counts as seen once it is tracked, so one whose
+    fetch or insert failed is tried again on the next run. A table someone
+    untracked by hand is not re-added until it disappears from and reappears
+    in the player's list (or the bot restarts).
+    """
+
+    def __init__(self):
+        self.config = Config.load()
+        self.database = Database(self.config.database_path)
+        self.seen_tables = {}  # bga_id -> set of table IDs from the last run
+
+    async def discover_player(self, bga_id, tracked_ids):
+        """Return (table ID, game code) pairs that are new for this player and untracked."""
+        tables = await webscraper.fetchPlayerTables(bga_id, self.config.bga_base_url)
+        if tables is None:
+            return []
+        current = {table_id for table_id, _ in tables}
+        previous = self.seen_tables.get(bga_id, set())
+        # New tables are added once discover_tables has tracked them
+        self.seen_tables[bga_id] = {
+            table_id for table_id in current if table_id in previous or table_id in tracked_ids
+        }
+        return [
+            (table_id, game_code) for table_id, game_code in tables
+            if table_id not in previous and table_id not in tracked_ids
+        ]
+
+    async def fetch_new_game(self, table_id, game_code):
+        canonical_url = utils.canonicalizeTableReference(str(table_id))
+        if game_code:
+            webscraper.rememberGameCode(table_id, game_code)
+        info = await webscraper.getGameInfo(canonical_url, self.config.bga_base_url)
+        if info is None:
+            logging.warning(f"Could not read discovered table {table_id}")
+            return None
+        game_name, active_player_id = info
+        return (table_id, canonical_url, game_name, active_player_id)
+
+    @tasks.loop(minutes=15)
+    async def discover_tables(self, bot):
+        bga_ids = self.database.get_all_bga_ids()
+        tracked_ids = {game.id for game in self.database.get_all_games()}
+
+        candidates = {}
+        players = {}  # table ID -> bga_ids listing it
+        for bga_id in bga_ids:
+            for table_id, game_code in await self.discover_player(bga_id, tracked_ids):
+                candidates.setdefault(table_id, game_code)
+                players.setdefault(table_id, []).append(bga_id)
+        if not candidates:
+            return
+
+        rows = []
+        for table_id, game_code in candidates.items():
+            row = await self.fetch_new_game(table_id, game_code)
+            if row:
+                rows.append(row)
+
+        inserted = set(self.database.insert_games(rows))
+        # Tables tracked by someone else meanwhile are tracked all the same
+        for table_id, *_ in rows:
+            for bga_id in players[table_id]:
+                self.seen_tables[bga_id].add(table_id)
+        logging.info(f"Discovered {len(inserted)} new tables for {len(bga_ids)} linked players")
+        await bga_commands.notify_turns(
+            bot, [Game(*row) for row in rows if row[0] in inserted],
+            self.database, self.config.notify_channel_id,
+        )
+
+# Create instance when imported
+discovery_service = TableDiscoveryService()
+# Export the discover_tables method
+discoverTables = discovery_service.discover_tables
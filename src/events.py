@@ -6,6 +6,7 @@ from datetime import datetime
 from .database import events_db
 from .config import Config
 from .database import Database
+from .command_pipeline import run_deferred
 
 logger = logging.getLogger(__name__)
 
@@ -37,11 +38,14 @@ class EventCommands(commands.Cog):
             await interaction.response.send_message('Please provide a valid Aftergame event URL.')
             return
             
-        if events_db.add_event(self.database.conn, url):
-            await events_db.update_event(self.database.conn, url)
-            await interaction.response.send_message('Event added and data updated.')
-        else:
-            await interaction.response.send_message('Failed to add event.')
+        async def add():
+            if not events_db.add_event(self.database.conn, url):
+                return 'Failed to add event.'
+            if await events_db.update_event(self.database.conn, url):
+                return 'Event added and data updated.'
+            return 'Event added; its details will be filled in on the next refresh.'
+
+        await run_deferred(interaction, "event_add", add, error_message='Failed to add event.')
 
     @event_command()
     @app_commands.describe(url="The Aftergame event URL to remove")
@@ -0,0 +1,26 @@
+from typing import List
+
+from src.database.buffered import FLUSH_INTERVAL, BufferedAppender
+
+
+class HostingAudit(BufferedAppender):
+    """Buffers rotation audit rows for the rotation_audit table.
+
+    Registers itself with the database, which hands over the rows of every
+    committed audited change. Call ``flush`` before reading the audit log so
+    it includes the latest changes.
+    """
+
+    description = "hosting audit log"
+
+    def __init__(self, database, flush_interval: float = FLUSH_INTERVAL):
+        super().__init__(flush_interval=flush_interval)
+        self.database = database
+        self.entries, = self.buffers
+        database.audit_listeners.append(self.record)
+
+    def record(self, entries: List[tuple]):
+        self.entries.extend(entries)
+
+    def _append(self, entries):
+        self.database.append_rotation_audit(entries)
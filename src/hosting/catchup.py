@@ -0,0 +1,150 @@
+"""Restart catch-up check for the hosting rotation scheduler.
+
+Starts the scheduler against a throwaway database and calendar as if the
+bot had been down for two days, then checks what it caught up on::
+
+    python -m src.hosting.catchup
+
+Two daily events share the venue rotation and both missed two
+occurrences, so it must advance four times; the scheduler's own advances
+must not make it skip later ones. The game rotation hosts only the first
+event and was rotated by hand today, so only yesterday's occurrence may
+advance it.
+"""
+import argparse
+import asyncio
+import logging
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.database.hosting_db import GAME_ROTATION, VENUE_ROTATION, HostingDatabase, utc_timestamp
+from src.hosting.audit import HostingAudit
+from src.hosting.forecast import RotationForecaster
+from src.hosting.scheduler import RotationScheduler
+from src.hosting.snapshot import RotationReadModel
+
+GUILD_ID = 1
+CHANNEL_ID = 2
+HOSTS = 3
+
+# Both events are over for today wherever "now" falls in the day: the
+# calendar's timezone is picked so that it is between 12:00 and 13:00 there.
+EVENTS_YAML = """\
+timezone: {tz}
+
+events:
+  - name: Early
+    venue: Here
+    short_label: Early
+    rrule: "FREQ=DAILY"
+    start_time: "08:00"
+    end_time: "09:00"
+    color: "#4C6EF5"
+    rotations: [{venue}, {game}]
+
+  - name: Late
+    venue: There
+    short_label: Late
+    rrule: "FREQ=DAILY"
+    start_time: "09:30"
+    end_time: "10:30"
+    color: "#E8590C"
+    rotations: [{venue}]
+"""
+
+
+class _Bot:
+    """Just enough of a discord.py bot for RotationScheduler."""
+
+    async def wait_until_ready(self):
+        pass
+
+    def get_channel(self, channel_id):
+        return SimpleNamespace(id=channel_id, guild=SimpleNamespace(id=GUILD_ID))
+
+
+def _rotations(database, rotation_id):
+    """(automatic, by hand) rotate entries in the audit log."""
+    rows = database._execute(
+        """SELECT COUNT(*) - COUNT(actor_id), COUNT(actor_id) FROM rotation_audit
+            WHERE rotation_id = ? AND action = 'rotate'""",
+        (rotation_id,)
+    )
+    return rows[0]
+
+
+async def _catch_up(scheduler, seconds):
+    try:
+        await asyncio.wait_for(scheduler._run(), timeout=seconds)
+    except asyncio.TimeoutError:
+        # Caught up and asleep until the next occurrence
+        pass
+
+
+def run(args) -> bool:
+    logging.getLogger('hosting_rotation').setLevel(logging.WARNING)
+
+    now = datetime.now(timezone.utc)
+    offset = 12 - now.hour
+    tz = f"Etc/GMT{-offset:+d}"
+    today = datetime.combine((now + timedelta(hours=offset)).date(), datetime.min.time(),
+                             tzinfo=timezone(timedelta(hours=offset)))
+    two_days_ago = today - timedelta(days=2)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        config_path = Path(data_dir) / "events.yaml"
+        config_path.write_text(EVENTS_YAML.format(tz=tz, venue=VENUE_ROTATION, game=GAME_ROTATION))
+
+        database = HostingDatabase(Path(data_dir) / "database.db")
+        database.create_tables()
+        rotations = RotationReadModel(database)
+        audit = HostingAudit(database)
+        venue_id = rotations.rotation_id(GUILD_ID, VENUE_ROTATION, create=True)
+        game_id = rotations.rotation_id(GUILD_ID, GAME_ROTATION, create=True)
+        for rotation_id in (venue_id, game_id):
+            for host_id in range(1, HOSTS + 1):
+                database.add_host(rotation_id, str(host_id), f"host{host_id}")
+
+        # Last handled: the occurrences two days ago, so yesterday's and today's were missed
+        database.set_rotation_schedule(GUILD_ID, "Early", last_advanced=two_days_ago.replace(hour=8))
+        database.set_rotation_schedule(GUILD_ID, "Late", last_advanced=two_days_ago.replace(hour=9, minute=30))
+        database.rotate_hosts(game_id, actor_id="1")
+
+        scheduler = RotationScheduler(
+            _Bot(), rotations, audit, RotationForecaster(config_path), CHANNEL_ID,
+            grace=timedelta(minutes=30), reminder_lead=timedelta(0),
+        )
+        asyncio.run(_catch_up(scheduler, args.seconds))
+        audit.flush()
+
+        venue = _rotations(database, venue_id)
+        game = _rotations(database, game_id)
+        state = database.get_rotation_schedule(GUILD_ID)
+
+    problems = []
+    if venue != (4, 0):
+        problems.append(f"venue rotation advanced {venue[0]} times automatically, expected 4")
+    if game != (1, 1):
+        problems.append(f"game rotation advanced {game[0]} times automatically, expected 1")
+    for event, start in (("Early", today.replace(hour=8)), ("Late", today.replace(hour=9, minute=30))):
+        if state.get(event, (None,))[0] != utc_timestamp(start):
+            problems.append(f"{event} is not marked as advanced for today")
+
+    print(f"Calendar timezone:   {tz}")
+    print(f"Venue rotation:      {venue[0]} automatic, {venue[1]} by hand")
+    print(f"Game rotation:       {game[0]} automatic, {game[1]} by hand")
+    print(f"Result:              {'OK' if not problems else 'FAILED: ' + '; '.join(problems)}")
+    return not problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=2.0, help="how long to let the scheduler catch up")
+    args = parser.parse_args()
+    raise SystemExit(0 if run(args) else 1)
+
+
+if __name__ == "__main__":
+    main()
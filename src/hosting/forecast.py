@@ -0,0 +1,105 @@
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+from src.community_cal.config import DEFAULT_CONFIG_PATH, CalendarConfig, load_config
+from src.community_cal.events import EventOccurrence, occurrences_for_month
+
+logger = logging.getLogger(__name__)
+
+# How far ahead occurrences are projected
+HORIZON_MONTHS = 24
+
+
+@dataclass(frozen=True)
+class Forecast:
+    """Who hosts each upcoming occurrence of a rotation's events, as of ``version``."""
+    version: int
+    schedule: Tuple[Tuple[EventOccurrence, dict], ...]
+
+    def dates_for(self, discord_id: str, count: Optional[int] = None) -> List[EventOccurrence]:
+        """The occurrences one host is projected to host, soonest first."""
+        dates = [occ for occ, host in self.schedule if host["discord_id"] == discord_id]
+        return dates if count is None else dates[:count]
+
+    def by_host(self, count: int) -> Dict[str, List[EventOccurrence]]:
+        """Each host's next ``count`` projected occurrences, keyed by discord id."""
+        dates: Dict[str, List[EventOccurrence]] = {}
+        for occ, host in self.schedule:
+            host_dates = dates.setdefault(host["discord_id"], [])
+            if len(host_dates) < count:
+                host_dates.append(occ)
+        return dates
+
+
+def project(hosts: Sequence[dict], occurrences: Sequence[EventOccurrence]) -> List[Tuple[EventOccurrence, dict]]:
+    """Assign hosts to occurrences the way ``rotate_hosts`` would advance the rotation.
+
+    Each occurrence goes to the first host, who then moves to the back, so
+    the hosts take turns in their current order. Snoozed hosts aren't in
+    ``hosts`` at all; deferring doesn't change the order.
+    """
+    if not hosts:
+        return []
+    return [(occ, hosts[i % len(hosts)]) for i, occ in enumerate(occurrences)]
+
+
+class RotationForecaster:
+    """Projects rotations onto the community calendar's upcoming events.
+
+    Events list the rotations that host them under ``rotations`` in
+    ``events.yaml``. Upcoming occurrences are expanded once per calendar
+    file version and day; forecasts are kept per rotation until its
+    snapshot version changes.
+    """
+
+    def __init__(self, config_path: Path = DEFAULT_CONFIG_PATH, horizon_months: int = HORIZON_MONTHS):
+        self.config_path = config_path
+        self.horizon_months = horizon_months
+        self._calendar: Optional[Tuple[float, CalendarConfig]] = None
+        self._occurrences: Dict[Tuple[float, date], List[EventOccurrence]] = {}
+        self._forecasts: Dict[int, Tuple[Hashable, Forecast]] = {}
+
+    def calendar(self) -> Tuple[float, CalendarConfig]:
+        """The calendar config and the file version it was loaded from."""
+        mtime = self.config_path.stat().st_mtime
+        if self._calendar is None or self._calendar[0] != mtime:
+            self._calendar = (mtime, load_config(self.config_path))
+            self._occurrences.clear()
+            self._forecasts.clear()
+        return self._calendar
+
+    def upcoming(self, now: Optional[datetime] = None) -> List[EventOccurrence]:
+        """Every occurrence that hasn't ended yet, within the horizon, in order."""
+        mtime, cfg = self.calendar()
+        now = now or datetime.now(cfg.tz)
+        key = (mtime, now.date())
+        occurrences = self._occurrences.get(key)
+        if occurrences is None:
+            occurrences = []
+            year, month = now.year, now.month
+            for _ in range(self.horizon_months):
+                occurrences.extend(occurrences_for_month(cfg, year, month))
+                year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+            # Only today's list is ever needed again
+            self._occurrences = {key: occurrences}
+        return [occ for occ in occurrences if occ.end >= now]
+
+    def linked_events(self, rotation: str) -> List[str]:
+        """Names of the events the rotation hosts."""
+        _, cfg = self.calendar()
+        return [event.name for event in cfg.events if rotation in event.rotations]
+
+    def forecast(self, rotation_id: int, rotation: str, snapshot, now: Optional[datetime] = None) -> Forecast:
+        """Forecast for a rotation's ``RotationSnapshot``, recomputed only when something changed."""
+        occurrences = [occ for occ in self.upcoming(now) if rotation in occ.event.rotations]
+        key = (rotation, snapshot.version, self._calendar[0], occurrences[0] if occurrences else None)
+        cached = self._forecasts.get(rotation_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        forecast = Forecast(snapshot.version, tuple(project(snapshot.hosts, occurrences)))
+        self._forecasts[rotation_id] = (key, forecast)
+        logger.info(f"Forecast {len(forecast.schedule)} occurrences for rotation {rotation}")
+        return forecast
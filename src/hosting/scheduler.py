@@ -0,0 +1,166 @@
+import asyncio
+import heapq
+import itertools
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+from src.community_cal.config import EventDef
+from src.community_cal.events import EventOccurrence, occurrences_between
+from src.database.hosting_db import DEFAULT_ROTATIONS, TIMESTAMP_FORMAT
+
+logger = logging.getLogger(__name__)
+
+ADVANCE = "advance"
+REMIND = "remind"
+
+# How far ahead to look for an event's next occurrence, and how far back for
+# the last one when an event is scheduled for the first time
+LOOKAHEAD = timedelta(days=400)
+LOOKBACK = timedelta(days=62)
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    if value is None:
+        return None
+    return datetime.strptime(value, TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc)
+
+
+class RotationScheduler:
+    """Advances rotations after the calendar events they host and reminds hosts beforehand.
+
+    Keeps a heap with each linked event's next advancement (the end of its
+    next occurrence plus the grace window) and next reminder (its start minus
+    the lead time), and sleeps until the earliest is due. The occurrence last
+    handled per event is stored, so after a restart missed advancements are
+    caught up and nothing is done twice. An advancement is skipped if the
+    rotation was already advanced by hand between the occurrence's start and
+    the next one's, which needs the audit log, so ``audit`` is flushed before
+    checking.
+    """
+
+    def __init__(self, bot, rotations, audit, forecaster, channel_id: int,
+                 grace: timedelta, reminder_lead: timedelta):
+        self.bot = bot
+        self.rotations = rotations
+        self.database = rotations.database
+        self.audit = audit
+        self.forecaster = forecaster
+        self.channel_id = channel_id
+        self.grace = grace
+        self.reminder_lead = reminder_lead
+        self._heap: List[Tuple[datetime, int, str, EventOccurrence]] = []
+        self._seq = itertools.count()
+        self._calendar_version = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start scheduling. Must be called from the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _push(self, kind: str, occurrence: Optional[EventOccurrence]):
+        if occurrence is None:
+            return
+        due = occurrence.end + self.grace if kind == ADVANCE else occurrence.start - self.reminder_lead
+        heapq.heappush(self._heap, (due, next(self._seq), kind, occurrence))
+
+    def _next_occurrence(self, event: EventDef, after: datetime) -> Optional[EventOccurrence]:
+        _, cfg = self.forecaster.calendar()
+        return next(
+            (occ for occ in occurrences_between(cfg, after, after + LOOKAHEAD)
+             if occ.event == event and occ.start > after),
+            None
+        )
+
+    def _schedule(self, guild_id: int, now: datetime):
+        """Rebuild the heap from the calendar and the stored progress."""
+        self._calendar_version, cfg = self.forecaster.calendar()
+        state = self.database.get_rotation_schedule(guild_id)
+        self._heap = []
+        for event in cfg.events:
+            if not event.rotations:
+                continue
+            last_advanced, last_reminded = (_parse_timestamp(value) for value in state.get(event.name, (None, None)))
+            if last_advanced is None:
+                # First time: start with the next occurrence rather than advancing for past ones
+                past = [
+                    occ for occ in occurrences_between(cfg, now - LOOKBACK, now)
+                    if occ.event == event and occ.end + self.grace <= now
+                ]
+                last_advanced = past[-1].start if past else now - LOOKBACK
+                self.database.set_rotation_schedule(guild_id, event.name, last_advanced=last_advanced)
+            self._push(ADVANCE, self._next_occurrence(event, last_advanced))
+            if self.reminder_lead:
+                # Only occurrences that haven't started yet are worth a (possibly late) reminder
+                self._push(REMIND, self._next_occurrence(event, max(last_reminded or now, now)))
+        logger.info(f"Scheduled {len(self._heap)} hosting timers for guild {guild_id}")
+
+    async def _run(self):
+        await self.bot.wait_until_ready()
+        channel = self.bot.get_channel(self.channel_id)
+        if channel is None or getattr(channel, "guild", None) is None:
+            logger.warning(f"Hosting rotation channel {self.channel_id} not found; not advancing rotations")
+            return
+        guild_id = channel.guild.id
+        self._schedule(guild_id, datetime.now(timezone.utc))
+
+        while self._heap:
+            due, _, kind, occurrence = self._heap[0]
+            delay = (due - datetime.now(timezone.utc)).total_seconds()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                if self.forecaster.calendar()[0] != self._calendar_version:
+                    self._schedule(guild_id, datetime.now(timezone.utc))
+                    continue
+            heapq.heappop(self._heap)
+            following = self._next_occurrence(occurrence.event, occurrence.start)
+            try:
+                if kind == ADVANCE:
+                    self._advance(guild_id, occurrence, following)
+                else:
+                    await self._remind(guild_id, channel, occurrence)
+            except Exception:
+                logger.exception(f"Failed to {kind} hosting rotations for {occurrence.event.name}")
+            self._push(kind, following)
+        logger.info("No calendar events are linked to a rotation; nothing to schedule")
+
+    def _rotation_id(self, guild_id: int, name: str) -> Optional[int]:
+        rotation_id = self.rotations.rotation_id(guild_id, name, create=name in DEFAULT_ROTATIONS)
+        if rotation_id is None:
+            logger.warning(f"Calendar event names rotation {name}, which doesn't exist")
+        return rotation_id
+
+    def _advance(self, guild_id: int, occurrence: EventOccurrence, following: Optional[EventOccurrence]):
+        event = occurrence.event
+        self.audit.flush()
+        for name in event.rotations:
+            rotation_id = self._rotation_id(guild_id, name)
+            if rotation_id is None:
+                continue
+            if self.database.rotated_by_hand_between(rotation_id, occurrence.start, following and following.start):
+                logger.info(f"{name} rotation was already advanced after {event.name} on {occurrence.start:%Y-%m-%d}")
+                continue
+            # No actor: automatic advances must not count as someone having rotated by hand
+            result = self.database.rotate_hosts(rotation_id, actor_id=None)
+            logger.info(f"Advanced {name} rotation after {event.name} on {occurrence.start:%Y-%m-%d}: {result}")
+        self.database.set_rotation_schedule(guild_id, event.name, last_advanced=occurrence.start)
+
+    async def _remind(self, guild_id: int, channel, occurrence: EventOccurrence):
+        event = occurrence.event
+        lines = [f"📅 **{event.name}** at {event.venue} is {occurrence.start:%A, %B %-d at %-I:%M %p}."]
+        for name in event.rotations:
+            rotation_id = self._rotation_id(guild_id, name)
+            host = self.rotations.next_host(rotation_id) if rotation_id is not None else None
+            if host:
+                lines.append(f"🎲 {name.capitalize()} host: <@{host['discord_id']}>")
+            else:
+                lines.append(f"❌ Nobody is in the {name} rotation.")
+        await channel.send("\n".join(lines))
+        self.database.set_rotation_schedule(guild_id, event.name, last_reminded=occurrence.start)
+        logger.info(f"Sent hosting reminder for {event.name} on {occurrence.start:%Y-%m-%d}")
@@ -0,0 +1,84 @@
+import logging
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RotationSnapshot:
+    """The active hosts of one rotation, in order, as of ``version``."""
+    version: int
+    hosts: Tuple[dict, ...]
+
+    @property
+    def next_host(self) -> Optional[dict]:
+        return self.hosts[0] if self.hosts else None
+
+
+class RotationReadModel:
+    """Serves hosting rotations from memory until they change.
+
+    Registers itself with the database, which reports every committed
+    rotation change; the affected snapshot and anything rendered from it are
+    dropped then. Until that happens, reads don't touch SQLite at all. Both
+    hosting cogs and anything else changing rotations must share the same
+    database object for this to see their changes.
+    """
+
+    def __init__(self, database):
+        self.database = database
+        self.hits = 0
+        self.misses = 0
+        self._ids: Dict[Tuple[int, str], int] = {}
+        self._snapshots: Dict[int, RotationSnapshot] = {}
+        self._rendered: Dict[Hashable, Tuple[Tuple[int, ...], object]] = {}
+        database.rotation_listeners.append(self.invalidate)
+
+    def invalidate(self, rotation_id: int):
+        self._snapshots.pop(rotation_id, None)
+
+    def rotation_id(self, guild_id: int, name: str, create: bool = False) -> Optional[int]:
+        """Id of a guild's rotation, looked up once and then remembered."""
+        key = (guild_id, name)
+        rotation_id = self._ids.get(key)
+        if rotation_id is None:
+            rotation_id = self.database.get_rotation_id(guild_id, name, create=create)
+            if rotation_id is not None:
+                self._ids[key] = rotation_id
+        return rotation_id
+
+    def forget_rotation(self, guild_id: int, name: str):
+        """Drop a deleted rotation."""
+        rotation_id = self._ids.pop((guild_id, name), None)
+        if rotation_id is not None:
+            self.invalidate(rotation_id)
+
+    def snapshot(self, rotation_id: int) -> RotationSnapshot:
+        snapshot = self._snapshots.get(rotation_id)
+        if snapshot is not None:
+            self.hits += 1
+            return snapshot
+        self.misses += 1
+        version, hosts = self.database.get_rotation_snapshot(rotation_id)
+        snapshot = RotationSnapshot(version, tuple(hosts))
+        self._snapshots[rotation_id] = snapshot
+        return snapshot
+
+    def hosts(self, rotation_id: int) -> List[dict]:
+        return list(self.snapshot(rotation_id).hosts)
+
+    def next_host(self, rotation_id: int) -> Optional[dict]:
+        return self.snapshot(rotation_id).next_host
+
+    def rendered(self, key: Hashable, rotation_ids: Sequence[int],
+                 render: Callable[[List[RotationSnapshot]], object]):
+        """``render(snapshots)``, memoized until any of the rotations changes."""
+        snapshots = [self.snapshot(rotation_id) for rotation_id in rotation_ids]
+        versions = tuple(snapshot.version for snapshot in snapshots)
+        cached = self._rendered.get(key)
+        if cached is not None and cached[0] == versions:
+            return cached[1]
+        value = render(snapshots)
+        self._rendered[key] = (versions, value)
+        return value
@@ -0,0 +1,125 @@
+"""Concurrency stress check for hosting rotation changes.
+
+Hammers one rotation from many threads, each with its own database
+connection as separate commands would have, then checks the rotation is
+still consistent::
+
+    python -m src.hosting.stress --threads 8 --operations 200
+
+Half the changes are made blindly (like the slash commands) and half
+against a version read beforehand, retrying on RotationConflict. The run
+fails if any change was lost or applied twice, if a host disappeared or
+was duplicated, if two hosts share a sort key, or if SQLite reported a
+locking error.
+"""
+import argparse
+import logging
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+from src.database.hosting_db import HostingDatabase, RotationConflict
+
+GUILD_ID = 1
+ROTATION = "stress"
+
+
+def _worker(db_file, rotation_id, host_ids, operations, seed, results):
+    database = HostingDatabase(db_file)
+    rng = random.Random(seed)
+    stats = Counter()
+    for _ in range(operations):
+        action = rng.choice(("rotate", "top", "bottom", "next", "swap"))
+        first, second = rng.sample(host_ids, 2)
+        optimistic = rng.random() < 0.5
+        while True:
+            expected = database.get_rotation_version(rotation_id) if optimistic else None
+            try:
+                if action == "rotate":
+                    database.rotate_hosts(rotation_id, expected_version=expected)
+                elif action == "swap":
+                    database.swap_hosts(rotation_id, first, second, expected_version=expected)
+                else:
+                    database.move_host(rotation_id, first, action, expected_version=expected)
+                stats["applied"] += 1
+                break
+            except RotationConflict:
+                stats["conflicts"] += 1
+            except sqlite3.OperationalError as e:
+                stats["errors"] += 1
+                logging.error(f"{action} failed: {e}")
+                break
+    results.append(stats)
+
+
+def run(args) -> bool:
+    logging.getLogger('hosting_rotation').setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        db_file = Path(data_dir) / "database.db"
+        database = HostingDatabase(db_file)
+        database.create_tables()
+        rotation_id = database.get_rotation_id(GUILD_ID, ROTATION, create=True)
+        host_ids = [str(i) for i in range(1, args.hosts + 1)]
+        for host_id in host_ids:
+            database.add_host(rotation_id, host_id, f"host{host_id}")
+        start_version = database.get_rotation_version(rotation_id)
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=_worker,
+                args=(db_file, rotation_id, host_ids, args.operations, args.seed + i, results)
+            )
+            for i in range(args.threads)
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        totals = sum(results, Counter())
+        hosts = database.get_all_hosts(rotation_id)
+        keys = database._execute(
+            "SELECT sort_key FROM rotation_member WHERE rotation_id = ? AND active = 1", (rotation_id,)
+        )
+        versions = database.get_rotation_version(rotation_id) - start_version
+
+    problems = []
+    if versions != totals["applied"]:
+        problems.append(f"{totals['applied']} changes applied but the version moved by {versions}")
+    if sorted(h["discord_id"] for h in hosts) != sorted(host_ids):
+        problems.append("hosts were lost or duplicated")
+    if [h["position"] for h in hosts] != list(range(1, len(host_ids) + 1)):
+        problems.append("positions are not 1..N")
+    if len({key for key, in keys}) != len(keys):
+        problems.append("two hosts share a sort key")
+    if totals["errors"]:
+        problems.append(f"{totals['errors']} changes failed with SQLite errors")
+
+    print(f"Threads × operations: {args.threads} × {args.operations} on {args.hosts} hosts")
+    print(f"Applied:              {totals['applied']} in {elapsed:.2f}s "
+          f"({totals['applied'] / elapsed:,.0f} changes/s, {elapsed / max(totals['applied'], 1) * 1000:.2f} ms each)")
+    print(f"Version conflicts:    {totals['conflicts']} (retried)")
+    print(f"Result:               {'OK' if not problems else 'FAILED: ' + '; '.join(problems)}")
+    return not problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--operations", type=int, default=200, help="changes per thread")
+    parser.add_argument("--hosts", type=int, default=12)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    raise SystemExit(0 if run(args) else 1)
+
+
+if __name__ == "__main__":
+    main()
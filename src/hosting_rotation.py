@@ -1,15 +1,45 @@
 import logging
+import re
 import sqlite3
+from datetime import timedelta
+from typing import List, Optional
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
 from src.database import Database
+from src.database.hosting_db import DEFAULT_ROTATIONS, GAME_ROTATION, VENUE_ROTATION, RotationConflict
 from src.config import Config
+from src.hosting.audit import HostingAudit
+from src.hosting.forecast import RotationForecaster
+from src.hosting.scheduler import RotationScheduler
+from src.hosting.snapshot import RotationReadModel
 
 logger = logging.getLogger(__name__)
 
+MENTION_PATTERN = re.compile(r"<@!?(\d+)>")
+# Discord's message length limit
+MESSAGE_LIMIT = 2000
+# Reply when an order-dependent change finds the rotation changed under it
+CONFLICT_MESSAGE = "⚠️ The {rotation} rotation changed while this command ran. Check `/host_list` and try again."
+# Audit entries per /host_history page
+HISTORY_PAGE_SIZE = 10
+# How /host_history describes each audited action
+AUDIT_ACTIONS = {
+    "add": "added",
+    "import": "imported",
+    "remove": "removed",
+    "rotate": "rotated (hosted)",
+    "defer": "deferred",
+    "snooze": "snoozed",
+    "activate": "reactivated",
+    "move_top": "moved to the top",
+    "move_bottom": "moved to the bottom",
+    "move_next": "moved to next",
+    "swap": "swapped",
+}
+
 def host_command():
     """Combined decorator for host commands."""
     def decorator(func):
@@ -20,63 +50,250 @@ def host_command():
         )
     return decorator
 
-class HostingRotationCommands(commands.Cog):
-    """Commands for managing the game hosts."""
+async def rotation_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+    """Suggest the names of this guild's rotations."""
+    cog = interaction.client.get_cog("HostingRotationCommands")
+    if cog is None or interaction.guild_id is None:
+        return []
+    return [
+        app_commands.Choice(name=name, value=name)
+        for _, name, _ in cog.database.get_rotations(interaction.guild_id)
+        if current.lower() in name.lower()
+    ][:25]
+
+def _host_line(host):
+    return f"{host['position']}. {host['username']}"
+
+class RotationCog(commands.Cog):
+    """Shared setup and rotation lookup for the hosting cogs.
+
+    Pass the first cog's ``rotations`` to the others so they share one
+    database and one in-memory read model.
+    """
 
-    def __init__(self, bot):
+    def __init__(self, bot, rotations: Optional[RotationReadModel] = None):
         self.bot = bot
         self.config = Config.load()  # Load config per instance
-        self.database = Database(self.config.database_path)  # Create database per instance
+        if rotations is None:
+            rotations = RotationReadModel(Database(self.config.database_path))
+        self.rotations = rotations
+        self.database = rotations.database
         self.hosting_rotation_channel_id = self.config.hosting_rotation_channel_id
 
+    async def _resolve_rotation(self, interaction: discord.Interaction, name: str) -> Optional[int]:
+        """Id of the guild's rotation called ``name``; replies with an error and returns None if it doesn't exist."""
+        rotation_id = self.rotations.rotation_id(interaction.guild_id, name, create=name in DEFAULT_ROTATIONS)
+        if rotation_id is None:
+            await interaction.response.send_message(
+                f"❌ There is no `{name}` rotation. Create it with `/rotation_create`."
+            )
+        return rotation_id
+
+    def _shown_version(self, rotation_id: int) -> int:
+        """Version of the rotation as the read model (and so /host_list) shows it.
+
+        Changes that depend on the order (move, swap, rotate) pass it as
+        ``expected_version``, so they fail with RotationConflict instead of
+        applying to an order nobody was shown.
+        """
+        return self.rotations.snapshot(rotation_id).version
+
+    async def _reply_conflict(self, interaction: discord.Interaction, rotation_id: int, name: str):
+        # The snapshot was stale (changed through another connection); show the new order next time
+        self.rotations.invalidate(rotation_id)
+        await interaction.response.send_message(CONFLICT_MESSAGE.format(rotation=name))
+
+class HostingRotationCommands(RotationCog):
+    """Commands for managing the game hosts.
+
+    These work on the venue rotation unless another rotation is named.
+    """
+
+    def __init__(self, bot, rotations: Optional[RotationReadModel] = None):
+        super().__init__(bot, rotations)
+        self.forecaster = RotationForecaster()
+        # Records changes made through either hosting cog, since they share the database
+        self.audit = HostingAudit(self.database)
+        self.scheduler = RotationScheduler(
+            bot, self.rotations, self.audit, self.forecaster, self.hosting_rotation_channel_id,
+            grace=timedelta(minutes=self.config.hosting_advance_grace_minutes),
+            reminder_lead=timedelta(hours=self.config.hosting_reminder_hours),
+        )
+
+    async def cog_load(self):
+        self.audit.start()
+        self.scheduler.start()
+
+    def cog_unload(self):
+        self.scheduler.close()
+        self.audit.close()
+
+    @host_command()
+    @app_commands.describe(name="Name of the new rotation")
+    @app_commands.default_permissions(administrator=True)
+    async def rotation_create(self, interaction: discord.Interaction, name: str):
+        """Creates a new hosting rotation"""
+        logger.info(f"🔄 Received command: /rotation_create {name}")
+
+        name = name.strip().lower()
+        if self.rotations.rotation_id(interaction.guild_id, name) is not None:
+            await interaction.response.send_message(f"❌ A `{name}` rotation already exists.")
+            return
+        self.rotations.rotation_id(interaction.guild_id, name, create=True)
+        await interaction.response.send_message(f"✅ Created the `{name}` rotation!")
+        logger.info(f"✅ Created rotation {name} in guild {interaction.guild_id}")
+
     @host_command()
-    @app_commands.describe(member="The user to add to the host list")
-    async def host_add(self, interaction: discord.Interaction, member: discord.Member):
+    @app_commands.describe(name="The rotation to delete")
+    @app_commands.autocomplete(name=rotation_autocomplete)
+    @app_commands.default_permissions(administrator=True)
+    async def rotation_delete(self, interaction: discord.Interaction, name: str):
+        """Deletes a hosting rotation and its host list"""
+        logger.info(f"🔄 Received command: /rotation_delete {name}")
+
+        if name in DEFAULT_ROTATIONS:
+            await interaction.response.send_message(f"❌ The `{name}` rotation can't be deleted.")
+            return
+        rotation_id = await self._resolve_rotation(interaction, name)
+        if rotation_id is None:
+            return
+        self.database.delete_rotation(rotation_id)
+        self.rotations.forget_rotation(interaction.guild_id, name)
+        await interaction.response.send_message(f"✅ Deleted the `{name}` rotation.")
+        logger.info(f"✅ Deleted rotation {name} in guild {interaction.guild_id}")
+
+    @host_command()
+    async def rotation_list(self, interaction: discord.Interaction):
+        """Lists this server's hosting rotations"""
+        logger.info("🔄 Received command: /rotation_list")
+
+        for name in DEFAULT_ROTATIONS:
+            self.rotations.rotation_id(interaction.guild_id, name, create=True)
+        rotations = self.database.get_rotations(interaction.guild_id)
+        await interaction.response.send_message(
+            "\n".join(f"• `{name}`: {count} active hosts" for _, name, count in rotations)
+        )
+
+    @host_command()
+    @app_commands.describe(member="The user to add to the host list", rotation="Which rotation (default: venue)")
+    @app_commands.autocomplete(rotation=rotation_autocomplete)
+    async def host_add(self, interaction: discord.Interaction, member: discord.Member, rotation: str = VENUE_ROTATION):
         """Adds a user to the host list"""
-        logger.info(f"🔄 Received command: /host_add {member.name} (ID: {member.id})")
+        logger.info(f"🔄 Received command: /host_add {member.name} (ID: {member.id}) to {rotation}")
 
-        self.database.add_host(str(member.id), member.name)
+        rotation_id = await self._resolve_rotation(interaction, rotation)
+        if rotation_id is None:
+            return
+        self.database.add_host(rotation_id, str(member.id), member.name, actor_id=str(interaction.user.id))
         await interaction.response.send_message(
-            f"✅ {member.name} has been added to the host list!"
+            f"✅ {member.name} has been added to the {rotation} host list!"
         )
-        logger.info(f"✅ Successfully added {member.name} (ID: {member.id}) to the host list.")
+        logger.info(f"✅ Successfully added {member.name} (ID: {member.id}) to the {rotation} host list.")
 
     @host_command()
-    @app_commands.describe(member="The user to remove from the host list")
-    async def host_remove(self, interaction: discord.Interaction, member: discord.Member):
-        """Removes a user from the host list"""
-        logger.info(f"🔄 Received command: /host_remove {member.name}")
+    @app_commands.describe(member="The user to remove from the host list", rotation="Which rotation (default: all of them)")
+    @app_commands.autocomplete(rotation=rotation_autocomplete)
+    async def host_remove(self, interaction: discord.Interaction, member: discord.Member, rotation: Optional[str] = None):
+        """Removes a user from every host list, or from one rotation's"""
+        logger.info(f"🔄 Received command: /host_remove {member.name} from {rotation or 'all rotations'}")
 
         try:
-            self.database.connect()
-            cursor = self.database.cursor
+            if rotation is None:
+                removed_from = [
+                    name for rotation_id, name, _ in self.database.get_rotations(interaction.guild_id)
+                    if self.database.remove_host(rotation_id, str(member.id), actor_id=str(interaction.user.id))
+                ]
+                if not removed_from:
+                    await interaction.response.send_message(f"❌ {member.name} is not in any host list.")
+                    return
+                lists = "host lists" if len(removed_from) > 1 else "host list"
+                await interaction.response.send_message(
+                    f"✅ {member.name} has been removed from the {' and '.join(removed_from)} {lists}."
+                )
+                logger.info(f"✅ Removed {member.name} from the {', '.join(removed_from)} host lists")
+                return
 
-            cursor.execute("DELETE FROM hosting_rotation WHERE discord_id=?", (str(member.id),))
-            if cursor.rowcount == 0:
-                await interaction.response.send_message(f"❌ {member.name} is not in the host list.")
+            rotation_id = await self._resolve_rotation(interaction, rotation)
+            if rotation_id is None:
+                return
+            if not self.database.remove_host(rotation_id, str(member.id), actor_id=str(interaction.user.id)):
+                await interaction.response.send_message(f"❌ {member.name} is not in the {rotation} host list.")
                 return
 
-            self.database.conn.commit()
-            await interaction.response.send_message(f"✅ {member.name} has been removed from the host list.")
-            logger.info(f"✅ Removed {member.name} from the host list")
+            await interaction.response.send_message(f"✅ {member.name} has been removed from the {rotation} host list.")
+            logger.info(f"✅ Removed {member.name} from the {rotation} host list")
 
         except sqlite3.Error as e:
             logger.error(f"Database error removing host {member.id}: {e}")
-            self.database.conn.rollback()
             await interaction.response.send_message("❌ A database error occurred while processing this command.")
         except Exception:
             logger.exception(f"Unexpected error removing host {member.id}")
-            self.database.conn.rollback()
             await interaction.response.send_message("❌ An unexpected error occurred while processing this command.")
-        finally:
-            self.database.close()
 
     @host_command()
-    async def host_next(self, interaction: discord.Interaction):
+    @app_commands.describe(
+        role="Add every member of this role",
+        members="Or: mention the members to add, in order",
+        rotation="Which rotation (default: venue)",
+    )
+    @app_commands.autocomplete(rotation=rotation_autocomplete)
+    async def host_import(self, interaction: discord.Interaction, role: Optional[discord.Role] = None,
+                          members: Optional[str] = None, rotation: str = VENUE_ROTATION):
+        """Adds every member of a role (or every mentioned member) to the host list"""
+        logger.info(f"🔄 Received command: /host_import {role.name if role else members} to {rotation}")
+
+        if role is not None:
+            # Role order isn't meaningful, so add them alphabetically
+            to_add = sorted((m for m in role.members if not m.bot), key=lambda m: m.display_name.lower())
+        else:
+            to_add = [
+                member for member in (
+                    interaction.guild.get_member(int(member_id))
+                    for member_id in MENTION_PATTERN.findall(members or "")
+                )
+                if member is not None and not member.bot
+            ]
+        if not to_add:
+            await interaction.response.send_message(
+                "❌ Nobody to add. Pick a role with members (the bot needs the Server Members intent "
+                "to see them) or mention the members to add."
+            )
+            return
+
+        try:
+            rotation_id = await self._resolve_rotation(interaction, rotation)
+            if rotation_id is None:
+                return
+            added, skipped = self.database.add_hosts(
+                rotation_id, [(str(member.id), member.name) for member in to_add], actor_id=str(interaction.user.id)
+            )
+        except sqlite3.Error as e:
+            logger.error(f"Database error importing hosts: {e}")
+            await interaction.response.send_message("❌ A database error occurred while processing this command.")
+            return
+
+        names = {str(member.id): member.name for member in to_add}
+        lines = [f"✅ Added {len(added)} hosts to the {rotation} host list"
+                 + (f": {', '.join(names[i] for i in added)}" if added else ".")]
+        if skipped:
+            lines.append(f"⏭️ Skipped {len(skipped)} already in it: {', '.join(names[i] for i in skipped)}")
+        message = "\n".join(lines)
+        if len(message) > MESSAGE_LIMIT:
+            message = message[:MESSAGE_LIMIT - 1] + "…"
+        await interaction.response.send_message(message)
+        logger.info(f"✅ Imported {len(added)} hosts into {rotation}, skipped {len(skipped)}")
+
+    @host_command()
+    @app_commands.describe(rotation="Which rotation (default: venue)")
+    @app_commands.autocomplete(rotation=rotation_autocomplete)
+    async def host_next(self, interaction: discord.Interaction, rotation: str = VENUE_ROTATION):
         """Shows who's next in the list"""
-        logger.info("🔄 Received command: /host_next")
+        logger.info(f"🔄 Received command: /host_next {rotation}")
 
-        host = self.database.get_next_host()
+        rotation_id = await self._resolve_rotation(interaction, rotation)
+        if rotation_id is None:
+            return
+        host = self.rotations.next_host(rotation_id)
         if host:
             await interaction.response.send_message(
                 f"🎲 The next host is: **{host['username']}**"
@@ -90,20 +307,31 @@ class HostingRotationCommands(commands.Cog):
     @app_commands.describe(
         member="The user to move",
         position="Where to move them (top/bottom/next)",
+        rotation="Which rotation (default: venue)",
     )
     @app_commands.choices(position=[
         app_commands.Choice(name="Top of list", value="top"),
         app_commands.Choice(name="Bottom of list", value="bottom"),
         app_commands.Choice(name="Next in line", value="next")
     ])
-    async def host_move(self, interaction: discord.Interaction, member: discord.Member, position: app_commands.Choice[str]):
+    @app_commands.autocomplete(rotation=rotation_autocomplete)
+    async def host_move(self, interaction: discord.Interaction, member: discord.Member, position: app_commands.Choice[str],
+                        rotation: str = VENUE_ROTATION):
         """Move a host to a specific position"""
-        logger.info(f"🔄 Received command: /host_move {member.name} to {position.value}")
+        logger.info(f"🔄 Received command: /host_move {member.name} to {position.value} in {rotation}")
         
         try:
-            result = self.database.move_host(str(member.id), position.value, host_type_id=1)
+            rotation_id = await self._resolve_rotation(interaction, rotation)
+            if rotation_id is None:
+                return
+            result = self.database.move_host(
+                rotation_id, str(member.id), position.value,
+                expected_version=self._shown_version(rotation_id), actor_id=str(interaction.user.id)
+            )
             await interaction.response.send_message(f"✅ {result}")
             logger.info(f"✅ Successfully moved {member.name} to {position.value}")
+        except RotationConflict:
+            await self._reply_conflict(interaction, rotation_id, rotation)
         except sqlite3.Error as e:
             logger.error(f"Database error moving host {member.id}: {e}")
             await interaction.response.send_message("❌ A database error occurred while processing this command.")
@@ -112,79 +340,197 @@ class HostingRotationCommands(commands.Cog):
             await interaction.response.send_message("❌ An unexpected error occurred while processing this command.")
 
     @host_command()
-    @app_commands.describe(first="First host", second="Second host")
-    async def host_swap(self, interaction: discord.Interaction, first: discord.Member, second: discord.Member):
+    @app_commands.describe(first="First host", second="Second host", rotation="Which rotation (default: venue)")
+    @app_commands.autocomplete(rotation=rotation_autocomplete)
+    async def host_swap(self, interaction: discord.Interaction, first: discord.Member, second: discord.Member,
+                        rotation: str = VENUE_ROTATION):
         """Swap the positions of two hosts"""
-        logger.info(f"🔄 Received command: /host_swap {first.name} {second.name}")
+        logger.info(f"🔄 Received command: /host_swap {first.name} {second.name} in {rotation}")
         
         try:
-            self.database.connect()
-            cursor = self.database.cursor
-
-            cursor.execute("SELECT username, order_position FROM hosting_rotation WHERE discord_id=? AND active=1",
-                           (str(first.id),))
-            host1 = cursor.fetchone()
-
-            cursor.execute("SELECT username, order_position FROM hosting_rotation WHERE discord_id=? AND active=1",
-                           (str(second.id),))
-            host2 = cursor.fetchone()
-
-            if not host1 or not host2:
-                missing = []
-                if not host1:
-                    missing.append(first.name)
-                if not host2:
-                    missing.append(second.name)
-
+            rotation_id = await self._resolve_rotation(interaction, rotation)
+            if rotation_id is None:
+                return
+            missing_ids = self.database.swap_hosts(
+                rotation_id, str(first.id), str(second.id),
+                expected_version=self._shown_version(rotation_id), actor_id=str(interaction.user.id)
+            )
+            if missing_ids:
+                missing = [member.name for member in (first, second) if str(member.id) in missing_ids]
                 await interaction.response.send_message(f"❌ {', '.join(missing)} not found in active rotation.")
                 logger.warning(f"Hosts not found or not active for swap command: {', '.join(missing)}")
-                self.database.close()
                 return
 
-            username1, position1 = host1
-            username2, position2 = host2
-
-            logger.info(f"Swapping {username1} (position {position1}) with {username2} (position {position2})")
-
-            cursor.execute("UPDATE hosting_rotation SET order_position = ? WHERE discord_id = ?",
-                         (position2, str(first.id)))
-            cursor.execute("UPDATE hosting_rotation SET order_position = ? WHERE discord_id = ?",
-                         (position1, str(second.id)))
-
-            self.database.conn.commit()
-            self.database.close()
-
-            await interaction.response.send_message(f"✅ Swapped positions of {username1} and {username2}!")
-            logger.info(f"✅ Swapped positions of {username1} and {username2}")
+            await interaction.response.send_message(f"✅ Swapped positions of {first.name} and {second.name}!")
+            logger.info(f"✅ Swapped positions of {first.name} and {second.name}")
 
+        except RotationConflict:
+            await self._reply_conflict(interaction, rotation_id, rotation)
         except sqlite3.Error as e:
             logger.error(f"Database error in swap_position command: {e}")
-            self.database.conn.rollback()
-            self.database.close()
             await interaction.response.send_message("❌ A database error occurred while processing this command.")
         except Exception:
             logger.exception("Unexpected error in swap_position command")
-            self.database.conn.rollback()
-            self.database.close()
             await interaction.response.send_message("❌ An unexpected error occurred while processing this command.")
 
     @host_command()
-    async def host_rotate(self, interaction: discord.Interaction):
+    @app_commands.describe(rotation="Which rotation (default: venue)")
+    @app_commands.autocomplete(rotation=rotation_autocomplete)
+    async def host_rotate(self, interaction: discord.Interaction, rotation: str = VENUE_ROTATION):
         """Moves the current host to the bottom of the list"""
-        logger.info("🔄 Received command: /host_rotate")
+        logger.info(f"🔄 Received command: /host_rotate {rotation}")
 
-        result = self.database.rotate_hosts()
+        rotation_id = await self._resolve_rotation(interaction, rotation)
+        if rotation_id is None:
+            return
+        try:
+            result = self.database.rotate_hosts(
+                rotation_id, expected_version=self._shown_version(rotation_id), actor_id=str(interaction.user.id)
+            )
+        except RotationConflict:
+            await self._reply_conflict(interaction, rotation_id, rotation)
+            return
         await interaction.response.send_message("✅ Hosting rotation updated!")
         logger.info(f"✅ Hosting rotation has been updated. {result}")
 
     @host_command()
-    async def host_list(self, interaction: discord.Interaction):
+    @app_commands.describe(
+        rotation="Which rotation (default: venue)",
+        count="How many dates to show per host",
+        member="Only show this host's dates",
+    )
+    @app_commands.autocomplete(rotation=rotation_autocomplete)
+    async def host_forecast(self, interaction: discord.Interaction, rotation: str = VENUE_ROTATION,
+                            count: app_commands.Range[int, 1, 10] = 1, member: Optional[discord.Member] = None):
+        """Shows who is projected to host upcoming events"""
+        logger.info(f"🔄 Received command: /host_forecast {rotation} {count} {member.name if member else ''}")
+
+        rotation_id = await self._resolve_rotation(interaction, rotation)
+        if rotation_id is None:
+            return
+        try:
+            if not self.forecaster.linked_events(rotation):
+                await interaction.response.send_message(
+                    f"❌ No calendar event is hosted by the `{rotation}` rotation. "
+                    f"Add `rotations: [{rotation}]` to an event in the community calendar's events.yaml."
+                )
+                return
+            snapshot = self.rotations.snapshot(rotation_id)
+            forecast = self.forecaster.forecast(rotation_id, rotation, snapshot)
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"Failed to load the community calendar: {e}")
+            await interaction.response.send_message("❌ Couldn't read the community calendar.")
+            return
+
+        def when(occurrences):
+            return ", ".join(f"{occ.start:%a %b %-d} ({occ.event.short_label})" for occ in occurrences) or "—"
+
+        if member is not None:
+            if not any(host["discord_id"] == str(member.id) for host in snapshot.hosts):
+                await interaction.response.send_message(f"❌ {member.name} is not active in the {rotation} rotation.")
+                return
+            await interaction.response.send_message(
+                f"📅 {member.name} is projected to host on: {when(forecast.dates_for(str(member.id), count))}"
+            )
+            return
+
+        dates = forecast.by_host(count)
+        lines = [f"{_host_line(host)}: {when(dates.get(host['discord_id'], []))}" for host in snapshot.hosts]
+        embed = discord.Embed(
+            title=f"📅 {rotation.capitalize()} Hosting Forecast",
+            description="\n".join(lines)[:4096] or "No hosts",
+            color=discord.Color.blue()
+        )
+        embed.set_footer(text="Projected from the current order; changes to the rotation change the forecast")
+        await interaction.response.send_message(embed=embed)
+        logger.info(f"✅ Displayed forecast for {rotation}")
+
+    @host_command()
+    @app_commands.describe(rotation="Which rotation (default: venue)", page="Page to show, newest first")
+    @app_commands.autocomplete(rotation=rotation_autocomplete)
+    async def host_history(self, interaction: discord.Interaction, rotation: str = VENUE_ROTATION,
+                           page: app_commands.Range[int, 1] = 1):
+        """Shows who changed a rotation and how"""
+        logger.info(f"🔄 Received command: /host_history {rotation} {page}")
+
+        try:
+            rotation_id = await self._resolve_rotation(interaction, rotation)
+            if rotation_id is None:
+                return
+            self.audit.flush()
+            rows, total = self.database.get_rotation_audit(
+                rotation_id, HISTORY_PAGE_SIZE, (page - 1) * HISTORY_PAGE_SIZE
+            )
+        except sqlite3.Error as e:
+            logger.error(f"Database error reading history of {rotation}: {e}")
+            await interaction.response.send_message("❌ A database error occurred while processing this command.")
+            return
+
+        pages = max(1, -(-total // HISTORY_PAGE_SIZE))
+        if not rows:
+            await interaction.response.send_message(
+                f"❌ Page {page} is past the end; the {rotation} history has {pages} page(s)." if total
+                else f"No changes to the {rotation} rotation have been recorded yet."
+            )
+            return
+
+        def position(value):
+            return "—" if value is None else f"#{value}"
+
+        lines = []
+        for created_at, actor_id, action, discord_id, username, before, after in rows:
+            actor = f"<@{actor_id}>" if actor_id else "automatically"
+            lines.append(
+                f"`{created_at[:16]}` **{username or discord_id}** {AUDIT_ACTIONS.get(action, action)} "
+                f"by {actor} ({position(before)} → {position(after)})"
+            )
+        embed = discord.Embed(
+            title=f"📜 {rotation.capitalize()} Rotation History",
+            description="\n".join(lines),
+            color=discord.Color.blue()
+        )
+        embed.set_footer(text=f"Page {page} of {pages} · {total} changes · times in UTC")
+        await interaction.response.send_message(embed=embed)
+        logger.info(f"✅ Displayed page {page} of the {rotation} history")
+
+    @host_command()
+    @app_commands.describe(rotation="Show only this rotation (default: venue and game)")
+    @app_commands.autocomplete(rotation=rotation_autocomplete)
+    async def host_list(self, interaction: discord.Interaction, rotation: Optional[str] = None):
         """Displays both venue and game host rotations"""
-        logger.info("🔄 Received command: /host_list")
+        logger.info(f"🔄 Received command: /host_list {rotation or ''}")
 
-        venue_hosts = self.database.get_all_hosts(host_type_id=1)
-        game_hosts = self.database.get_all_hosts(host_type_id=2)
-        
+        if rotation is not None:
+            rotation_id = await self._resolve_rotation(interaction, rotation)
+            if rotation_id is None:
+                return
+            embed = self.rotations.rendered(
+                ("rotation", rotation_id), [rotation_id],
+                lambda snapshots: self._render_rotation(rotation, snapshots[0].hosts)
+            )
+            await interaction.response.send_message(embed=embed)
+            return
+
+        venue_id = await self._resolve_rotation(interaction, VENUE_ROTATION)
+        game_id = await self._resolve_rotation(interaction, GAME_ROTATION)
+        embed = self.rotations.rendered(
+            ("schedule", interaction.guild_id), [venue_id, game_id],
+            lambda snapshots: self._render_schedule(snapshots[0].hosts, snapshots[1].hosts)
+        )
+        await interaction.response.send_message(embed=embed)
+        logger.info("✅ Displayed host list")
+
+    @staticmethod
+    def _render_rotation(name, hosts):
+        return discord.Embed(
+            title=f"🏡 {name.capitalize()} Host Rotation",
+            description="\n".join(_host_line(h) for h in hosts) or "No hosts",
+            color=discord.Color.blue()
+        )
+
+    @staticmethod
+    def _render_schedule(venue_hosts, game_hosts):
+        """The /host_list embed for the venue and game rotations."""
         embed = discord.Embed(
             title="🏡 Hosting Schedule",
             description="Current venue hosts and secondary game hosts rotations",
@@ -212,8 +558,8 @@ class HostingRotationCommands(commands.Cog):
             embed.add_field(name="\u200b", value="\u200b", inline=False)  # Spacer
 
         # Show full rotations side by side
-        venue_list = "\n".join([f"{h['position']}. {h['username']}" for h in venue_hosts]) if venue_hosts else "No venue hosts"
-        game_list = "\n".join([f"{h['position']}. {h['username']}" for h in game_hosts]) if game_hosts else "No game hosts"
+        venue_list = "\n".join([_host_line(h) for h in venue_hosts]) if venue_hosts else "No venue hosts"
+        game_list = "\n".join([_host_line(h) for h in game_hosts]) if game_hosts else "No game hosts"
         
         embed.add_field(
             name="📋 Venue Host Rotation",
@@ -225,9 +571,7 @@ class HostingRotationCommands(commands.Cog):
             value=game_list,
             inline=True
         )
-        
-        await interaction.response.send_message(embed=embed)
-        logger.info(f"✅ Displayed host list with {len(venue_hosts)} venue hosts and {len(game_hosts)} game hosts")
+        return embed
 
     @host_command()
     async def host_help(self, interaction: discord.Interaction):
@@ -249,7 +593,12 @@ class HostingRotationCommands(commands.Cog):
                 "**/host_move @user [top/bottom/next]** - Move venue host position\n"
                 "**/host_swap @user1 @user2** - Swap venue hosts\n"
                 "**/host_add @user** - Add venue host\n"
-                "**/host_remove @user** - Remove venue host"
+                "**/host_import @role** - Add everyone with a role\n"
+                "**/host_forecast [count] [@user]** - Shows projected hosting dates\n"
+                "**/host_history [page]** - Shows who changed the rotation and when\n"
+                "**/host_remove @user** - Remove a host from every rotation\n"
+                "Each of these takes an optional rotation name to work on another rotation "
+                "(for /host_remove, to remove them from that rotation only)"
             ),
             inline=False
         )
@@ -266,19 +615,23 @@ class HostingRotationCommands(commands.Cog):
             ),
             inline=False
         )
+
+        embed.add_field(
+            name="🔁 Rotations",
+            value=(
+                "**/rotation_list** - Shows this server's rotations\n"
+                "**/rotation_create name** - Create another rotation\n"
+                "**/rotation_delete name** - Delete a rotation"
+            ),
+            inline=False
+        )
         
         embed.set_footer(text="Commands must be used in the designated channel")
         await interaction.response.send_message(embed=embed)
         logger.info("✅ Displayed hosting help information")
 
-class SecondaryHostCommands(commands.Cog):
+class SecondaryHostCommands(RotationCog):
     """Commands for managing the secondary game hosts."""
-    
-    def __init__(self, bot):
-        self.bot = bot
-        self.config = Config.load()
-        self.database = Database(self.config.database_path)
-        self.hosting_rotation_channel_id = self.config.hosting_rotation_channel_id
 
     @host_command()
     @app_commands.describe(member="The user to add to the game host list")
@@ -287,8 +640,10 @@ class SecondaryHostCommands(commands.Cog):
         logger.info(f"🔄 Adding secondary host: {member.name}")
         
         try:
-            # Remove debug_schema call since we've confirmed schema is correct
-            success = self.database.add_host(str(member.id), member.name, host_type_id=2)
+            rotation_id = await self._resolve_rotation(interaction, GAME_ROTATION)
+            if rotation_id is None:
+                return
+            success = self.database.add_host(rotation_id, str(member.id), member.name, actor_id=str(interaction.user.id))
             if success:
                 await interaction.response.send_message(
                     f"✅ {member.name} has been added to the game host list!"
@@ -314,11 +669,10 @@ class SecondaryHostCommands(commands.Cog):
         """Removes a user from the game host list"""
         logger.info(f"🔄 Removing secondary host: {member.name}")
         try:
-            cursor = self._execute(
-                "UPDATE hosting_rotation SET game_active=0, game_position=NULL WHERE discord_id=?",
-                (str(member.id),)
-            )
-            if cursor.rowcount == 0:
+            rotation_id = await self._resolve_rotation(interaction, GAME_ROTATION)
+            if rotation_id is None:
+                return
+            if not self.database.remove_host(rotation_id, str(member.id), actor_id=str(interaction.user.id)):
                 await interaction.response.send_message(f"❌ {member.name} is not in the game host list.")
                 return
             await interaction.response.send_message(f"✅ {member.name} has been removed from the game host list.")
@@ -332,7 +686,10 @@ class SecondaryHostCommands(commands.Cog):
     @host_command()
     async def host2_next(self, interaction: discord.Interaction):
         """Shows who's next in the game host list"""
-        host = self.database.get_next_host(host_type_id=2)
+        rotation_id = await self._resolve_rotation(interaction, GAME_ROTATION)
+        if rotation_id is None:
+            return
+        host = self.rotations.next_host(rotation_id)
         if host:
             await interaction.response.send_message(
                 f"🎲 The next game host is: **{host['username']}**"
@@ -343,19 +700,31 @@ class SecondaryHostCommands(commands.Cog):
     @host_command()
     async def host2_rotate(self, interaction: discord.Interaction):
         """Moves the current game host to the bottom of the list"""
-        result = self.database.rotate_hosts(host_type_id=2)
+        rotation_id = await self._resolve_rotation(interaction, GAME_ROTATION)
+        if rotation_id is None:
+            return
+        try:
+            result = self.database.rotate_hosts(
+                rotation_id, expected_version=self._shown_version(rotation_id), actor_id=str(interaction.user.id)
+            )
+        except RotationConflict:
+            await self._reply_conflict(interaction, rotation_id, GAME_ROTATION)
+            return
         await interaction.response.send_message("✅ Game host rotation updated!")
         logger.info(f"✅ Game host rotation has been updated. {result}")
 
     @host_command()
     async def host2_list(self, interaction: discord.Interaction):
         """Displays the current game host list order"""
-        hosts = self.database.get_all_hosts(host_type_id=2)
+        rotation_id = await self._resolve_rotation(interaction, GAME_ROTATION)
+        if rotation_id is None:
+            return
+        hosts = self.rotations.hosts(rotation_id)
         
         if hosts:
             embed = discord.Embed(
                 title="🎲 Current Game Host Rotation",
-                description="\n".join([f"{host['position']}. {host['username']}" for host in hosts]),
+                description="\n".join([_host_line(host) for host in hosts]),
                 color=discord.Color.green()
             )
             await interaction.response.send_message(embed=embed)
@@ -377,9 +746,17 @@ class SecondaryHostCommands(commands.Cog):
         logger.info(f"🔄 Received command: /host2_move {member.name} to {position.value}")
         
         try:
-            result = self.database.move_host(str(member.id), position.value, host_type_id=2)
+            rotation_id = await self._resolve_rotation(interaction, GAME_ROTATION)
+            if rotation_id is None:
+                return
+            result = self.database.move_host(
+                rotation_id, str(member.id), position.value,
+                expected_version=self._shown_version(rotation_id), actor_id=str(interaction.user.id)
+            )
             await interaction.response.send_message(f"✅ {result}")
             logger.info(f"✅ Successfully moved {member.name} to {position.value}")
+        except RotationConflict:
+            await self._reply_conflict(interaction, rotation_id, GAME_ROTATION)
         except sqlite3.Error as e:
             logger.error(f"Database error moving game host {member.id}: {e}")
             await interaction.response.send_message("❌ A database error occurred while moving the game host.")
@@ -393,6 +770,7 @@ async def setup(bot):
         raise RuntimeError(
             "HOSTING_ROTATION_CHANNEL_ID is not set; hosting rotation commands cannot be restricted to a channel."
         )
-    await bot.add_cog(HostingRotationCommands(bot))
-    await bot.add_cog(SecondaryHostCommands(bot))
+    primary = HostingRotationCommands(bot)
+    await bot.add_cog(primary)
+    await bot.add_cog(SecondaryHostCommands(bot, primary.rotations))
     logger.info("✅ Hosting rotation commands loaded")
\ No newline at end of file
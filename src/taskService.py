@@ -1,4 +1,5 @@
 import logging
+import time
 from discord.ext import tasks
 from pathlib import Path
 from . import webscraper
@@ -6,21 +7,60 @@ from src.database import Database
 from src.config import Config
 from . import bga_commands  # Changed from messageController to bga_commands
 
+# Longest a poll result may sit in memory before it is written to the database.
+FLUSH_MAX_DELAY = 20  # seconds
+
+
+class PollResultBuffer:
+    """Accumulates one poll cycle's game changes so they can be written together."""
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.active_players = []   # (game_id, active_player_id)
+        self.finished_ids = []
+        self.notifications = []    # (active_player_id, game_id), sent after the flush
+        self.first_queued_at = None
+
+    def __len__(self):
+        return len(self.active_players) + len(self.finished_ids)
+
+    def _mark_queued(self):
+        if self.first_queued_at is None:
+            self.first_queued_at = time.monotonic()
+
+    def queue_active_player(self, game_id, active_player_id):
+        self._mark_queued()
+        self.active_players.append((game_id, active_player_id))
+        self.notifications.append((active_player_id, game_id))
+
+    def queue_finished(self, game_id):
+        self._mark_queued()
+        self.finished_ids.append(game_id)
+
+    def is_overdue(self):
+        return (
+            self.first_queued_at is not None
+            and time.monotonic() - self.first_queued_at >= FLUSH_MAX_DELAY
+        )
+
+
 class BGATaskService:
     def __init__(self):
         self.config = Config.load()  # Load config per instance
         self.database = Database(self.config.database_path)  # Create database per instance
 
-    async def process_game(self, bot, game):
+    async def process_game(self, game, buffer: PollResultBuffer):
         logging.info(f"Fetching active player for game: {game.name} with id: {game.id}")
-        activePlayerId = await webscraper.fetchActivePlayer(game.url)
-        previousActivePlayerId = self.database.get_active_player(game.id)
+        activePlayerId, hasEnded = await webscraper.fetchTableStatus(game.url, self.config.bga_base_url)
+        previousActivePlayerId = game.activePlayerId
         logging.info(f"Active player id: {activePlayerId}")
         if activePlayerId == None:
             logging.info("No active player id found. Checking if the game has ended")
-            if await webscraper.checkIfGameEnded(game.url):
+            if hasEnded:
                 logging.info("Game results list found, removing game from monitoring")
-                self.database.delete_game_data(game.id)
+                buffer.queue_finished(game.id)
             else:
                 logging.info("Game results list not found. Keep monitoring game..")
 
@@ -31,9 +71,23 @@ class BGATaskService:
             logging.info(
                 f"New active player in game: {game.id} New player: {activePlayerId} Previous active player: {previousActivePlayerId}"
             )
-            self.database.update_active_player(game.id, activePlayerId)
+            buffer.queue_active_player(game.id, activePlayerId)
+
+    async def flush(self, bot, buffer: PollResultBuffer):
+        """Write buffered results in one transaction, then send their notifications.
+
+        Notifications are only sent once the state change they announce has been
+        committed, so a crash mid-cycle never produces a notification that gets
+        repeated (or contradicted) on the next poll.
+        """
+        if not len(buffer):
+            return
+        self.database.apply_poll_results(buffer.active_players, buffer.finished_ids)
+        notifications = buffer.notifications
+        buffer.clear()
+        for active_player_id, game_id in notifications:
             await bga_commands.notify_turn(
-                bot, activePlayerId, game.id,
+                bot, active_player_id, game_id,
                 self.database, self.config.notify_channel_id,
             )
 
@@ -41,8 +95,12 @@ class BGATaskService:
     async def process_games(self, bot):
         games = self.database.get_all_games()
         logging.info(f"Games: {games}")
+        buffer = PollResultBuffer()
         for game in games:
-            await self.process_game(bot, game)
+            await self.process_game(game, buffer)
+            if buffer.is_overdue():
+                await self.flush(bot, buffer)
+        await self.flush(bot, buffer)
 
 # Create instance when imported
 task_service = BGATaskService()
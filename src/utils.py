@@ -1,5 +1,8 @@
 import re
 import html
+from urllib.parse import parse_qs, urlsplit, urlunsplit
+
+BGA_HOST = "boardgamearena.com"
 
 
 # Function to extract the game ID from a URL
@@ -10,6 +13,50 @@ def extractGameId(url):
     return None
 
 
+# Function to reduce any BGA table URL to a single canonical form
+def canonicalizeTableUrl(url):
+    """Return the canonical https://boardgamearena.com/table?table=<id> form of a table URL.
+
+    Only the table ID is kept: the subdomain, the path (language prefix, game
+    page or table page), fragments and every other query parameter are
+    dropped, so all URLs of the same table compare equal. Returns None if
+    ``url`` is not a BGA table URL.
+    """
+    url = url.strip()
+    if "://" not in url:
+        url = "https://" + url
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    if host != BGA_HOST and not host.endswith("." + BGA_HOST):
+        return None
+
+    table_ids = parse_qs(parts.query).get("table")
+    if not table_ids or not table_ids[0].isdigit():
+        return None
+
+    return urlunsplit(("https", BGA_HOST, "/table", f"table={int(table_ids[0])}", ""))
+
+
+# Function to turn a table URL or bare table ID into a canonical table URL
+def canonicalizeTableReference(ref):
+    ref = ref.strip()
+    if ref.isdigit():
+        return canonicalizeTableUrl(f"https://{BGA_HOST}/table?table={ref}")
+    return canonicalizeTableUrl(ref)
+
+
+# Function to build the URL of a table's game page, where the game state is
+def gamePageUrl(table_id, game_code):
+    return urlunsplit(("https", BGA_HOST, f"/1/{game_code}", f"table={int(table_id)}", ""))
+
+
+# Function to point a canonical BGA URL at another server (e.g. a local stand-in)
+def rebaseUrl(url, base_url):
+    parts = urlsplit(url)
+    base = urlsplit(base_url)
+    return urlunsplit((base.scheme, base.netloc, base.path.rstrip("/") + parts.path, parts.query, ""))
+
+
 def convertHtmlEntitiesToCharacters(inputString):
     # Check if the string contains any HTML entities
     if "&" in inputString:
@@ -3,6 +3,7 @@ import re
 import json
 import aiohttp
 import asyncio
+import time
 from bs4 import BeautifulSoup
 from datetime import datetime
 from . import utils
@@ -12,6 +13,32 @@ from .services import service_manager
 TIMEOUT = aiohttp.ClientTimeout(total=10)  # 10 second timeout
 MAX_RETRIES = 3
 RETRY_DELAY = 1  # seconds between retries
+BGA_MIN_REQUEST_INTERVAL = 0.5  # seconds between BGA requests, shared by all callers
+
+
+class RateLimiter:
+    """Spaces out requests so they start at least `interval` seconds apart.
+
+    Holds no asyncio objects, so it can be created at import time, before
+    the event loop that uses it exists.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._next_slot = 0.0
+
+    async def wait(self):
+        # Reserve a slot before awaiting anything: there is no await between
+        # reading and advancing _next_slot, so concurrent callers on the loop
+        # each get their own slot without a lock, and then sleep concurrently.
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+bga_rate_limiter = RateLimiter(BGA_MIN_REQUEST_INTERVAL)
 
 async def _make_request(url):
     """Make HTTP request with retry logic using shared session."""
@@ -28,15 +55,45 @@ async def _make_request(url):
                 raise
             await asyncio.sleep(RETRY_DELAY)  # Wait before retrying
 
+async def _make_bga_request(url):
+    """Make a BGA request under the shared BGA rate limit."""
+    await bga_rate_limiter.wait()
+    return await _make_request(url)
+
+# Canonical table URLs (see utils.canonicalizeTableUrl) point at BGA's table
+# overview; the game state is only on the game page, which is addressed by the
+# game's code. Codes are looked up once per table and kept until it ends.
+_game_codes = {}  # table ID -> game code
+
+def rememberGameCode(table_id, game_code):
+    """Record a table's game code when it is already known (e.g. from a table list)."""
+    _game_codes[int(table_id)] = game_code
+
+async def _fetchGameCode(table_id, base_url):
+    r = await _make_bga_request(f"{base_url}/table/table/tableinfos.html?id={table_id}")
+    return json.loads(r)["data"]["game_name"]
+
+async def _fetchGamePage(table_url, base_url):
+    """Fetch the game page of the table a canonical table URL refers to, from ``base_url``."""
+    table_id = int(utils.extractGameId(table_url))
+    game_code = _game_codes.get(table_id)
+    if game_code is None:
+        game_code = await _fetchGameCode(table_id, base_url)
+        _game_codes[table_id] = game_code
+    return await _make_bga_request(utils.rebaseUrl(utils.gamePageUrl(table_id, game_code), base_url))
+
+ACTIVE_PLAYER_PATTERN = re.compile(r'"active_player":"(\d+)"')
+GAME_ENDED_PATTERN = re.compile(r"1°")
+
+def _parseActivePlayer(page):
+    result = ACTIVE_PLAYER_PATTERN.search(page)
+    return int(result.group(1)) if result else None
+
 async def fetchActivePlayer(url):
     """Fetch the active player ID from a BGA game URL."""
     try:
-        r = await _make_request(url)
-        pattern = re.compile(r'"active_player":"(\d+)"')
-        result = pattern.search(r)
-        if result:
-            return int(result.group(1))
-        return None
+        r = await _make_bga_request(url)
+        return _parseActivePlayer(r)
     except Exception as e:
         logging.error(f"Error fetching active player: {e}")
         return None
@@ -44,20 +101,33 @@ async def fetchActivePlayer(url):
 async def checkIfGameEnded(url):
     """Check if a BGA game has ended."""
     try:
-        r = await _make_request(url)
-        match = re.search(r"1°", r)
-        return bool(match)
+        r = await _make_bga_request(url)
+        return bool(GAME_ENDED_PATTERN.search(r))
     except Exception as e:
         logging.error(f"Error checking if game ended: {e}")
         return False
 
-async def getGameInfo(url):
-    """Get game information from a BGA game URL."""
+async def fetchTableStatus(table_url, base_url):
+    """Fetch a BGA table's game page once and return (active player ID, whether the game ended)."""
     try:
-        r = await _make_request(url)
+        r = await _fetchGamePage(table_url, base_url)
+        activePlayerId = _parseActivePlayer(r)
+        if activePlayerId is not None:
+            return activePlayerId, False
+        hasEnded = bool(GAME_ENDED_PATTERN.search(r))
+        if hasEnded:
+            _game_codes.pop(int(utils.extractGameId(table_url)), None)
+        return None, hasEnded
+    except Exception as e:
+        logging.error(f"Error fetching table status: {e}")
+        return None, False
+
+async def getGameInfo(table_url, base_url):
+    """Get the (game name, active player ID) of a canonical BGA table URL, from ``base_url``."""
+    try:
+        r = await _fetchGamePage(table_url, base_url)
         gameName = re.search(r'completesetup\([^,]+,\s*("[^"]+")', r)
-        activePlayerIdPattern = re.compile(r'"active_player":"(\d+)"')
-        resultActivePlayerId = activePlayerIdPattern.search(r)
+        resultActivePlayerId = ACTIVE_PLAYER_PATTERN.search(r)
 
         if gameName and resultActivePlayerId:
             gameTitle = gameName.group(1)
@@ -73,6 +143,23 @@ async def getGameInfo(url):
         logging.error(f"Error getting game info: {e}")
         return None
 
+async def fetchPlayerTables(player_id, base_url):
+    """Fetch the in-progress tables of a BGA player as a list of (table ID, game code)."""
+    url = f"{base_url}/tablemanager/tablemanager/tableinfos.html?playerfilter={player_id}&status=play"
+    try:
+        r = await _make_bga_request(url)
+        tables = json.loads(r).get("data", {}).get("tables", {})
+        if isinstance(tables, dict):
+            tables = tables.values()
+        return [
+            (int(table["id"]), table.get("game_name"))
+            for table in tables
+            if table.get("status", "play") == "play"
+        ]
+    except Exception as e:
+        logging.error(f"Error fetching tables for player {player_id}: {e}")
+        return None
+
 async def scrape_aftergame_event(url):
     """Scrape event information from an Aftergame event URL."""
     try: